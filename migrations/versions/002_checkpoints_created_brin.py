@@ -0,0 +1,34 @@
+"""Add BRIN index on checkpoints.created_at for retention cleanup.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 09:00:00.000000
+
+Checkpoints are append-only, so created_at follows physical row order and
+a BRIN index covers the retention range scan at a fraction of the size of
+a B-tree.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create BRIN index on checkpoints.created_at."""
+    op.create_index(
+        "idx_checkpoints_created_brin",
+        "checkpoints",
+        ["created_at"],
+        postgresql_using="brin",
+    )
+
+
+def downgrade() -> None:
+    """Drop BRIN index on checkpoints.created_at."""
+    op.drop_index("idx_checkpoints_created_brin", table_name="checkpoints")
@@ -28,7 +28,8 @@ CREATE TABLE IF NOT EXISTS checkpoints (
 
 -- Indexes for checkpoints
 CREATE INDEX IF NOT EXISTS idx_checkpoints_workflow ON checkpoints(workflow_id);
-CREATE INDEX IF NOT EXISTS idx_checkpoints_created ON checkpoints(created_at DESC);
+-- BRIN: checkpoints are append-only, so created_at tracks physical order
+CREATE INDEX IF NOT EXISTS idx_checkpoints_created_brin ON checkpoints USING BRIN (created_at);
 CREATE INDEX IF NOT EXISTS idx_checkpoints_checkpoint_id ON checkpoints(checkpoint_id);
 
 -- Comments
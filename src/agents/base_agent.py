@@ -89,6 +89,7 @@ class BaseAgent(ABC):
         """
         # Step 1: Reserve budget
         estimated_cost = self._estimate_cost()
+        await self.budget_guard.refresh_monthly_usage()
         self.budget_guard.reserve_budget(
             operation_name=f"{self.name}.execute",
             estimated_tokens=self.token_budget,
@@ -111,7 +112,7 @@ class BaseAgent(ABC):
         result = await self._parse_output(response, state)
 
         # Step 5: Record actual usage
-        self.budget_guard.record_usage(
+        await self.budget_guard.record_usage_async(
             operation_name=f"{self.name}.execute",
             tokens_used=response.tokens_used,
             cost_usd=response.cost_usd,
@@ -9,6 +9,7 @@ Tier 0 agent that:
 """
 
 import asyncio
+import json
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -157,8 +158,6 @@ Respond with JSON:
             InfiniteLoopDetectedError: If circular routing detected
             HumanApprovalTimeoutError: If escalation required
         """
-        import json
-
         # Extract JSON from response
         content = response.content.strip()
         if content.startswith("```json"):
@@ -7,6 +7,7 @@ Generates unit, integration, and e2e tests with coverage analysis.
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import re
 import time
@@ -434,8 +435,6 @@ Begin test generation now.
 
         # Try JSON coverage report
         try:
-            import json
-
             with Path("coverage.json").open() as f:
                 coverage_data = json.load(f)
                 return float(
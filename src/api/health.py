@@ -5,8 +5,14 @@ Comprehensive health and readiness checks for all system dependencies.
 Includes liveness, readiness, and service-specific health endpoints.
 """
 
+import asyncio
+import errno
 import logging
+import os
+import selectors
 import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from urllib.parse import urlparse
 
@@ -24,6 +30,129 @@ logger = logging.getLogger(__name__)
 # Create router for health endpoints
 router = APIRouter(tags=["health"])
 
+# Overall budget for one dependency probe, across all resolved addresses
+_PROBE_TIMEOUT_SECONDS = 0.5
+
+# Runs the blocking getaddrinfo so a probe can stop waiting on a stuck resolver
+_resolver = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-dns")
+
+# Last probe result per (host, port): (monotonic time probed, status)
+_probe_cache: dict[tuple[str, int], tuple[float, HealthStatus]] = {}
+
+
+def _resolve(
+    host: str, port: int, timeout: float
+) -> list[tuple[int, int, int, str, tuple]]:
+    """
+    Resolve host:port on a resolver thread, giving up after timeout.
+
+    Args:
+        host: Service host
+        port: Service port
+        timeout: Seconds to wait for the lookup
+
+    Returns:
+        getaddrinfo results for stream sockets
+
+    Raises:
+        OSError: If the lookup failed or didn't answer in time
+    """
+    lookup = _resolver.submit(socket.getaddrinfo, host, port, type=socket.SOCK_STREAM)
+    try:
+        return lookup.result(timeout=timeout)
+    except TimeoutError:
+        lookup.cancel()
+        raise TimeoutError(f"Timed out resolving {host}") from None
+
+
+def _probe_tcp(host: str, port: int, timeout: float) -> None:
+    """
+    Open a TCP connection to host:port within a single overall deadline.
+
+    The DNS lookup counts against the deadline too: it runs on a resolver
+    thread and is abandoned if it hasn't answered in time. Then connects to
+    every resolved address at once with non-blocking sockets and waits for
+    the first to complete, so a dual-stack host (e.g. IPv6 then IPv4 for
+    localhost) can't spend the timeout once per address as
+    socket.create_connection would.
+
+    Args:
+        host: Service host
+        port: Service port
+        timeout: Seconds to wait for any address to accept
+
+    Raises:
+        OSError: If the lookup failed or no address accepted the connection
+            in time
+    """
+    deadline = time.monotonic() + timeout
+    addresses = _resolve(host, port, timeout)
+    error: OSError = TimeoutError(f"Timed out connecting to {host}:{port}")
+    sockets: list[socket.socket] = []
+    try:
+        with selectors.DefaultSelector() as selector:
+            for family, sock_type, proto, _, address in addresses:
+                try:
+                    sock = socket.socket(family, sock_type, proto)
+                except OSError as e:
+                    error = e
+                    continue
+                sockets.append(sock)
+                sock.setblocking(False)
+                code = sock.connect_ex(address)
+                if code == 0:
+                    return
+                if code not in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    error = OSError(code, os.strerror(code))
+                    continue
+                selector.register(sock, selectors.EVENT_WRITE, data=sock)
+
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    code = key.data.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    if code == 0:
+                        return
+                    error = OSError(code, os.strerror(code))
+                    selector.unregister(key.data)
+    finally:
+        for sock in sockets:
+            sock.close()
+    raise error
+
+
+def _probe(host: str, port: int) -> HealthStatus:
+    """
+    Check that a TCP endpoint accepts connections.
+
+    A result younger than settings.health_probe_ttl_seconds is reused, so
+    frequent pollers cost at most one connect per TTL.
+
+    Args:
+        host: Service host
+        port: Service port
+
+    Returns:
+        HEALTHY if the connection succeeds, otherwise UNHEALTHY
+    """
+    key = (host, port)
+    ttl = settings.health_probe_ttl_seconds
+    cached = _probe_cache.get(key)
+    if ttl > 0 and cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    try:
+        _probe_tcp(host, port, _PROBE_TIMEOUT_SECONDS)
+        status = HealthStatus.HEALTHY
+    except OSError:
+        status = HealthStatus.UNHEALTHY
+
+    # Stamped after the probe so a slow connect doesn't pre-age the entry
+    _probe_cache[key] = (time.monotonic(), status)
+    return status
+
 
 def check_postgres_health() -> HealthStatus:
     """
@@ -35,14 +164,7 @@ def check_postgres_health() -> HealthStatus:
     if settings.environment == "test":
         return HealthStatus.HEALTHY
 
-    try:
-        with socket.create_connection(
-            (settings.postgres_host, settings.postgres_port),
-            timeout=0.5,
-        ):
-            return HealthStatus.HEALTHY
-    except OSError:
-        return HealthStatus.UNHEALTHY
+    return _probe(settings.postgres_host, settings.postgres_port)
 
 
 def check_redis_health() -> HealthStatus:
@@ -55,14 +177,7 @@ def check_redis_health() -> HealthStatus:
     if settings.environment == "test":
         return HealthStatus.HEALTHY
 
-    try:
-        with socket.create_connection(
-            (settings.redis_host, settings.redis_port),
-            timeout=0.5,
-        ):
-            return HealthStatus.HEALTHY
-    except OSError:
-        return HealthStatus.UNHEALTHY
+    return _probe(settings.redis_host, settings.redis_port)
 
 
 def check_minio_health() -> HealthStatus:
@@ -88,11 +203,7 @@ def check_minio_health() -> HealthStatus:
     if port is None:
         port = 443 if settings.minio_secure else 80
 
-    try:
-        with socket.create_connection((host, port), timeout=0.5):
-            return HealthStatus.HEALTHY
-    except OSError:
-        return HealthStatus.UNHEALTHY
+    return _probe(host, port)
 
 
 @router.get("/health", response_model=HealthCheckResponse)
@@ -135,10 +246,13 @@ async def readiness_check() -> ReadinessCheckResponse:
 
     logger.info("Performing readiness check")
 
-    # Check all dependencies
-    postgres_status = check_postgres_health()
-    redis_status = check_redis_health()
-    minio_status = check_minio_health()
+    # Probe all dependencies concurrently, off the event loop, so the
+    # check takes as long as the slowest probe rather than their sum
+    postgres_status, redis_status, minio_status = await asyncio.gather(
+        asyncio.to_thread(check_postgres_health),
+        asyncio.to_thread(check_redis_health),
+        asyncio.to_thread(check_minio_health),
+    )
 
     dependencies = {
         "postgres": postgres_status,
@@ -192,7 +306,7 @@ async def postgres_health_check() -> HealthCheckResponse:
 
     logger.debug("Performing PostgreSQL health check")
 
-    postgres_status = check_postgres_health()
+    postgres_status = await asyncio.to_thread(check_postgres_health)
 
     response = HealthCheckResponse(
         status=postgres_status,
@@ -222,7 +336,7 @@ async def redis_health_check() -> HealthCheckResponse:
 
     logger.debug("Performing Redis health check")
 
-    redis_status = check_redis_health()
+    redis_status = await asyncio.to_thread(check_redis_health)
 
     response = HealthCheckResponse(
         status=redis_status,
@@ -252,7 +366,7 @@ async def minio_health_check() -> HealthCheckResponse:
 
     logger.debug("Performing MinIO health check")
 
-    minio_status = check_minio_health()
+    minio_status = await asyncio.to_thread(check_minio_health)
 
     response = HealthCheckResponse(
         status=minio_status,
@@ -101,6 +101,23 @@ class Settings(BaseSettings):
     postgres_db: str = Field(default="agent_ecosystem", description="Database name")
     postgres_user: str = Field(default="agent_user", description="Database user")
     postgres_password: str = Field(..., description="Database password", min_length=8)
+    postgres_pool_min_size: int = Field(
+        default=5, description="Connections the PostgreSQL pool keeps open", ge=0
+    )
+    postgres_pool_max_size: int = Field(
+        default=20, description="Maximum connections in the PostgreSQL pool", ge=1
+    )
+    postgres_replica_url: str | None = Field(
+        default=None,
+        description="Read replica URL for checkpoint reads (default: primary)",
+    )
+    postgres_socket_dir: str | None = Field(
+        default=None,
+        description=(
+            "Unix socket directory for a same-host PostgreSQL "
+            "(e.g. /var/run/postgresql); single-node deployments only"
+        ),
+    )
 
     @property
     def postgres_url(self) -> str:
@@ -114,6 +131,9 @@ class Settings(BaseSettings):
     redis_host: str = Field(default="localhost", description="Redis host")
     redis_port: int = Field(default=6379, description="Redis port")
     redis_db: int = Field(default=0, description="Redis database number")
+    redis_max_connections: int = Field(
+        default=64, description="Maximum connections in the Redis pool", ge=1
+    )
 
     @property
     def redis_url(self) -> str:
@@ -128,6 +148,25 @@ class Settings(BaseSettings):
         default="agent-artifacts", description="MinIO bucket name"
     )
     minio_secure: bool = Field(default=False, description="Use HTTPS for MinIO")
+    minio_region: str = Field(default="us-east-1", description="MinIO region")
+    minio_part_size_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Multipart part size; larger artifacts upload in parallel parts",
+        ge=5 * 1024 * 1024,
+    )
+    minio_max_connections: int = Field(
+        default=32,
+        description="Keep-alive connections per host shared by all MinIO clients",
+        ge=1,
+    )
+    minio_io_workers: int = Field(
+        default=16, description="Threads dedicated to blocking MinIO calls", ge=1
+    )
+    artifact_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="In-memory cache for downloaded artifacts (0 disables)",
+        ge=0,
+    )
 
     # Budget Limits
     max_tokens_per_workflow: int = Field(
@@ -193,6 +232,11 @@ class Settings(BaseSettings):
         default=True, description="Enable Prometheus metrics"
     )
     prometheus_port: int = Field(default=9090, description="Prometheus metrics port")
+    health_probe_ttl_seconds: float = Field(
+        default=2.0,
+        description="Reuse dependency probe results this long (0 disables)",
+        ge=0,
+    )
 
     # Retention Settings
     checkpoint_retention_days: int = Field(
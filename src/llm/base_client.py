@@ -5,6 +5,7 @@ Implements retry logic with exponential backoff and standardized error handling.
 """
 
 import asyncio
+import json
 from abc import ABC, abstractmethod
 
 import structlog
@@ -118,8 +119,6 @@ class BaseLLMClient(ABC):
         """
         # Default implementation: generate text and parse
         # Providers can override for native structured output support
-        import json
-
         structured_prompt = (
             f"{prompt}\n\n"
             f"Respond with valid JSON matching this schema:\n"
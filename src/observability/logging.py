@@ -7,10 +7,13 @@ Provides consistent logging across all agents and services.
 
 from __future__ import annotations
 
+import contextvars
 import logging
 import sys
+from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 import structlog
 from structlog.typing import EventDict, Processor
 
@@ -18,6 +21,39 @@ from src import __version__
 from src.config import settings
 
 
+__all__ = [
+    "add_app_context",
+    "add_timestamp",
+    "bind_agent_context",
+    "bind_task_context",
+    "bind_workflow_context",
+    "configure_logging",
+    "get_logger",
+    "log_agent_execution",
+    "log_budget_status",
+    "log_checkpoint_saved",
+    "log_error",
+    "log_llm_call",
+    "merge_contextvars_cached",
+]
+
+
+# Resolved once instead of getattr(logging, ...) on every configure call
+_LEVEL_MAP: dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Merged view of the bound structlog contextvars for the current context.
+# Rebuilt lazily on the next log call after any bind_* helper resets it.
+_context_snapshot: contextvars.ContextVar[dict[str, Any] | None] = (
+    contextvars.ContextVar("log_context_snapshot", default=None)
+)
+
+
 def add_app_context(
     _logger: logging.Logger, _method_name: str, event_dict: EventDict
 ) -> EventDict:
@@ -38,12 +74,87 @@ def add_app_context(
     return event_dict
 
 
+def merge_contextvars_cached(
+    _logger: logging.Logger, _method_name: str, event_dict: EventDict
+) -> EventDict:
+    """
+    Merge bound context into the event, reusing the last merged snapshot.
+
+    Drop-in replacement for ``structlog.contextvars.merge_contextvars`` that
+    only walks the contextvars once per bind instead of once per log event.
+    Context must be bound through the ``bind_*`` helpers in this module so
+    the snapshot is invalidated.
+
+    Args:
+        _logger: Logger instance (unused, required by structlog)
+        _method_name: Method name being called (unused, required by structlog)
+        event_dict: Event dictionary to enrich
+
+    Returns:
+        Event dictionary with bound context merged in
+    """
+    snapshot = _context_snapshot.get()
+    if snapshot is None:
+        snapshot = structlog.contextvars.get_contextvars()
+        _context_snapshot.set(snapshot)
+    for key, value in snapshot.items():
+        event_dict.setdefault(key, value)
+    return event_dict
+
+
+def add_timestamp(
+    _logger: logging.Logger, _method_name: str, event_dict: EventDict
+) -> EventDict:
+    """
+    Add a raw UTC datetime to the event; orjson formats it during rendering.
+
+    Args:
+        _logger: Logger instance (unused, required by structlog)
+        _method_name: Method name being called (unused, required by structlog)
+        event_dict: Event dictionary to enrich
+
+    Returns:
+        Event dictionary with ``timestamp`` set
+    """
+    event_dict["timestamp"] = datetime.now(UTC)
+    return event_dict
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson (RFC 3339 timestamps, ``Z`` suffix)."""
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_UTC_Z
+    ).decode()
+
+
+def _fuse_processors(processors: list[Processor]) -> Processor:
+    """
+    Fuse a processor chain into a single callable.
+
+    structlog walks its processor list with a generic loop on every log call.
+    The chain is fixed once configured, so we generate one function that
+    invokes each stage in sequence with no per-event loop overhead.
+
+    Args:
+        processors: Ordered processor chain (renderer last)
+
+    Returns:
+        Single processor equivalent to running the chain in order
+    """
+    namespace: dict[str, Any] = {f"p{i}": p for i, p in enumerate(processors)}
+    body = "".join(f"    e = p{i}(l, m, e)\n" for i in range(len(processors)))
+    source = f"def _fused(l, m, e):\n{body}    return e\n"
+    code = compile(source, "<fused-processors>", "exec")
+    exec(code, namespace)  # noqa: S102  # nosec B102
+    return namespace["_fused"]  # type: ignore[no-any-return]
+
+
 def configure_logging() -> None:
     """
     Configure structlog for the application.
 
     Sets up structured logging with:
-    - JSON output in production
+    - JSON output in production (orjson, native datetime serialization)
     - Human-readable console output in development
     - Trace ID and workflow ID propagation
     - Log level filtering based on environment
@@ -55,7 +166,7 @@ def configure_logging() -> None:
         >>> logger.info("application.started", port=8000)
     """
     # Determine log level
-    log_level = getattr(logging, settings.log_level)
+    log_level = _LEVEL_MAP[settings.log_level]
 
     # Configure standard library logging
     logging.basicConfig(
@@ -66,33 +177,35 @@ def configure_logging() -> None:
 
     # Shared processors for all environments
     shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
+        merge_contextvars_cached,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         add_app_context,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
     ]
 
     # Environment-specific processors
     if settings.environment == "production":
-        # Production: JSON output for log aggregation
-        processors = [
+        # Production: JSON output for log aggregation. StackInfoRenderer is
+        # left out here since it is a no-op unless stack_info=True is passed.
+        processors: list[Processor] = [
             *shared_processors,
+            add_timestamp,
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ]
     else:
         # Development: Human-readable console output
         processors = [
             *shared_processors,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.dev.ConsoleRenderer(colors=True),
         ]
 
-    # Configure structlog
+    # Configure structlog with the chain fused into a single stage
     structlog.configure(
-        processors=processors,  # type: ignore[arg-type]
+        processors=[_fuse_processors(processors)],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -136,6 +249,7 @@ def bind_workflow_context(workflow_id: str, trace_id: str) -> None:
         workflow_id=workflow_id,
         trace_id=trace_id,
     )
+    _context_snapshot.set(None)
 
 
 def bind_agent_context(agent_name: str, tier: int) -> None:
@@ -155,6 +269,7 @@ def bind_agent_context(agent_name: str, tier: int) -> None:
         agent_name=agent_name,
         tier=tier,
     )
+    _context_snapshot.set(None)
 
 
 def bind_task_context(task_id: str, task_name: str, file: str) -> None:
@@ -176,6 +291,7 @@ def bind_task_context(task_id: str, task_name: str, file: str) -> None:
         task_name=task_name,
         file=file,
     )
+    _context_snapshot.set(None)
 
 
 def log_llm_call(
@@ -214,14 +330,12 @@ def log_llm_call(
     """
     logger.info(
         "llm.call_completed",
-        llm={
-            "provider": provider,
-            "model": model,
-            "tokens_input": tokens_input,
-            "tokens_output": tokens_output,
-            "cost_usd": cost_usd,
-            "latency_ms": latency_ms,
-        },
+        llm_provider=provider,
+        llm_model=model,
+        llm_tokens_input=tokens_input,
+        llm_tokens_output=tokens_output,
+        llm_cost_usd=cost_usd,
+        llm_latency_ms=latency_ms,
     )
 
 
@@ -252,11 +366,9 @@ def log_budget_status(
     """
     logger.info(
         "budget.status",
-        budget={
-            "remaining_tokens": remaining_tokens,
-            "remaining_budget_usd": remaining_budget_usd,
-            "budget_percent_used": budget_percent_used,
-        },
+        budget_remaining_tokens=remaining_tokens,
+        budget_remaining_usd=remaining_budget_usd,
+        budget_percent_used=budget_percent_used,
     )
 
 
@@ -291,19 +403,19 @@ def log_error(
         ...     context={"coverage": 68, "threshold": 70}
         ... )
     """
-    error_dict: dict[str, Any] = {
-        "type": error_type,
-        "message": message,
+    error_fields: dict[str, Any] = {
+        "error_type": error_type,
+        "error_message": message,
     }
 
     if file:
-        error_dict["file"] = file
+        error_fields["error_file"] = file
     if line:
-        error_dict["line"] = line
+        error_fields["error_line"] = line
 
     logger.error(
         "error.occurred",
-        error=error_dict,
+        **error_fields,
         context=context or {},
     )
 
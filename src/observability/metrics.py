@@ -10,6 +10,74 @@ from __future__ import annotations
 from prometheus_client import Counter, Gauge, Histogram
 
 
+__all__ = [
+    "BUCKETS_AGENT",
+    "BUCKETS_APPROVAL",
+    "BUCKETS_DB",
+    "BUCKETS_IO_MED",
+    "BUCKETS_IO_SHORT",
+    "BUCKETS_LLM",
+    "BUCKETS_REDIS",
+    "BUCKETS_WORKFLOW",
+    "agent_execution_duration",
+    "agent_rejections_total",
+    "artifacts_stored_bytes_total",
+    "budget_percent_used",
+    "budget_remaining_tokens",
+    "cache_hits_total",
+    "cache_misses_total",
+    "checkpoint_save_duration",
+    "checkpoints_created_total",
+    "db_connections_active",
+    "db_connections_idle",
+    "db_query_duration_seconds",
+    "deviation_handler_iterations_total",
+    "deviation_handler_max_iterations_reached_total",
+    "http_errors_total",
+    "http_request_duration_seconds",
+    "http_requests_total",
+    "human_approval_wait_time_seconds",
+    "human_approvals_granted_total",
+    "human_approvals_rejected_total",
+    "human_approvals_requested_total",
+    "llm_api_calls_total",
+    "llm_api_errors_total",
+    "llm_api_latency_seconds",
+    "llm_cost_usd_total",
+    "llm_fallback_triggered_total",
+    "llm_tokens_consumed_total",
+    "minio_download_duration_seconds",
+    "minio_upload_duration_seconds",
+    "quality_engineer_coverage_percent",
+    "quality_engineer_tests_generated_total",
+    "rate_limit_current_usage",
+    "rate_limit_exceeded_total",
+    "redis_operation_duration_seconds",
+    "security_validator_vulnerabilities_found_total",
+    "software_engineer_files_generated_total",
+    "software_engineer_lines_of_code_total",
+    "static_analysis_issues_found_total",
+    "workflow_duration_seconds",
+    "workflow_rejection_count",
+    "workflows_completed_total",
+    "workflows_started_total",
+    "workflows_within_budget_total",
+]
+
+
+# ============================================================================
+# Histogram Buckets (shared, immutable)
+# ============================================================================
+
+BUCKETS_IO_SHORT = (0.1, 0.5, 1.0, 2.0, 5.0)
+BUCKETS_IO_MED = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0)
+BUCKETS_AGENT = (1, 5, 10, 30, 60, 300, 600)  # 1s to 10min
+BUCKETS_LLM = (1, 5, 10, 30, 60, 120, 300)  # 1s to 5min
+BUCKETS_WORKFLOW = (60, 300, 900, 1800, 3600, 7200, 14400)  # 1min to 4hrs
+BUCKETS_APPROVAL = (60, 300, 900, 1800, 3600, 7200)  # 1min to 2hrs
+BUCKETS_DB = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+BUCKETS_REDIS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
 # ============================================================================
 # RED Metrics (Request-focused)
 # ============================================================================
@@ -30,7 +98,7 @@ http_request_duration_seconds = Histogram(
     "http_request_duration_seconds",
     "HTTP request duration in seconds",
     ["method", "endpoint"],
-    buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0],
+    buckets=BUCKETS_IO_MED,
 )
 
 # ============================================================================
@@ -41,14 +109,14 @@ workflow_duration_seconds = Histogram(
     "workflow_duration_seconds",
     "Workflow execution time in seconds",
     ["workflow_id", "status"],
-    buckets=[60, 300, 900, 1800, 3600, 7200, 14400],  # 1min to 4hrs
+    buckets=BUCKETS_WORKFLOW,
 )
 
 agent_execution_duration = Histogram(
     "agent_execution_duration_seconds",
     "Agent execution time in seconds",
     ["agent_name", "tier", "status"],
-    buckets=[1, 5, 10, 30, 60, 300, 600],  # 1s to 10min
+    buckets=BUCKETS_AGENT,
 )
 
 agent_rejections_total = Counter(
@@ -76,7 +144,7 @@ checkpoints_created_total = Counter(
 checkpoint_save_duration = Histogram(
     "checkpoint_save_duration_seconds",
     "Checkpoint save latency",
-    buckets=[0.1, 0.5, 1.0, 2.0, 5.0],
+    buckets=BUCKETS_IO_SHORT,
 )
 
 # ============================================================================
@@ -117,11 +185,17 @@ db_connections_active = Gauge(
     ["database"],
 )
 
+db_connections_idle = Gauge(
+    "db_connections_idle",
+    "Idle database connections held open by the pool",
+    ["database"],
+)
+
 db_query_duration_seconds = Histogram(
     "db_query_duration_seconds",
     "Database query duration",
     ["operation"],  # select, insert, update
-    buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0],
+    buckets=BUCKETS_DB,
 )
 
 cache_hits_total = Counter(
@@ -188,7 +262,7 @@ human_approval_wait_time_seconds = Histogram(
     "human_approval_wait_time_seconds",
     "Time waiting for human approval",
     ["tier", "gate_type"],
-    buckets=[60, 300, 900, 1800, 3600, 7200],  # 1min to 2hrs
+    buckets=BUCKETS_APPROVAL,
 )
 
 # ============================================================================
@@ -260,7 +334,7 @@ llm_api_latency_seconds = Histogram(
     "llm_api_latency_seconds",
     "LLM API call latency",
     ["provider", "model"],
-    buckets=[1, 5, 10, 30, 60, 120, 300],  # 1s to 5min
+    buckets=BUCKETS_LLM,
 )
 
 llm_api_errors_total = Counter(
@@ -283,21 +357,21 @@ minio_upload_duration_seconds = Histogram(
     "minio_upload_duration_seconds",
     "MinIO upload duration",
     ["artifact_type"],
-    buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0],
+    buckets=BUCKETS_IO_MED,
 )
 
 minio_download_duration_seconds = Histogram(
     "minio_download_duration_seconds",
     "MinIO download duration",
     ["artifact_type"],
-    buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0],
+    buckets=BUCKETS_IO_MED,
 )
 
 redis_operation_duration_seconds = Histogram(
     "redis_operation_duration_seconds",
     "Redis operation duration",
     ["operation"],  # get, set, delete, incr
-    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5],
+    buckets=BUCKETS_REDIS,
 )
 
 # ============================================================================
@@ -5,18 +5,60 @@ Enforces token and cost budgets across workflows.
 Implements 75% warning threshold and 100% hard limit blocking.
 """
 
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 import structlog
 
 from src.config import settings
-from src.exceptions import BudgetExhaustedError
+from src.exceptions import BudgetExhaustedError, CacheError
 from src.orchestration.state import WorkflowState
 from src.storage.cache import RedisCache
 
 
 logger = structlog.get_logger()
 
+# How long a monthly usage total read from Redis is reused before re-fetching
+_MONTHLY_USAGE_TTL_SECONDS = 1.0
+
+# How long check_budget() reuses a workflow's usage read from Redis, and how
+# many workflows that local cache holds before evicting the least recent
+_WORKFLOW_USAGE_TTL_SECONDS = 0.25
+_WORKFLOW_USAGE_CACHE_SIZE = 1024
+
+# Atomically check and apply a workflow budget reservation.
+# KEYS[1] = budget hash (fields: tokens_used, cost_used, last_operation,
+#           last_updated)
+# KEYS[2] = monthly cost total (budget:month:YYYY-MM); read only, it is
+#           incremented when actual usage is recorded
+# Both keys are touched by one script, which assumes the single Redis node
+# this deployment configures (on Redis Cluster they would need a hash tag).
+# ARGV = tokens, cost, max_tokens, max_usd, operation, timestamp, ttl_seconds
+# Returns {allowed (1/0), tokens_used, cost_used, month_used}; workflow totals
+# are post-reservation when allowed and pre-reservation when rejected
+# (strings keep float precision).
+_RESERVE_BUDGET_SCRIPT = """
+local current = redis.call('HMGET', KEYS[1], 'tokens_used', 'cost_used')
+local tokens_used = tonumber(current[1]) or 0
+local cost_used = tonumber(current[2]) or 0
+local month_used = tonumber(redis.call('GET', KEYS[2])) or 0
+local cost = tonumber(ARGV[2])
+local max_usd = tonumber(ARGV[4])
+if tokens_used + tonumber(ARGV[1]) > tonumber(ARGV[3])
+    or cost_used + cost > max_usd
+    or month_used + cost > max_usd then
+    return {0, tostring(tokens_used), tostring(cost_used), tostring(month_used)}
+end
+local new_tokens = redis.call('HINCRBY', KEYS[1], 'tokens_used', ARGV[1])
+local new_cost = redis.call('HINCRBYFLOAT', KEYS[1], 'cost_used', ARGV[2])
+redis.call('HSET', KEYS[1], 'last_operation', ARGV[5], 'last_updated', ARGV[6])
+redis.call('EXPIRE', KEYS[1], ARGV[7])
+return {1, tostring(new_tokens), new_cost, tostring(month_used)}
+"""
+
 
 class BudgetGuard:
     """
@@ -69,9 +111,27 @@ class BudgetGuard:
         self.cache = cache or RedisCache()
         self._cache_connected = False
 
-        # TODO (future): Load actual monthly usage from database
-        # For now, track in-memory (resets on restart)
+        # Alert thresholds as absolute amounts so the hot path in
+        # reserve_budget() compares totals instead of computing percentages
+        self._token_alert_abs = (
+            self.max_tokens_per_workflow * self.alert_threshold_pct / 100
+        )
+        self._usd_alert_abs = (
+            self.max_monthly_budget_usd * self.alert_threshold_pct / 100
+        )
+
+        # Multipliers turning used amounts into percentages of the limits
+        self._token_pct_scale = 100.0 / self.max_tokens_per_workflow
+        self._usd_pct_scale = 100.0 / self.max_monthly_budget_usd
+
+        # Last known monthly total. The shared total lives in Redis
+        # (budget:month:YYYY-MM); this mirror serves the synchronous
+        # reserve_budget() and is the fallback when Redis is unavailable.
         self.current_month_used_usd = 0.0
+        self._monthly_usage_fetched_at: float | None = None
+
+        # workflow_id -> (fetched_at, tokens_used, cost_used)
+        self._workflow_usage: OrderedDict[str, tuple[float, int, float]] = OrderedDict()
 
     def reserve_budget(
         self,
@@ -102,39 +162,46 @@ class BudgetGuard:
         Raises:
             BudgetExhaustedError: If hard limit reached (100%)
         """
-        log = logger.bind(
-            workflow_id=workflow_state["workflow_id"],
-            operation=operation_name,
-            estimated_tokens=estimated_tokens,
-            estimated_cost_usd=estimated_cost_usd,
-        )
+        # Read the state once; the checks below only use these locals
+        used_tokens = workflow_state["budget_used_tokens"]
+        used_usd = workflow_state["budget_used_usd"]
+        remaining_tokens = workflow_state["budget_remaining_tokens"]
+        remaining_usd = workflow_state["budget_remaining_usd"]
+
+        # Plain kwargs instead of logger.bind(): no BoundLogger per call
+        log_ctx = {
+            "workflow_id": workflow_state["workflow_id"],
+            "operation": operation_name,
+            "estimated_tokens": estimated_tokens,
+            "estimated_cost_usd": estimated_cost_usd,
+        }
 
         # Check workflow-level token budget
-        remaining_tokens = workflow_state["budget_remaining_tokens"]
         if estimated_tokens > remaining_tokens:
-            log.error(
+            logger.error(
                 "workflow_token_budget_exceeded",
-                used=workflow_state["budget_used_tokens"],
+                **log_ctx,
+                used=used_tokens,
                 remaining=remaining_tokens,
                 limit=self.max_tokens_per_workflow,
             )
             raise BudgetExhaustedError(
-                used=workflow_state["budget_used_tokens"],
+                used=used_tokens,
                 limit=self.max_tokens_per_workflow,
                 budget_type="tokens",
             )
 
         # Check workflow-level cost budget
-        remaining_usd = workflow_state["budget_remaining_usd"]
         if estimated_cost_usd > remaining_usd:
-            log.error(
+            logger.error(
                 "workflow_cost_budget_exceeded",
-                used=workflow_state["budget_used_usd"],
+                **log_ctx,
+                used=used_usd,
                 remaining=remaining_usd,
                 limit=self.max_monthly_budget_usd,
             )
             raise BudgetExhaustedError(
-                used=workflow_state["budget_used_usd"],
+                used=used_usd,
                 limit=self.max_monthly_budget_usd,
                 budget_type="USD",
             )
@@ -142,8 +209,9 @@ class BudgetGuard:
         # Check monthly cost budget
         projected_monthly_total = self.current_month_used_usd + estimated_cost_usd
         if projected_monthly_total > self.max_monthly_budget_usd:
-            log.error(
+            logger.error(
                 "monthly_budget_exceeded",
+                **log_ctx,
                 current_month_used=self.current_month_used_usd,
                 estimated_cost=estimated_cost_usd,
                 limit=self.max_monthly_budget_usd,
@@ -154,50 +222,47 @@ class BudgetGuard:
                 budget_type="monthly USD",
             )
 
-        # Calculate usage percentages
-        token_usage_pct = (
-            (workflow_state["budget_used_tokens"] + estimated_tokens)
-            / self.max_tokens_per_workflow
-            * 100
-        )
-        cost_usage_pct = (
-            (workflow_state["budget_used_usd"] + estimated_cost_usd)
-            / self.max_monthly_budget_usd
-            * 100
-        )
+        # Check if at warning threshold; percentages are only computed
+        # for the alert message once a threshold is crossed
+        projected_tokens = used_tokens + estimated_tokens
+        projected_usd = used_usd + estimated_cost_usd
 
-        # Check if at warning threshold
         alert_message = None
-        if token_usage_pct >= self.alert_threshold_pct:
+        if projected_tokens >= self._token_alert_abs:
+            token_usage_pct = projected_tokens * self._token_pct_scale
             alert_message = (
                 f"Token budget at {token_usage_pct:.1f}% "
-                f"({workflow_state['budget_used_tokens']:,} / "
+                f"({used_tokens:,} / "
                 f"{self.max_tokens_per_workflow:,})"
             )
-            log.warning(
+            logger.warning(
                 "budget_threshold_warning",
+                **log_ctx,
                 budget_type="tokens",
                 usage_pct=token_usage_pct,
                 threshold_pct=self.alert_threshold_pct,
             )
-        elif cost_usage_pct >= self.alert_threshold_pct:
+        elif projected_usd >= self._usd_alert_abs:
+            cost_usage_pct = projected_usd * self._usd_pct_scale
             alert_message = (
                 f"Cost budget at {cost_usage_pct:.1f}% "
-                f"(${workflow_state['budget_used_usd']:.2f} / "
+                f"(${used_usd:.2f} / "
                 f"${self.max_monthly_budget_usd:.2f})"
             )
-            log.warning(
+            logger.warning(
                 "budget_threshold_warning",
+                **log_ctx,
                 budget_type="cost",
                 usage_pct=cost_usage_pct,
                 threshold_pct=self.alert_threshold_pct,
             )
 
         # Budget reservation successful
-        log.info(
+        logger.info(
             "budget_reserved",
-            token_usage_pct=token_usage_pct,
-            cost_usage_pct=cost_usage_pct,
+            **log_ctx,
+            projected_tokens=projected_tokens,
+            projected_cost_usd=projected_usd,
         )
 
         return {
@@ -262,31 +327,28 @@ class BudgetGuard:
                     "Either workflow_state or workflow_id must be provided"
                 )
 
-            await self._ensure_cache_connected()
-
-            # Get current budget from Redis
-            budget_key = f"budget:workflow:{workflow_id}"
-            budget_data = await self.cache.get(budget_key)
-
-            if budget_data:
-                import json
-
-                budget = json.loads(budget_data)
-                tokens_used = budget.get("tokens_used", 0)
-                cost_used = budget.get("cost_used", 0.0)
+            cached = self._cached_workflow_usage(workflow_id)
+            if cached is not None:
+                tokens_used, cost_used = cached
             else:
-                tokens_used = 0
-                cost_used = 0.0
+                await self._ensure_cache_connected()
+
+                # Get current budget from Redis
+                budget_key = f"budget:workflow:{workflow_id}"
+                budget = await self.cache.hgetall(budget_key)
+                tokens_used = int(budget.get("tokens_used", 0))
+                cost_used = float(budget.get("cost_used", 0.0))
+                self._remember_workflow_usage(workflow_id, tokens_used, cost_used)
 
             tokens = estimated_tokens or 0
             cost = cost_param
 
-        log = logger.bind(
-            workflow_id=workflow_id,
-            operation=operation_name or "check_budget",
-            estimated_tokens=tokens,
-            estimated_cost_usd=cost,
-        )
+        log_ctx = {
+            "workflow_id": workflow_id,
+            "operation": operation_name or "check_budget",
+            "estimated_tokens": tokens,
+            "estimated_cost_usd": cost,
+        }
 
         # Calculate remaining
         remaining_tokens = self.max_tokens_per_workflow - tokens_used
@@ -294,8 +356,9 @@ class BudgetGuard:
 
         # Check token budget
         if tokens > remaining_tokens:
-            log.error(
+            logger.error(
                 "workflow_token_budget_exceeded",
+                **log_ctx,
                 used=tokens_used,
                 remaining=remaining_tokens,
                 limit=self.max_tokens_per_workflow,
@@ -308,8 +371,9 @@ class BudgetGuard:
 
         # Check cost budget
         if cost > remaining_cost:
-            log.error(
+            logger.error(
                 "workflow_cost_budget_exceeded",
+                **log_ctx,
                 used=cost_used,
                 remaining=remaining_cost,
                 limit=self.max_monthly_budget_usd,
@@ -320,8 +384,9 @@ class BudgetGuard:
                 budget_type="USD",
             )
 
-        log.info(
+        logger.info(
             "budget_check_passed",
+            **log_ctx,
             remaining_tokens=remaining_tokens,
             remaining_cost=remaining_cost,
         )
@@ -344,7 +409,8 @@ class BudgetGuard:
         Reserve budget and persist to Redis (async version).
 
         This method both checks and reserves budget in a single operation.
-        The reservation is stored in Redis for distributed tracking.
+        The reservation is applied by a Lua script so the check and the
+        increment are atomic across concurrent callers.
 
         Args:
             operation_name: Name of operation
@@ -360,41 +426,59 @@ class BudgetGuard:
         """
         await self._ensure_cache_connected()
 
-        # Check budget first
-        check_result = await self.check_budget(
-            workflow_state=None,
-            operation_name=operation_name,
-            estimated_tokens=estimated_tokens,
-            estimated_cost_usd=estimated_cost_usd,
-        )
-
-        # Reserve budget in Redis
+        # Check-and-reserve atomically in Redis (single round trip, no lost
+        # updates when reservations for the same workflow run concurrently).
+        # The script enforces the same caps as check_budget plus the shared
+        # monthly total, so no separate pre-read is needed.
         budget_key = f"budget:workflow:{workflow_id}"
-        budget_data = await self.cache.get(budget_key)
-
-        if budget_data:
-            import json
-
-            budget = json.loads(budget_data)
-            tokens_used = budget.get("tokens_used", 0)
-            cost_used = budget.get("cost_used", 0.0)
-        else:
-            tokens_used = 0
-            cost_used = 0.0
-
-        # Update budget
-        new_budget = {
-            "tokens_used": tokens_used + estimated_tokens,
-            "cost_used": cost_used + estimated_cost_usd,
-            "last_operation": operation_name,
-            "last_updated": str(logger.get_logger().bind().new().current_timestamp),
-        }
-
-        import json
-
-        await self.cache.set(
-            budget_key, json.dumps(new_budget), ttl_seconds=86400
-        )  # 24h TTL
+        month_key = _monthly_usage_key(datetime.now(UTC))
+        allowed, tokens_total, cost_total, month_total = await self.cache.run_script(
+            _RESERVE_BUDGET_SCRIPT,
+            keys=[budget_key, month_key],
+            args=[
+                estimated_tokens,
+                estimated_cost_usd,
+                self.max_tokens_per_workflow,
+                self.max_monthly_budget_usd,
+                operation_name,
+                datetime.now(UTC).isoformat(),
+                86400,  # 24h TTL
+            ],
+        )
+        tokens_total = int(float(tokens_total))
+        cost_total = float(cost_total)
+        self._remember_workflow_usage(workflow_id, tokens_total, cost_total)
+        self.current_month_used_usd = float(month_total)
+        self._monthly_usage_fetched_at = time.monotonic()
+
+        if not int(allowed):
+            if tokens_total + estimated_tokens > self.max_tokens_per_workflow:
+                error = BudgetExhaustedError(
+                    used=tokens_total,
+                    limit=self.max_tokens_per_workflow,
+                    budget_type="tokens",
+                )
+            elif cost_total + estimated_cost_usd > self.max_monthly_budget_usd:
+                error = BudgetExhaustedError(
+                    used=cost_total,
+                    limit=self.max_monthly_budget_usd,
+                    budget_type="USD",
+                )
+            else:
+                error = BudgetExhaustedError(
+                    used=self.current_month_used_usd,
+                    limit=self.max_monthly_budget_usd,
+                    budget_type="monthly USD",
+                )
+            logger.error(
+                "budget_reservation_rejected",
+                workflow_id=workflow_id,
+                operation=operation_name,
+                budget_type=error.budget_type,
+                used=error.used,
+                limit=error.limit,
+            )
+            raise error
 
         logger.info(
             "budget_reserved_async",
@@ -402,18 +486,95 @@ class BudgetGuard:
             operation=operation_name,
             tokens_reserved=estimated_tokens,
             cost_reserved=estimated_cost_usd,
-            total_tokens=new_budget["tokens_used"],
-            total_cost=new_budget["cost_used"],
+            total_tokens=tokens_total,
+            total_cost=cost_total,
         )
 
+        # Remaining budget as seen before this reservation (check_budget view)
         return {
             "allowed": True,
+            "reason": "Budget available",
+            "remaining_tokens": self.max_tokens_per_workflow
+            - (tokens_total - estimated_tokens),
+            "remaining_cost_usd": self.max_monthly_budget_usd
+            - (cost_total - estimated_cost_usd),
             "reserved": True,
             "tokens_reserved": estimated_tokens,
             "cost_reserved": estimated_cost_usd,
-            **check_result,
         }
 
+    def _cached_workflow_usage(self, workflow_id: str) -> tuple[int, float] | None:
+        """Return (tokens_used, cost_used) if read from Redis very recently."""
+        entry = self._workflow_usage.get(workflow_id)
+        if entry is None:
+            return None
+        fetched_at, tokens_used, cost_used = entry
+        if time.monotonic() - fetched_at >= _WORKFLOW_USAGE_TTL_SECONDS:
+            del self._workflow_usage[workflow_id]
+            return None
+        self._workflow_usage.move_to_end(workflow_id)
+        return tokens_used, cost_used
+
+    def _remember_workflow_usage(
+        self, workflow_id: str, tokens_used: int, cost_used: float
+    ) -> None:
+        """Cache the latest known usage for a workflow (LRU-bounded)."""
+        self._workflow_usage[workflow_id] = (time.monotonic(), tokens_used, cost_used)
+        self._workflow_usage.move_to_end(workflow_id)
+        if len(self._workflow_usage) > _WORKFLOW_USAGE_CACHE_SIZE:
+            self._workflow_usage.popitem(last=False)
+
+    async def refresh_monthly_usage(self) -> float:
+        """
+        Refresh the monthly cost total from Redis.
+
+        The value is reused for up to one second to keep the shared monthly
+        key from becoming a hot spot under bursty agent traffic.
+
+        Returns:
+            Current monthly cost in USD
+        """
+        now = time.monotonic()
+        if (
+            self._monthly_usage_fetched_at is not None
+            and now - self._monthly_usage_fetched_at < _MONTHLY_USAGE_TTL_SECONDS
+        ):
+            return self.current_month_used_usd
+
+        await self._ensure_cache_connected()
+        try:
+            value = await self.cache.get(_monthly_usage_key(datetime.now(UTC)))
+        except CacheError as e:
+            logger.warning(
+                "monthly_usage_refresh_failed",
+                error=str(e),
+                fallback="in-memory tracking",
+            )
+            return self.current_month_used_usd
+
+        self.current_month_used_usd = float(value) if value else 0.0
+        self._monthly_usage_fetched_at = now
+        return self.current_month_used_usd
+
+    async def _publish_monthly_usage(self, delta_usd: float) -> None:
+        """Apply a monthly cost delta in Redis and mirror the shared total."""
+        await self._ensure_cache_connected()
+        now = datetime.now(UTC)
+        try:
+            total = await self.cache.increment_float(
+                _monthly_usage_key(now), delta_usd, expire_at=_month_end(now)
+            )
+        except CacheError as e:
+            logger.warning(
+                "monthly_usage_publish_failed",
+                error=str(e),
+                fallback="in-memory tracking",
+            )
+            return
+
+        self.current_month_used_usd = max(0.0, total)
+        self._monthly_usage_fetched_at = time.monotonic()
+
     async def _ensure_cache_connected(self) -> None:
         """Ensure Redis cache is connected."""
         if not self._cache_connected:
@@ -441,7 +602,8 @@ class BudgetGuard:
         """
         Record actual LLM usage after operation completes.
 
-        This updates monthly tracking (in-memory for now).
+        This updates the in-process monthly mirror only; use
+        record_usage_async() to update the shared monthly total in Redis.
         Workflow state budget is updated separately via update_budget() reducer.
 
         Args:
@@ -473,6 +635,37 @@ class BudgetGuard:
             total_month_cost=self.current_month_used_usd,
         )
 
+    async def record_usage_async(
+        self,
+        operation_name: str,
+        tokens_used: int,
+        cost_usd: float,
+        workflow_state: WorkflowState,
+        agent_name: str | None = None,
+    ) -> None:
+        """
+        Record actual LLM usage and add its cost to the shared monthly total.
+
+        Same as record_usage(), but the monthly total is kept in Redis so it
+        is correct across workers and restarts.
+
+        Args:
+            operation_name: Name of operation for tracking
+            tokens_used: Actual tokens consumed
+            cost_usd: Actual cost in USD
+            workflow_state: Current workflow state
+            agent_name: Agent that consumed the budget
+                (optional, defaults to operation_name)
+        """
+        self.record_usage(
+            operation_name=operation_name,
+            tokens_used=tokens_used,
+            cost_usd=cost_usd,
+            workflow_state=workflow_state,
+            agent_name=agent_name,
+        )
+        await self._publish_monthly_usage(cost_usd)
+
     async def track_cost(
         self,
         workflow_state: WorkflowState,
@@ -502,6 +695,7 @@ class BudgetGuard:
         )
 
         self.current_month_used_usd = max(0.0, self.current_month_used_usd + cost)
+        await self._publish_monthly_usage(cost)
 
         logger.info(
             "budget_cost_tracked",
@@ -628,6 +822,7 @@ class BudgetGuard:
         )
 
         self.current_month_used_usd = max(0.0, self.current_month_used_usd - refund)
+        await self._publish_monthly_usage(-refund)
 
         logger.info(
             "budget_cost_refunded",
@@ -652,40 +847,61 @@ class BudgetGuard:
 
         Returns:
             Dict with budget usage statistics
+
+        Note:
+            Remaining amounts come from the workflow state, which carries its
+            own budget (see create_initial_state), not from these limits.
         """
-        token_usage_pct = (
-            workflow_state["budget_used_tokens"] / self.max_tokens_per_workflow * 100
-        )
-        cost_usage_pct = (
-            workflow_state["budget_used_usd"] / self.max_monthly_budget_usd * 100
-        )
+        used_tokens = workflow_state["budget_used_tokens"]
+        used_usd = workflow_state["budget_used_usd"]
+        month_used_usd = self.current_month_used_usd
 
         return {
             "tokens": {
-                "used": workflow_state["budget_used_tokens"],
+                "used": used_tokens,
                 "remaining": workflow_state["budget_remaining_tokens"],
                 "limit": self.max_tokens_per_workflow,
-                "usage_pct": token_usage_pct,
+                "usage_pct": used_tokens * self._token_pct_scale,
                 "alert_threshold_pct": self.alert_threshold_pct,
-                "at_threshold": token_usage_pct >= self.alert_threshold_pct,
+                "at_threshold": used_tokens >= self._token_alert_abs,
             },
             "cost": {
-                "used_usd": workflow_state["budget_used_usd"],
+                "used_usd": used_usd,
                 "remaining_usd": workflow_state["budget_remaining_usd"],
                 "limit_usd": self.max_monthly_budget_usd,
-                "usage_pct": cost_usage_pct,
+                "usage_pct": used_usd * self._usd_pct_scale,
                 "alert_threshold_pct": self.alert_threshold_pct,
-                "at_threshold": cost_usage_pct >= self.alert_threshold_pct,
+                "at_threshold": used_usd >= self._usd_alert_abs,
             },
             "monthly": {
-                "used_usd": self.current_month_used_usd,
+                "used_usd": month_used_usd,
                 "limit_usd": self.max_monthly_budget_usd,
-                "remaining_usd": self.max_monthly_budget_usd
-                - self.current_month_used_usd,
+                "remaining_usd": self.max_monthly_budget_usd - month_used_usd,
             },
             "per_agent": workflow_state["agent_token_usage"],
         }
 
 
-# Global budget guard instance
-budget_guard = BudgetGuard()
+def _monthly_usage_key(now: datetime) -> str:
+    """Redis key holding the monthly cost total for the month of ``now``."""
+    return f"budget:month:{now:%Y-%m}"
+
+
+def _month_end(now: datetime) -> datetime:
+    """Start of the month following ``now`` (UTC), when the monthly key expires."""
+    if now.month == 12:
+        return datetime(now.year + 1, 1, 1, tzinfo=UTC)
+    return datetime(now.year, now.month + 1, 1, tzinfo=UTC)
+
+
+@lru_cache(maxsize=1)
+def get_budget_guard() -> BudgetGuard:
+    """Return the process-wide BudgetGuard, creating it on first use."""
+    return BudgetGuard()
+
+
+def __getattr__(name: str) -> Any:
+    """Keep ``budget_guard`` importable without building it at import time."""
+    if name == "budget_guard":
+        return get_budget_guard()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
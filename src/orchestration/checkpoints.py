@@ -4,25 +4,58 @@ Implements LangGraph Checkpointer interface for workflow state persistence.
 Manages checkpoint lifecycle: save, load, list, cleanup.
 """
 
-from collections.abc import AsyncIterator
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
 from typing import Any, cast
 
+import orjson
 import structlog
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
+    ChannelVersions,
     Checkpoint,
     CheckpointMetadata,
     CheckpointTuple,
 )
 
 from src.config import Settings
-from src.orchestration.state import WorkflowState
+from src.exceptions import StorageError
+from src.orchestration.state import WorkflowState, as_api_dict, upgrade_timestamps
+from src.storage.artifact_storage import ArtifactStorage
 from src.storage.checkpoint_repository import CheckpointRepository
 
 
 logger = structlog.get_logger()
 
+# Metadata reported for every listed checkpoint (not persisted per checkpoint),
+# shared across CheckpointTuples instead of rebuilt for each one
+_LIST_METADATA: CheckpointMetadata = {  # type: ignore[typeddict-unknown-key]
+    "source": "input",
+    "step": -1,
+    "writes": {},
+    "parents": {},
+}
+
+# Large state fields stored in artifact storage (with only a reference kept
+# in the checkpoint row) when the manager has artifact storage configured
+_ARTIFACT_FIELDS: tuple[str, ...] = (
+    "code_files",
+    "test_files",
+    "partial_artifacts",
+    "validation_report",
+    "deviation_log",
+    "compliance_log",
+    "quality_report",
+    "security_report",
+    "acceptance_report",
+)
+
+# Uploaded artifact paths a manager remembers (least recently used evicted)
+_STORED_ARTIFACTS_CACHE_SIZE = 4096
+
 
 class CheckpointManager(BaseCheckpointSaver):  # type: ignore
     """LangGraph checkpoint manager with PostgreSQL backend.
@@ -34,6 +67,8 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
         repository: CheckpointRepository instance
         retention_hours: Checkpoint retention period (default: 48 hours)
         max_checkpoints_per_workflow: Maximum checkpoints to retain (default: 10)
+        artifact_storage: Storage for large artifact fields (default: None,
+            artifacts stay inline in the checkpoint)
     """
 
     def __init__(
@@ -41,6 +76,7 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
         settings: Settings,
         retention_hours: int = 48,
         max_checkpoints_per_workflow: int = 10,
+        artifact_storage: ArtifactStorage | None = None,
     ) -> None:
         """Initialize checkpoint manager.
 
@@ -48,11 +84,16 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
             settings: Application settings
             retention_hours: Delete checkpoints older than this (default: 48)
             max_checkpoints_per_workflow: Max checkpoints per workflow (default: 10)
+            artifact_storage: Artifact storage to offload large fields to
         """
         super().__init__()
         self.repository = CheckpointRepository(settings)
         self.retention_hours = retention_hours
         self.max_checkpoints_per_workflow = max_checkpoints_per_workflow
+        self.artifact_storage = artifact_storage
+        # Content-addressed artifact paths recently uploaded by this manager,
+        # least recently used first (values unused)
+        self._stored_artifacts: OrderedDict[str, None] = OrderedDict()
 
     async def connect(self) -> None:
         """Establish database connection pool."""
@@ -80,6 +121,7 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
 
         try:
             state = await self.repository.load_checkpoint(str(checkpoint_id))
+            state = upgrade_timestamps(await self._restore_artifacts(state))
             return self._state_to_checkpoint(state, str(checkpoint_id))
         except Exception:
             # Checkpoint not found or error
@@ -105,32 +147,24 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
         workflow_id = config.get("workflow_id", "unknown")
         workflow_id_str = str(workflow_id)
         state = self._checkpoint_to_state(checkpoint)
-
-        checkpoint_id = await self.repository.save_checkpoint(
-            workflow_id=workflow_id_str,
-            state=state,
-        )
-
-        # Update workflow metadata
-        await self.repository.save_workflow_metadata(
+        state = await self._offload_artifacts(workflow_id_str, state)
+
+        # Stored rows carry ISO created_at/updated_at for anything reading
+        # the JSON directly; the integer timestamps stay authoritative.
+        # Checkpoint, workflow metadata and audit event in one statement.
+        # The audit insert adds no round trip here, so it isn't deferred to
+        # a background task (which would also let it be lost on its own).
+        checkpoint_id = await self.repository.save_checkpoint_bundle(
             workflow_id=workflow_id_str,
+            state=cast(WorkflowState, as_api_dict(state)),
             user_request=state.get("user_request", ""),
             status=state.get("current_phase", "RUNNING"),
             current_phase=state.get("current_phase"),
             current_agent=state.get("current_agent"),
             budget_used_usd=state.get("budget_used_usd", 0.0),
             rejection_count=state.get("rejection_count", 0),
-        )
-
-        # Log audit event
-        await self.repository.log_audit_event(
-            workflow_id=workflow_id_str,
             event_type="CHECKPOINT_SAVED",
             agent_name=state.get("current_agent", "system"),
-            event_data={
-                "checkpoint_id": checkpoint_id,
-                "state_version": state.get("state_version", 1),
-            },
         )
 
         # TypedDict doesn't officially support extra keys, but LangGraph uses them
@@ -162,38 +196,46 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
             limit=limit_val,
         )
 
+        if not checkpoints:
+            return
+
+        # One query for all states instead of a round trip per checkpoint
+        states = await self.repository.load_checkpoints_bulk(
+            [meta["checkpoint_id"] for meta in checkpoints]
+        )
+
+        # States are pre-validated by the repository, so the loop only has
+        # to skip IDs that came back without one
         for checkpoint_meta in checkpoints:
+            checkpoint_id = checkpoint_meta["checkpoint_id"]
+            state = states.get(checkpoint_id)
+            if state is None:
+                logger.warning("corrupted_checkpoint", checkpoint_id=checkpoint_id)
+                continue
             try:
-                state = await self.repository.load_checkpoint(
-                    checkpoint_meta["checkpoint_id"]
-                )
-                checkpoint = self._state_to_checkpoint(
-                    state,
-                    checkpoint_meta["checkpoint_id"],
+                state = upgrade_timestamps(await self._restore_artifacts(state))
+            except (StorageError, ValueError) as e:
+                logger.warning(
+                    "checkpoint_artifacts_unavailable",
+                    checkpoint_id=checkpoint_id,
+                    error=str(e),
                 )
+                continue
 
-                # Construct CheckpointTuple
-                # We need to construct a valid config for this checkpoint
-                checkpoint_config: RunnableConfig = {
-                    "configurable": {
-                        "thread_id": workflow_id,
-                        "checkpoint_id": checkpoint_meta["checkpoint_id"],
-                        "workflow_id": workflow_id,
-                    }
+            checkpoint_config: RunnableConfig = {
+                "configurable": {
+                    "thread_id": workflow_id,
+                    "checkpoint_id": checkpoint_id,
+                    "workflow_id": workflow_id,
                 }
-
-                metadata_dict: CheckpointMetadata = {"source": "input", "step": -1, "writes": {}, "parents": {}}  # type: ignore[typeddict-unknown-key]
-                yield CheckpointTuple(
-                    config=checkpoint_config,
-                    checkpoint=checkpoint,
-                    metadata=metadata_dict,
-                    parent_config=None,
-                    pending_writes=[],
-                )
-            except Exception as e:
-                # Skip corrupted checkpoints
-                logger.warning("corrupted_checkpoint", error=str(e))
-                continue
+            }
+            yield CheckpointTuple(
+                config=checkpoint_config,
+                checkpoint=self._state_to_checkpoint(state, checkpoint_id),
+                metadata=_LIST_METADATA,
+                parent_config=None,
+                pending_writes=[],
+            )
 
     async def cleanup_old_checkpoints(self) -> int:
         """Delete checkpoints older than retention period.
@@ -205,6 +247,117 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
             retention_hours=self.retention_hours
         )
 
+    async def _offload_artifacts(
+        self,
+        workflow_id: str,
+        state: WorkflowState,
+    ) -> WorkflowState:
+        """Move large artifact fields to artifact storage.
+
+        Each non-empty field is stored under a path derived from its content
+        hash, so unchanged artifacts are uploaded once and shared by every
+        later checkpoint. The returned state keeps empty placeholders plus
+        an ``artifact_refs`` mapping of field to artifact path; the given
+        state is not modified.
+
+        Args:
+            workflow_id: Workflow the artifacts belong to
+            state: Workflow state about to be checkpointed
+
+        Returns:
+            State to persist (the given state if nothing was offloaded)
+        """
+        if self.artifact_storage is None:
+            return state
+
+        offloaded: dict[str, Any] = {}
+        refs: dict[str, str] = {}
+        uploads = []
+        for field in _ARTIFACT_FIELDS:
+            value = state.get(field)
+            if not value:
+                continue
+            payload = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+            digest = hashlib.sha256(payload).hexdigest()
+            artifact_path = f"checkpoint_artifacts/{field}/{digest}.json"
+            refs[field] = artifact_path
+            offloaded[field] = type(value)()
+            uploads.append(self._store_artifact(workflow_id, artifact_path, payload))
+
+        if not refs:
+            return state
+
+        await asyncio.gather(*uploads)
+        return cast(WorkflowState, {**state, **offloaded, "artifact_refs": refs})
+
+    async def _store_artifact(
+        self,
+        workflow_id: str,
+        artifact_path: str,
+        payload: bytes,
+    ) -> None:
+        """Upload a content-addressed artifact unless it is already stored.
+
+        A recently uploaded path is only confirmed with a HEAD request, so
+        an artifact removed since (workflow cleanup, retention) is uploaded
+        again rather than referenced while missing.
+
+        Args:
+            workflow_id: Workflow the artifact belongs to
+            artifact_path: Content-addressed path within the workflow
+            payload: Serialized field value
+        """
+        storage = cast(ArtifactStorage, self.artifact_storage)
+        object_name = f"{workflow_id}/{artifact_path}"
+        if object_name not in self._stored_artifacts or not (
+            await storage.artifact_exists(workflow_id, artifact_path)
+        ):
+            object_name = await storage.upload_artifact(
+                workflow_id, artifact_path, payload, "application/json"
+            )
+
+        self._stored_artifacts[object_name] = None
+        self._stored_artifacts.move_to_end(object_name)
+        if len(self._stored_artifacts) > _STORED_ARTIFACTS_CACHE_SIZE:
+            self._stored_artifacts.popitem(last=False)
+
+    async def _restore_artifacts(self, state: WorkflowState) -> WorkflowState:
+        """Load offloaded artifact fields back into a checkpointed state.
+
+        Args:
+            state: Workflow state as loaded from the checkpoint row
+
+        Returns:
+            State with artifact fields filled in and ``artifact_refs`` removed
+
+        Raises:
+            StorageError: If the state references artifacts but no artifact
+                storage is configured, or an artifact can't be downloaded
+            ValueError: If an artifact is not valid JSON
+        """
+        refs = state.get("artifact_refs")
+        if not refs:
+            return state
+        if self.artifact_storage is None:
+            raise StorageError(
+                "Checkpoint references offloaded artifacts but no artifact "
+                "storage is configured"
+            )
+
+        workflow_id = state["workflow_id"]
+        fields = list(refs)
+        contents = await asyncio.gather(
+            *(
+                self.artifact_storage.download_artifact(workflow_id, refs[field])
+                for field in fields
+            )
+        )
+        restored = cast(dict[str, Any], state)
+        del restored["artifact_refs"]
+        for field, content in zip(fields, contents, strict=True):
+            restored[field] = orjson.loads(content)
+        return state
+
     def _state_to_checkpoint(
         self,
         state: WorkflowState,
@@ -212,6 +365,8 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
     ) -> Checkpoint:
         """Convert WorkflowState to LangGraph Checkpoint.
 
+        The state dict is referenced, not copied.
+
         Args:
             state: Workflow state dictionary
             checkpoint_id: Checkpoint identifier
@@ -232,6 +387,9 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
     def _checkpoint_to_state(self, checkpoint: Checkpoint) -> WorkflowState:
         """Convert LangGraph Checkpoint to WorkflowState.
 
+        Returns the checkpoint's own state dict (updated in place with the
+        checkpoint version) rather than a copy.
+
         Args:
             checkpoint: LangGraph Checkpoint object
 
@@ -241,3 +399,209 @@ class CheckpointManager(BaseCheckpointSaver):  # type: ignore
         state = cast(WorkflowState, checkpoint["channel_values"].get("state", {}))
         state["state_version"] = checkpoint["v"]
         return state
+
+
+class BufferedCheckpointer(BaseCheckpointSaver):  # type: ignore
+    """Checkpointer that holds writes in memory until flushed.
+
+    Wraps another checkpointer (normally CheckpointManager) so a workflow
+    run costs one database write per flush instead of one per node. Only
+    the latest checkpoint of each thread is kept; intermediate ones are
+    superseded before they would ever be read back. Pending writes made
+    against the buffered checkpoint (interrupts, sibling tasks of a failed
+    step) are kept with it, served by aget_tuple() and forwarded to the
+    underlying checkpointer on flush.
+
+    Attributes:
+        saver: Underlying checkpointer that flushed checkpoints go to
+    """
+
+    def __init__(self, saver: BaseCheckpointSaver) -> None:
+        """Initialize buffered checkpointer.
+
+        Args:
+            saver: Checkpointer to delegate reads and flushed writes to
+        """
+        super().__init__()
+        self.saver = saver
+        # Latest checkpoint per thread: the put() arguments, then the config
+        # put() returned for it
+        self._pending: dict[
+            str,
+            tuple[
+                RunnableConfig,
+                Checkpoint,
+                CheckpointMetadata,
+                ChannelVersions,
+                RunnableConfig,
+            ],
+        ] = {}
+        # Pending writes against each thread's buffered checkpoint:
+        # (writes, task_id, task_path)
+        self._pending_writes: dict[
+            str, list[tuple[Sequence[tuple[str, Any]], str, str]]
+        ] = {}
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Buffer checkpoint, replacing any pending one for the same thread.
+
+        Writes against the replaced checkpoint are dropped with it, since
+        the new checkpoint is built from their result.
+        """
+        configurable = {
+            **config.get("configurable", {}),
+            "checkpoint_id": checkpoint["id"],
+        }
+        saved_config = cast(RunnableConfig, {**config, "configurable": configurable})
+        thread_key = _thread_key(config)
+        self._pending[thread_key] = (
+            config,
+            checkpoint,
+            metadata,
+            new_versions,
+            saved_config,
+        )
+        self._pending_writes.pop(thread_key, None)
+        return saved_config
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Buffer checkpoint (LangGraph interface, no I/O)."""
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Buffer writes with the thread's checkpoint, else pass them on."""
+        thread_key = _thread_key(config)
+        if thread_key in self._pending:
+            self._pending_writes.setdefault(thread_key, []).append(
+                (writes, task_id, task_path)
+            )
+        else:
+            self.saver.put_writes(config, writes, task_id, task_path)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Buffer writes with the thread's checkpoint (LangGraph interface)."""
+        thread_key = _thread_key(config)
+        if thread_key in self._pending:
+            self._pending_writes.setdefault(thread_key, []).append(
+                (writes, task_id, task_path)
+            )
+        else:
+            await self.saver.aput_writes(config, writes, task_id, task_path)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get latest checkpoint, preferring the buffered one for the thread."""
+        thread_key = _thread_key(config)
+        pending = self._pending.get(thread_key)
+        requested_id = config.get("configurable", {}).get("checkpoint_id")
+        if pending is not None and requested_id in (None, pending[1]["id"]):
+            parent_config, checkpoint, metadata, _, saved_config = pending
+            has_parent = "checkpoint_id" in parent_config.get("configurable", {})
+            return CheckpointTuple(
+                config=saved_config,
+                checkpoint=checkpoint,
+                metadata=metadata,
+                parent_config=parent_config if has_parent else None,
+                pending_writes=[
+                    (task_id, channel, value)
+                    for writes, task_id, _ in self._pending_writes.get(thread_key, ())
+                    for channel, value in writes
+                ],
+            )
+        return cast(CheckpointTuple | None, await self.saver.aget_tuple(config))
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,  # noqa: A002
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List persisted checkpoints from the underlying checkpointer."""
+        async for checkpoint_tuple in self.saver.alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield checkpoint_tuple
+
+    async def flush(self, thread_id: str | None = None) -> int:
+        """Write buffered checkpoints to the underlying checkpointer.
+
+        A thread's checkpoint and writes leave the buffer only once they
+        are written, so a failed write can be retried by flushing again.
+
+        Args:
+            thread_id: Only flush this thread (default: all threads)
+
+        Returns:
+            Number of checkpoints written
+        """
+        thread_keys = list(self._pending) if thread_id is None else [thread_id]
+
+        written = 0
+        for thread_key in thread_keys:
+            entry = self._pending.get(thread_key)
+            if entry is None:
+                continue
+            writes = list(self._pending_writes.get(thread_key, ()))
+
+            config, checkpoint, metadata, new_versions, _ = entry
+            saved_config = await self.saver.aput(
+                config, checkpoint, metadata, new_versions
+            )
+            for task_writes, task_id, task_path in writes:
+                await self.saver.aput_writes(
+                    saved_config, task_writes, task_id, task_path
+                )
+
+            # A newer checkpoint buffered while writing stays pending
+            if self._pending.get(thread_key) is entry:
+                self.discard(thread_key)
+            written += 1
+
+        if written:
+            logger.debug("checkpoints_flushed", count=written, thread_id=thread_id)
+        return written
+
+    def discard(self, thread_id: str) -> None:
+        """Drop a thread's buffered checkpoint and writes without writing them.
+
+        Args:
+            thread_id: Thread whose buffer to drop
+        """
+        self._pending.pop(thread_id, None)
+        self._pending_writes.pop(thread_id, None)
+
+
+def _thread_key(config: RunnableConfig) -> str:
+    """Return the thread (workflow) a checkpoint config belongs to."""
+    configurable = config.get("configurable", {})
+    thread_id = (
+        configurable.get("thread_id")
+        or configurable.get("workflow_id")
+        or config.get("workflow_id", "unknown")
+    )
+    return str(thread_id)
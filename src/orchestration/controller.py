@@ -4,11 +4,18 @@ Main entry point for workflow execution across 6 tiers.
 Implements tier routing, quality gates, and budget enforcement.
 """
 
-from datetime import UTC, datetime
+import functools
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
+from typing import Any, Literal
 
 from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.errors import GraphRecursionError
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Command
 
 from src.config import Settings
 from src.exceptions import (
@@ -16,8 +23,150 @@ from src.exceptions import (
     InfiniteLoopDetectedError,
 )
 from src.orchestration.budget_guard import BudgetGuard
-from src.orchestration.checkpoints import CheckpointManager
-from src.orchestration.state import WorkflowState
+from src.orchestration.checkpoints import BufferedCheckpointer, CheckpointManager
+from src.orchestration.state import ResetList, WorkflowState
+
+
+CheckpointMode = Literal["per_node", "end_of_workflow", "tier_boundary"]
+
+# Agent and phase names written by the tier nodes. Shared constants keep
+# every node (and any router comparing them) on the same string objects.
+AGENT_ORCHESTRATOR = "OrchestrationController"
+AGENT_DEVIATION_HANDLER = "DeviationHandler"
+AGENT_REQUIREMENTS = "RequirementsStrategy"
+AGENT_STRATEGY_VALIDATOR = "StrategyValidator"
+AGENT_ARCHITECT = "SolutionArchitect"
+AGENT_PLANNER = "ImplementationPlanner"
+AGENT_DEPENDENCIES = "DependencyResolver"
+AGENT_ENGINEER = "SoftwareEngineer"
+AGENT_STATIC_ANALYSIS = "StaticAnalysisAgent"
+AGENT_QUALITY = "QualityEngineer"
+AGENT_SECURITY = "SecurityValidator"
+AGENT_PRODUCT = "ProductValidator"
+AGENT_DOCUMENTATION = "DocumentationAgent"
+AGENT_DEPLOYMENT = "DeploymentAgent"
+
+PHASE_PLANNING = "planning"
+PHASE_PREPARATION = "preparation"
+PHASE_DEVELOPMENT = "development"
+PHASE_VALIDATION = "validation"
+PHASE_DELIVERY = "delivery"
+PHASE_COMPLETED = "completed"
+
+# Read-only fields every workflow starts with; per-workflow values and
+# mutable containers are filled in by execute_workflow
+_INITIAL_STATE_TEMPLATE: Mapping[str, Any] = MappingProxyType(
+    {
+        "current_phase": PHASE_PLANNING,
+        "current_task": "requirements_analysis",
+        "current_agent": AGENT_ORCHESTRATOR,
+        "rejection_count": 0,
+        "state_version": 1,
+        "requirements": "",
+        "architecture": "",
+        "tasks": "",
+        "validation_report": "",
+        "quality_report": "",
+        "security_report": "",
+        "budget_used_tokens": 0,
+        "budget_used_usd": 0.0,
+        "awaiting_human_approval": False,
+        "approval_gate": "",
+        "approval_timeout": "",
+        "escalation_flag": False,
+        "dependencies": "",
+        "infrastructure": "",
+        "observability": "",
+        "deviation_log": "",
+        "compliance_log": "",
+        "acceptance_report": "",
+    }
+)
+
+# Nodes the deviation handler may send the workflow back to
+_DEVIATION_TARGETS = frozenset(
+    {
+        "tier_1_requirements",
+        "tier_1_architect",
+        "tier_2_planner",
+        "tier_3_engineer",
+        "tier_3_static_analysis",
+        "tier_4_security",
+    }
+)
+
+
+def _tier_node(
+    agent_name: str,
+    phase: str | None = None,
+) -> Callable[[WorkflowState], Awaitable[dict[str, Any]]]:
+    """Build a stub tier node that records which agent ran.
+
+    Args:
+        agent_name: Agent written to current_agent
+        phase: Phase written to current_phase when the node starts one
+
+    Returns:
+        Graph node returning only the fields it changes
+    """
+    update: dict[str, Any] = {"current_agent": agent_name}
+    if phase is not None:
+        update["current_phase"] = phase
+
+    async def node(_state: WorkflowState) -> dict[str, Any]:
+        return dict(update)
+
+    node.__name__ = f"tier_node_{agent_name}"
+    return node
+
+
+def _route_blocking(
+    state: WorkflowState,
+    on_pass: str,
+    update: dict[str, Any] | None = None,
+) -> Command[str]:
+    """Route to the deviation handler on blocking issues, else move on.
+
+    The node's update and its next hop come back as one Command, so no
+    conditional edge has to run after the node.
+
+    Args:
+        state: Current workflow state
+        on_pass: Node to go to when there are no blocking issues
+        update: State update of the routing node
+
+    Returns:
+        Command carrying the update and the next node
+    """
+    goto = "tier_0_deviation" if state.get("blocking_issues") else on_pass
+    return Command(goto=goto, update=update)
+
+
+def _make_budget_check(
+    total_budget_tokens: int,
+) -> Callable[[WorkflowState], Awaitable[dict[str, Any]]]:
+    """Build the budget check node run ahead of each tier.
+
+    The budget limit is bound when the graph is built, so the node reads
+    nothing but the state on each step.
+
+    Args:
+        total_budget_tokens: Token budget reported when it is exhausted
+
+    Returns:
+        Graph node raising BudgetExhaustedError once no tokens remain
+    """
+
+    async def budget_check(state: WorkflowState) -> dict[str, Any]:
+        if state["budget_remaining_tokens"] <= 0:
+            raise BudgetExhaustedError(
+                budget_type="tokens",
+                limit=total_budget_tokens,
+                requested=state["budget_used_tokens"],
+            )
+        return {}
+
+    return budget_check
 
 
 class OrchestrationController:
@@ -35,6 +184,8 @@ class OrchestrationController:
         settings: Application settings
         budget_guard: Budget enforcement
         checkpoint_manager: Checkpoint persistence
+        checkpoint_mode: When checkpoints are written (default: "per_node")
+        checkpointer: Checkpointer the graph is compiled with
         graph: LangGraph StateGraph
         max_iterations: Maximum workflow iterations (default: 50)
     """
@@ -45,6 +196,7 @@ class OrchestrationController:
         budget_guard: BudgetGuard,
         checkpoint_manager: CheckpointManager,
         max_iterations: int = 50,
+        checkpoint_mode: CheckpointMode = "per_node",
     ) -> None:
         """Initialize orchestration controller.
 
@@ -53,12 +205,32 @@ class OrchestrationController:
             budget_guard: Budget guard instance
             checkpoint_manager: Checkpoint manager instance
             max_iterations: Maximum workflow iterations before timeout
+            checkpoint_mode: "per_node" persists after every node,
+                "end_of_workflow" once when the run stops and
+                "tier_boundary" whenever the workflow enters another phase (tier)
+
+        Raises:
+            ValueError: If checkpoint_mode is not a known mode
         """
+        if checkpoint_mode not in ("per_node", "end_of_workflow", "tier_boundary"):
+            raise ValueError(f"Unknown checkpoint mode: {checkpoint_mode}")
+
         self.settings = settings
         self.budget_guard = budget_guard
         self.checkpoint_manager = checkpoint_manager
         self.max_iterations = max_iterations
-        self.graph: CompiledStateGraph | None = None
+        self.checkpoint_mode = checkpoint_mode
+        self.checkpointer: BaseCheckpointSaver = (
+            checkpoint_manager
+            if checkpoint_mode == "per_node"
+            else BufferedCheckpointer(checkpoint_manager)
+        )
+        # Compiled once per budget so no request pays for it; each
+        # controller binds its own checkpointer to a shallow copy, which
+        # shares the compiled nodes without the cache holding on to it.
+        self.graph: CompiledStateGraph = _shared_graph(
+            settings.total_budget_tokens
+        ).copy(update={"checkpointer": self.checkpointer})
 
     def build_graph(self) -> CompiledStateGraph:
         """Build LangGraph StateGraph with tier nodes and routing.
@@ -72,37 +244,86 @@ class OrchestrationController:
         Returns:
             Configured StateGraph instance
         """
+        self.graph = self._compile_graph(
+            self.checkpointer, self.settings.total_budget_tokens
+        )
+        return self.graph
+
+    @classmethod
+    def _compile_graph(
+        cls,
+        checkpointer: BaseCheckpointSaver | None,
+        total_budget_tokens: int,
+    ) -> CompiledStateGraph:
+        """Compile the workflow graph.
+
+        Nodes don't reference a controller instance, so the compiled graph
+        depends only on the arguments and can be shared between controllers.
+
+        Args:
+            checkpointer: Checkpointer to compile the graph with
+            total_budget_tokens: Token budget enforced by the budget checks
+
+        Returns:
+            Compiled StateGraph
+        """
         # Create graph with WorkflowState schema
         graph = StateGraph(WorkflowState)
 
         # Add tier nodes
-        graph.add_node("tier_0_deviation", self._tier_0_deviation_handler)
-        graph.add_node("tier_1_requirements", self._tier_1_requirements)
-        graph.add_node("tier_1_validator", self._tier_1_validator)
-        graph.add_node("tier_1_architect", self._tier_1_architect)
-        graph.add_node("tier_2_planner", self._tier_2_planner)
-        graph.add_node("tier_2_dependencies", self._tier_2_dependencies)
-        graph.add_node("tier_3_engineer", self._tier_3_engineer)
-        graph.add_node("tier_3_static_analysis", self._tier_3_static_analysis)
-        graph.add_node("tier_3_quality", self._tier_3_quality)
-        graph.add_node("tier_4_security", self._tier_4_security)
-        graph.add_node("tier_4_product", self._tier_4_product)
-        graph.add_node("tier_5_docs", self._tier_5_docs)
-        graph.add_node("tier_5_deployment", self._tier_5_deployment)
+        graph.add_node("tier_0_deviation", cls._tier_0_deviation_handler)
+        graph.add_node("tier_1_requirements", cls._tier_1_requirements)
+        graph.add_node(
+            "tier_1_validator",
+            cls._tier_1_validator,
+            destinations=("tier_1_architect", "tier_0_deviation"),
+        )
+        graph.add_node("tier_1_architect", cls._tier_1_architect)
+        graph.add_node("tier_2_planner", cls._tier_2_planner)
+        graph.add_node(
+            "tier_2_dependencies",
+            cls._tier_2_dependencies,
+            destinations=("tier_3_budget_check", "tier_0_deviation"),
+        )
+        graph.add_node("tier_3_engineer", cls._tier_3_engineer)
+        graph.add_node("tier_3_static_analysis", cls._tier_3_static_analysis)
+        graph.add_node("tier_3_quality", cls._tier_3_quality)
+        graph.add_node("tier_4_security", cls._tier_4_security)
+        graph.add_node("tier_4_product", cls._tier_4_product)
+        graph.add_node("tier_5_docs", cls._tier_5_docs)
+        graph.add_node("tier_5_deployment", cls._tier_5_deployment)
+
+        # Join nodes where parallel branches meet again
+        graph.add_node(
+            "tier_3_join",
+            cls._tier_3_join,
+            destinations=("tier_4_budget_check", "tier_0_deviation"),
+        )
+        graph.add_node(
+            "tier_4_join",
+            cls._tier_4_join,
+            destinations=("tier_5_budget_check", "tier_0_deviation"),
+        )
+        graph.add_node("tier_5_join", cls._tier_5_join)
+
+        # Budget checks ahead of each tier stop the graph once tokens run out
+        budget_check = _make_budget_check(total_budget_tokens)
+        for tier in range(1, 6):
+            graph.add_node(f"tier_{tier}_budget_check", budget_check)
 
         # Set entry point
-        graph.set_entry_point("tier_1_requirements")
+        graph.set_entry_point("tier_1_budget_check")
 
         # Add conditional edges (routing logic)
-        self._add_conditional_edges(graph)
+        cls._add_conditional_edges(graph)
 
         # Set finish point
-        graph.add_edge("tier_5_deployment", END)
+        graph.add_edge("tier_5_join", END)
 
-        self.graph = graph.compile(checkpointer=self.checkpoint_manager)
-        return self.graph
+        return graph.compile(checkpointer=checkpointer)
 
-    def _add_conditional_edges(self, graph: StateGraph) -> None:
+    @classmethod
+    def _add_conditional_edges(cls, graph: StateGraph) -> None:
         """Add conditional routing edges to graph.
 
         Implements quality gate logic:
@@ -113,97 +334,52 @@ class OrchestrationController:
         Args:
             graph: StateGraph instance to modify
         """
-        # Tier 1: Requirements → Validator
+        # Tier 1: Budget Check → Requirements → Validator
+        graph.add_edge("tier_1_budget_check", "tier_1_requirements")
         graph.add_edge("tier_1_requirements", "tier_1_validator")
 
-        # Tier 1: Validator → Architect or Deviation
-        graph.add_conditional_edges(
-            "tier_1_validator",
-            self._route_validator_output,
-            {
-                "tier_1_architect": "tier_1_architect",
-                "tier_0_deviation": "tier_0_deviation",
-                END: END,
-            },
-        )
+        # Validator, Dependencies and the tier 3/4 joins route themselves
+        # (blocking issues → Deviation) by returning a Command
 
-        # Tier 1: Architect → Planner
-        graph.add_edge("tier_1_architect", "tier_2_planner")
+        # Tier 1: Architect → Budget Check → Planner
+        graph.add_edge("tier_1_architect", "tier_2_budget_check")
+        graph.add_edge("tier_2_budget_check", "tier_2_planner")
 
         # Tier 2: Planner → Dependencies
         graph.add_edge("tier_2_planner", "tier_2_dependencies")
 
-        # Tier 2: Dependencies → Engineer or Deviation
-        graph.add_conditional_edges(
-            "tier_2_dependencies",
-            self._route_dependencies_output,
-            {
-                "tier_3_engineer": "tier_3_engineer",
-                "tier_0_deviation": "tier_0_deviation",
-                END: END,
-            },
-        )
+        # Tier 2: Dependencies → Budget Check → Engineer
+        graph.add_edge("tier_3_budget_check", "tier_3_engineer")
 
-        # Tier 3: Engineer → Static Analysis
+        # Tier 3: Engineer → Static Analysis and Quality (run in parallel)
         graph.add_edge("tier_3_engineer", "tier_3_static_analysis")
-
-        # Tier 3: Static Analysis → Quality or Deviation
-        graph.add_conditional_edges(
-            "tier_3_static_analysis",
-            self._route_static_analysis_output,
-            {
-                "tier_3_quality": "tier_3_quality",
-                "tier_0_deviation": "tier_0_deviation",
-                END: END,
-            },
-        )
-
-        # Tier 3: Quality → Security or Deviation
-        graph.add_conditional_edges(
-            "tier_3_quality",
-            self._route_quality_output,
-            {
-                "tier_4_security": "tier_4_security",
-                "tier_0_deviation": "tier_0_deviation",
-                END: END,
-            },
-        )
-
-        # Tier 4: Security → Product or Deviation
-        graph.add_conditional_edges(
-            "tier_4_security",
-            self._route_security_output,
-            {
-                "tier_4_product": "tier_4_product",
-                "tier_0_deviation": "tier_0_deviation",
-                END: END,
-            },
-        )
-
-        # Tier 4: Product → Docs or Deviation
-        graph.add_conditional_edges(
-            "tier_4_product",
-            self._route_product_output,
-            {
-                "tier_5_docs": "tier_5_docs",
-                "tier_0_deviation": "tier_0_deviation",
-                END: END,
-            },
-        )
-
-        # Tier 5: Docs → Deployment
-        graph.add_edge("tier_5_docs", "tier_5_deployment")
+        graph.add_edge("tier_3_engineer", "tier_3_quality")
+        graph.add_edge("tier_3_static_analysis", "tier_3_join")
+        graph.add_edge("tier_3_quality", "tier_3_join")
+
+        # Tier 3 → Budget Check → Security and Product (run in parallel)
+        graph.add_edge("tier_4_budget_check", "tier_4_security")
+        graph.add_edge("tier_4_budget_check", "tier_4_product")
+        graph.add_edge("tier_4_security", "tier_4_join")
+        graph.add_edge("tier_4_product", "tier_4_join")
+
+        # Tier 4 → Budget Check → Docs and Deployment (run in parallel)
+        graph.add_edge("tier_5_budget_check", "tier_5_docs")
+        graph.add_edge("tier_5_budget_check", "tier_5_deployment")
+        graph.add_edge("tier_5_docs", "tier_5_join")
+        graph.add_edge("tier_5_deployment", "tier_5_join")
 
         # Tier 0: Deviation Handler → Routed Agent
         graph.add_conditional_edges(
             "tier_0_deviation",
-            self._route_deviation_output,
+            cls._route_deviation_output,
             {
-                # Can route to any tier
-                "tier_1_requirements": "tier_1_requirements",
+                # Can route to any tier; tier entry points pass the budget
+                # check first
+                "tier_1_requirements": "tier_1_budget_check",
                 "tier_1_architect": "tier_1_architect",
-                "tier_2_planner": "tier_2_planner",
-                "tier_3_engineer": "tier_3_engineer",
+                "tier_2_planner": "tier_2_budget_check",
+                "tier_3_engineer": "tier_3_budget_check",
                 "tier_3_static_analysis": "tier_3_static_analysis",
                 "tier_4_security": "tier_4_security",
                 END: END,
@@ -228,206 +404,168 @@ class OrchestrationController:
             BudgetExhaustedError: If budget limits exceeded
             InfiniteLoopDetectedError: If max iterations reached
         """
-        if not self.graph:
-            self.build_graph()
-
-        # Initialize workflow state
-        initial_state: WorkflowState = {
+        # Initialize workflow state from the shared template; containers are
+        # created per call so workflows never share mutable state
+        now_ns = time.time_ns()
+        initial_state: WorkflowState = {  # type: ignore[typeddict-item]
+            **_INITIAL_STATE_TEMPLATE,
             "workflow_id": workflow_id,
             "user_request": user_request,
-            "current_phase": "planning",
-            "current_task": "requirements_analysis",
-            "current_agent": "OrchestrationController",
-            "rejection_count": 0,
-            "state_version": 1,
-            "requirements": "",
-            "architecture": "",
-            "tasks": "",
+            "trace_id": workflow_id,
             "code_files": {},
             "test_files": {},
             "partial_artifacts": {},
-            "validation_report": "",
-            "quality_report": "",
-            "security_report": "",
-            "budget_used_tokens": 0,
-            "budget_used_usd": 0.0,
             "budget_remaining_tokens": self.settings.total_budget_tokens,
             "budget_remaining_usd": self.settings.max_monthly_budget_usd,
+            "agent_token_usage": {},
             "quality_gates_passed": [],
             "blocking_issues": [],
-            "awaiting_human_approval": False,
-            "approval_gate": "",
-            "approval_timeout": "",
             "routing_decision": {},
-            "escalation_flag": False,
-            "trace_id": workflow_id,
-            "dependencies": "",
-            "infrastructure": "",
-            "observability": "",
-            "deviation_log": "",
-            "compliance_log": "",
-            "acceptance_report": "",
-            "agent_token_usage": {},
-            "created_at": datetime.now(UTC).isoformat(),
-            "updated_at": datetime.now(UTC).isoformat(),
+            "created_at_ns": now_ns,
+            "updated_at_ns": now_ns,
         }
 
-        # Execute workflow
-        config: RunnableConfig = {"configurable": {"workflow_id": workflow_id}}
+        # Execute workflow; the budget is checked by graph nodes and the
+        # iteration cap is enforced by LangGraph's recursion limit
+        config: RunnableConfig = {
+            "configurable": {"workflow_id": workflow_id},
+            "recursion_limit": self.max_iterations,
+        }
         final_state = initial_state
 
-        if self.graph is None:
-            raise RuntimeError("Graph not compiled")
-
-        iteration = 0
-        async for state_update in self.graph.astream(initial_state, config):
-            # Extract the actual state from the update
-            if isinstance(state_update, dict):
-                # Get the last key's value which contains the state
-                for key_val in state_update.values():
-                    if isinstance(key_val, dict) and "workflow_id" in key_val:
-                        final_state = key_val  # type: ignore[assignment]
-                        break
-            iteration += 1
-
-            # Check budget
-            if final_state["budget_remaining_tokens"] <= 0:
-                raise BudgetExhaustedError(
-                    budget_type="tokens",
-                    limit=self.settings.total_budget_tokens,
-                    requested=final_state["budget_used_tokens"],
-                )
-
-            # Check iterations
-            if iteration >= self.max_iterations:
-                raise InfiniteLoopDetectedError(
-                    agent_name=final_state["current_agent"],
-                    max_iterations=self.max_iterations,
-                    current_state=final_state["current_phase"],
-                )
+        current_phase = initial_state["current_phase"]
+        try:
+            async for state_update in self.graph.astream(
+                initial_state, config, stream_mode="values"
+            ):
+                final_state = state_update
+
+                # Phases map to tiers, so a phase change is a tier boundary
+                if (
+                    self.checkpoint_mode == "tier_boundary"
+                    and final_state["current_phase"] != current_phase
+                ):
+                    await self._flush_checkpoints(workflow_id)
+                    current_phase = final_state["current_phase"]
+        except GraphRecursionError as e:
+            raise InfiniteLoopDetectedError(
+                agent_name=final_state["current_agent"],
+                max_iterations=self.max_iterations,
+                current_state=final_state["current_phase"],
+            ) from e
+        finally:
+            # Persist the state the workflow stopped in, however it stopped
+            await self._flush_checkpoints(workflow_id, release=True)
 
         return final_state
 
+    async def _flush_checkpoints(self, workflow_id: str, release: bool = False) -> None:
+        """Write buffered checkpoints (no-op in "per_node" mode).
+
+        Args:
+            workflow_id: Workflow (thread) whose checkpoints to write
+            release: Drop whatever is still buffered for the workflow after
+                this flush, even if the write failed. Set once the run is
+                over, since the checkpointer outlives it.
+        """
+        if not isinstance(self.checkpointer, BufferedCheckpointer):
+            return
+        try:
+            await self.checkpointer.flush(workflow_id)
+        finally:
+            if release:
+                self.checkpointer.discard(workflow_id)
+
     # Tier node implementations (stubs for Phase 2)
     # Full implementations will be added in Phase 3
 
-    async def _tier_0_deviation_handler(self, state: WorkflowState) -> WorkflowState:
-        """Tier 0: Deviation Handler node (stub)."""
-        state["current_agent"] = "DeviationHandler"
-        return state
-
-    async def _tier_1_requirements(self, state: WorkflowState) -> WorkflowState:
-        """Tier 1: Requirements & Strategy node (stub)."""
-        state["current_agent"] = "RequirementsStrategy"
-        state["current_phase"] = "planning"
-        return state
-
-    async def _tier_1_validator(self, state: WorkflowState) -> WorkflowState:
-        """Tier 1: Strategy Validator node (stub)."""
-        state["current_agent"] = "StrategyValidator"
-        return state
-
-    async def _tier_1_architect(self, state: WorkflowState) -> WorkflowState:
-        """Tier 1: Solution Architect node (stub)."""
-        state["current_agent"] = "SolutionArchitect"
-        return state
-
-    async def _tier_2_planner(self, state: WorkflowState) -> WorkflowState:
-        """Tier 2: Implementation Planner node (stub)."""
-        state["current_agent"] = "ImplementationPlanner"
-        state["current_phase"] = "preparation"
-        return state
-
-    async def _tier_2_dependencies(self, state: WorkflowState) -> WorkflowState:
-        """Tier 2: Dependency Resolver node (stub)."""
-        state["current_agent"] = "DependencyResolver"
-        return state
-
-    async def _tier_3_engineer(self, state: WorkflowState) -> WorkflowState:
-        """Tier 3: Software Engineer node (stub)."""
-        state["current_agent"] = "SoftwareEngineer"
-        state["current_phase"] = "development"
-        return state
-
-    async def _tier_3_static_analysis(self, state: WorkflowState) -> WorkflowState:
-        """Tier 3: Static Analysis node (stub)."""
-        state["current_agent"] = "StaticAnalysisAgent"
-        return state
-
-    async def _tier_3_quality(self, state: WorkflowState) -> WorkflowState:
-        """Tier 3: Quality Engineer node (stub)."""
-        state["current_agent"] = "QualityEngineer"
-        return state
-
-    async def _tier_4_security(self, state: WorkflowState) -> WorkflowState:
-        """Tier 4: Security Validator node (stub)."""
-        state["current_agent"] = "SecurityValidator"
-        state["current_phase"] = "validation"
-        return state
-
-    async def _tier_4_product(self, state: WorkflowState) -> WorkflowState:
-        """Tier 4: Product Validator node (stub)."""
-        state["current_agent"] = "ProductValidator"
-        return state
-
-    async def _tier_5_docs(self, state: WorkflowState) -> WorkflowState:
-        """Tier 5: Documentation Agent node (stub)."""
-        state["current_agent"] = "DocumentationAgent"
-        state["current_phase"] = "delivery"
-        return state
-
-    async def _tier_5_deployment(self, state: WorkflowState) -> WorkflowState:
-        """Tier 5: Deployment Agent node (stub)."""
-        state["current_agent"] = "DeploymentAgent"
-        state["current_phase"] = "completed"
-        return state
+    @staticmethod
+    async def _tier_0_deviation_handler(_state: WorkflowState) -> dict[str, Any]:
+        """Tier 0: Deviation Handler node (stub), takes over the blocking issues.
+
+        Clears them so the routed-to agent's gate decides afresh; issues
+        that still apply are reported again on the next pass.
+        """
+        return {
+            "current_agent": AGENT_DEVIATION_HANDLER,
+            "blocking_issues": ResetList(),
+        }
+
+    # Tier 1-5 agent nodes: record which agent ran (and the phase it starts)
+    _tier_1_requirements = staticmethod(_tier_node(AGENT_REQUIREMENTS, PHASE_PLANNING))
+    _tier_1_architect = staticmethod(_tier_node(AGENT_ARCHITECT))
+    _tier_2_planner = staticmethod(_tier_node(AGENT_PLANNER, PHASE_PREPARATION))
+    _tier_3_engineer = staticmethod(_tier_node(AGENT_ENGINEER, PHASE_DEVELOPMENT))
+    _tier_3_static_analysis = staticmethod(_tier_node(AGENT_STATIC_ANALYSIS))
+    _tier_3_quality = staticmethod(_tier_node(AGENT_QUALITY))
+    _tier_4_security = staticmethod(_tier_node(AGENT_SECURITY, PHASE_VALIDATION))
+    _tier_4_product = staticmethod(_tier_node(AGENT_PRODUCT))
+    _tier_5_docs = staticmethod(_tier_node(AGENT_DOCUMENTATION, PHASE_DELIVERY))
+    _tier_5_deployment = staticmethod(_tier_node(AGENT_DEPLOYMENT, PHASE_COMPLETED))
+
+    # Routing nodes: blocking issues go to the deviation handler
+
+    @staticmethod
+    async def _tier_1_validator(state: WorkflowState) -> Command[str]:
+        """Tier 1: Strategy Validator node (stub), routes to Architect."""
+        return _route_blocking(
+            state, "tier_1_architect", {"current_agent": AGENT_STRATEGY_VALIDATOR}
+        )
+
+    @staticmethod
+    async def _tier_2_dependencies(state: WorkflowState) -> Command[str]:
+        """Tier 2: Dependency Resolver node (stub), routes to Engineer."""
+        return _route_blocking(
+            state, "tier_3_budget_check", {"current_agent": AGENT_DEPENDENCIES}
+        )
+
+    # Join nodes: run once after both parallel branches of a tier finish
+
+    @staticmethod
+    async def _tier_3_join(state: WorkflowState) -> Command[str]:
+        """Tier 3: Join after Static Analysis and Quality, routes to tier 4."""
+        return _route_blocking(state, "tier_4_budget_check")
+
+    @staticmethod
+    async def _tier_4_join(state: WorkflowState) -> Command[str]:
+        """Tier 4: Join after Security and Product validation, routes to tier 5."""
+        return _route_blocking(state, "tier_5_budget_check")
+
+    # Both branches set the phase in the same step; settle on completed
+    _tier_5_join = staticmethod(_tier_node(AGENT_DEPLOYMENT, PHASE_COMPLETED))
 
     # Routing functions (stubs for Phase 2)
     # Full logic will be added in Phase 3
 
-    def _route_validator_output(self, state: WorkflowState) -> str:
-        """Route Strategy Validator output."""
-        if state.get("blocking_issues"):
-            return "tier_0_deviation"
-        return "tier_1_architect"
-
-    def _route_dependencies_output(self, state: WorkflowState) -> str:
-        """Route Dependency Resolver output."""
-        if state.get("blocking_issues"):
-            return "tier_0_deviation"
-        return "tier_3_engineer"
-
-    def _route_static_analysis_output(self, state: WorkflowState) -> str:
-        """Route Static Analysis output."""
-        if state.get("blocking_issues"):
-            return "tier_0_deviation"
-        return "tier_3_quality"
-
-    def _route_quality_output(self, state: WorkflowState) -> str:
-        """Route Quality Engineer output."""
-        if state.get("blocking_issues"):
-            return "tier_0_deviation"
-        return "tier_4_security"
-
-    def _route_security_output(self, state: WorkflowState) -> str:
-        """Route Security Validator output."""
-        if state.get("blocking_issues"):
-            return "tier_0_deviation"
-        return "tier_4_product"
-
-    def _route_product_output(self, state: WorkflowState) -> str:
-        """Route Product Validator output."""
-        if state.get("blocking_issues"):
-            return "tier_0_deviation"
-        return "tier_5_docs"
-
-    def _route_deviation_output(self, state: WorkflowState) -> str:
-        """Route Deviation Handler output to target agent."""
-        routing = state.get("routing_decision", {})
-        target_agent = routing.get("target_agent", "tier_1_requirements")
-
-        # Check for escalation or max iterations
-        if state.get("escalation_flag") or state["rejection_count"] >= 3:
+    @staticmethod
+    def _route_deviation_output(state: WorkflowState) -> str:
+        """Route Deviation Handler output to target agent.
+
+        Unknown targets restart at Requirements instead of failing the
+        graph after the deviation handler has run.
+        """
+        # Check for max iterations or escalation
+        if state["rejection_count"] >= 3 or state.get("escalation_flag"):
             return END
 
-        return target_agent
+        target_agent = state.get("routing_decision", {}).get("target_agent")
+        if target_agent in _DEVIATION_TARGETS:
+            return target_agent
+        return "tier_1_requirements"
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_graph(total_budget_tokens: int) -> CompiledStateGraph:
+    """Compile the workflow graph once per token budget.
+
+    Compiled without a checkpointer; controllers attach theirs to a copy,
+    so cached graphs never keep a checkpoint manager (and its database
+    pool) alive.
+
+    Args:
+        total_budget_tokens: Token budget enforced by the budget checks
+
+    Returns:
+        Compiled StateGraph shared by controllers with the same budget
+    """
+    return OrchestrationController._compile_graph(None, total_budget_tokens)
@@ -5,8 +5,88 @@ Single source of truth for workflow state managed by LangGraph.
 All agents read from and write to this shared state schema.
 """
 
-from datetime import UTC, datetime
-from typing import Any, Literal, NotRequired, TypedDict
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, Any, Literal, NotRequired, Self, TypedDict, cast
+
+
+# (integer field, ISO 8601 field) pairs for the state timestamps
+_TIMESTAMP_FIELDS: tuple[tuple[str, str], ...] = (
+    ("created_at_ns", "created_at"),
+    ("updated_at_ns", "updated_at"),
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def merge_token_usage(
+    current: dict[str, int],
+    update: dict[str, int],
+) -> dict[str, int]:
+    """
+    Merge per-agent token usage (LangGraph channel reducer).
+
+    Updates carry the new running total for each agent they mention, so
+    nodes can return just the agents they changed. Returning the full
+    mapping (as nodes passing the whole state through do) is idempotent.
+
+    Args:
+        current: Current per-agent token usage
+        update: Agents whose usage changed, with their new totals
+
+    Returns:
+        dict[str, int]: Merged per-agent token usage
+    """
+    return {**current, **update}
+
+
+class ResetList(list[str]):
+    """
+    List update that replaces a merge_unique() channel instead of adding to it.
+
+    A plain list (even an empty one) only ever adds items, so a node that
+    handles the items, such as the deviation handler, returns
+    ``{"blocking_issues": ResetList()}`` to clear them.
+    """
+
+
+def merge_unique(current: list[str], update: list[str]) -> list[str]:
+    """
+    Append new list items (LangGraph channel reducer).
+
+    Lets nodes running in the same step (e.g. static analysis and quality)
+    both append to a list such as blocking_issues. Items already present
+    are not repeated, so returning the full list again is idempotent. A
+    ResetList update replaces the list instead.
+
+    Args:
+        current: Current items
+        update: Items reported by a node
+
+    Returns:
+        list[str]: Current items followed by any new ones
+    """
+    if isinstance(update, ResetList):
+        return list(update)
+    new_items = [item for item in update if item not in current]
+    return current + new_items if new_items else current
+
+
+def keep_last(current: Any, update: Any) -> Any:  # noqa: ARG001
+    """
+    Keep the most recent value (LangGraph channel reducer).
+
+    Unlike a plain channel, accepts writes from several nodes running in the
+    same step; they are applied in node order and the last one wins.
+
+    Args:
+        current: Current value
+        update: New value
+
+    Returns:
+        Any: The new value
+    """
+    return update
 
 
 class WorkflowState(TypedDict):
@@ -21,6 +101,9 @@ class WorkflowState(TypedDict):
     - Write: Generated artifacts, updated metrics, routing decisions
 
     State updates are atomic and versioned to prevent race conditions.
+
+    NotRequired fields are absent until a node sets them; initial states
+    carry only the required keys rather than empty placeholders.
     """
 
     # ========== Workflow Identity ==========
@@ -29,18 +112,21 @@ class WorkflowState(TypedDict):
     trace_id: str  # Distributed tracing ID
 
     # ========== Execution State ==========
-    current_phase: Literal[
-        "planning",  # Tier 1: Requirements → Architecture
-        "preparation",  # Tier 2: Tasks → Dependencies → Infrastructure
-        "development",  # Tier 3: Code → Tests
-        "validation",  # Tier 4: Security → Product validation
-        "delivery",  # Tier 5: Documentation → Deployment
-        "completed",  # Workflow finished successfully
-        "failed",  # Workflow failed (unrecoverable error)
-        "paused",  # Awaiting human approval
+    current_phase: Annotated[
+        Literal[
+            "planning",  # Tier 1: Requirements → Architecture
+            "preparation",  # Tier 2: Tasks → Dependencies → Infrastructure
+            "development",  # Tier 3: Code → Tests
+            "validation",  # Tier 4: Security → Product validation
+            "delivery",  # Tier 5: Documentation → Deployment
+            "completed",  # Workflow finished successfully
+            "failed",  # Workflow failed (unrecoverable error)
+            "paused",  # Awaiting human approval
+        ],
+        keep_last,
     ]
     current_task: str  # Current task being executed (e.g., "TASK-011")
-    current_agent: str  # Agent currently executing (e.g., "software_engineer")
+    current_agent: Annotated[str, keep_last]  # Agent currently executing
     rejection_count: int  # Number of times any agent has been rejected
     state_version: int  # Optimistic locking version (incremented on each update)
 
@@ -76,11 +162,17 @@ class WorkflowState(TypedDict):
     budget_remaining_usd: float  # Remaining cost budget
 
     # Per-agent token usage (for cost breakdown visualization)
-    agent_token_usage: dict[str, int]  # {agent_name: tokens_consumed}
+    agent_token_usage: Annotated[
+        dict[str, int], merge_token_usage
+    ]  # {agent_name: tokens_consumed}
 
     # ========== Quality Gates ==========
-    quality_gates_passed: list[str]  # ["tier_1_planning", "tier_2_preparation", ...]
-    blocking_issues: list[str]  # Critical issues preventing progression
+    quality_gates_passed: Annotated[
+        list[str], merge_unique
+    ]  # ["tier_1_planning", "tier_2_preparation", ...]
+    blocking_issues: Annotated[
+        list[str], merge_unique
+    ]  # Critical issues preventing progression (cleared with ResetList)
 
     # ========== Human Approval ==========
     awaiting_human_approval: bool  # Is workflow paused for human approval?
@@ -92,8 +184,10 @@ class WorkflowState(TypedDict):
     escalation_flag: bool  # Has workflow been escalated to human?
 
     # ========== Checkpoint Management ==========
-    checkpoint_id: NotRequired[str]  # Current checkpoint ID (optional)
+    current_checkpoint_id: NotRequired[str]  # Current checkpoint ID (optional)
     previous_checkpoint_id: NotRequired[str]  # Previous checkpoint (for rollback)
+    # Artifact fields moved to artifact storage: {field: artifact_path}
+    artifact_refs: NotRequired[dict[str, str]]
 
     # ========== Additional State (Dynamic) ==========
     tool_results: NotRequired[dict[str, dict[str, Any]]]  # Static analysis tool results
@@ -109,8 +203,12 @@ class WorkflowState(TypedDict):
     escalation_timestamp: NotRequired[str]  # Escalation timestamp
 
     # ========== Timestamps ==========
-    created_at: str  # ISO 8601 workflow creation time
-    updated_at: str  # ISO 8601 last update time
+    # Kept as time.time_ns() integers; ISO strings are only built on the way
+    # out (see as_api_dict)
+    created_at_ns: int  # Workflow creation time (ns since epoch)
+    updated_at_ns: int  # Last update time (ns since epoch)
+    created_at: NotRequired[str]  # ISO 8601 workflow creation time
+    updated_at: NotRequired[str]  # ISO 8601 last update time
     completed_at: NotRequired[str]  # ISO 8601 completion time (if completed)
 
 
@@ -130,7 +228,7 @@ def create_initial_state(
     Returns:
         WorkflowState: Initial state for new workflow
     """
-    now = datetime.now(UTC).isoformat()
+    now_ns = time.time_ns()
 
     return {
         # Workflow Identity
@@ -178,28 +276,28 @@ def create_initial_state(
         "routing_decision": {},
         "escalation_flag": False,
         # Timestamps
-        "created_at": now,
-        "updated_at": now,
+        "created_at_ns": now_ns,
+        "updated_at_ns": now_ns,
     }
 
 
-def increment_rejection_count(state: WorkflowState) -> WorkflowState:
+def increment_rejection_count(state: WorkflowState) -> dict[str, Any]:
     """
     Atomic increment of rejection count.
 
     This is a LangGraph reducer function for safely incrementing rejection count.
+    Only the changed keys are returned; LangGraph merges them into the state.
 
     Args:
         state: Current workflow state
 
     Returns:
-        WorkflowState: Updated state with incremented rejection count
+        dict[str, Any]: State update with incremented rejection count
     """
     return {
-        **state,
         "rejection_count": state["rejection_count"] + 1,
         "state_version": state["state_version"] + 1,
-        "updated_at": datetime.now(UTC).isoformat(),
+        "updated_at_ns": time.time_ns(),
     }
 
 
@@ -208,10 +306,13 @@ def update_budget(
     tokens_consumed: int,
     cost_usd: float,
     agent_name: str,
-) -> WorkflowState:
+) -> dict[str, Any]:
     """
     Update budget tracking.
 
+    Only the changed keys are returned; agent_token_usage holds just this
+    agent's new total and is merged by merge_token_usage().
+
     Args:
         state: Current workflow state
         tokens_consumed: Tokens consumed by this operation
@@ -219,21 +320,145 @@ def update_budget(
         agent_name: Name of agent that consumed tokens
 
     Returns:
-        WorkflowState: Updated state with budget tracking
+        dict[str, Any]: State update with budget tracking
     """
-    # Update per-agent token usage
-    agent_token_usage = state["agent_token_usage"].copy()
-    agent_token_usage[agent_name] = (
-        agent_token_usage.get(agent_name, 0) + tokens_consumed
-    )
+    agent_tokens = state["agent_token_usage"].get(agent_name, 0) + tokens_consumed
 
     return {
-        **state,
         "budget_used_tokens": state["budget_used_tokens"] + tokens_consumed,
         "budget_used_usd": state["budget_used_usd"] + cost_usd,
         "budget_remaining_tokens": state["budget_remaining_tokens"] - tokens_consumed,
         "budget_remaining_usd": state["budget_remaining_usd"] - cost_usd,
-        "agent_token_usage": agent_token_usage,
+        "agent_token_usage": {agent_name: agent_tokens},
         "state_version": state["state_version"] + 1,
-        "updated_at": datetime.now(UTC).isoformat(),
+        "updated_at_ns": time.time_ns(),
     }
+
+
+class BudgetAccumulator:
+    """
+    Collect a node's LLM usage into a single budget update.
+
+    Tier nodes make several LLM calls; adding each call here and returning
+    finalize() once at node exit replaces one update_budget() delta per
+    call with a single state write.
+
+    Example:
+        async with BudgetAccumulator(state, "SoftwareEngineer") as acc:
+            acc.add(tokens, cost_usd)
+        return acc.finalize()
+    """
+
+    def __init__(self, state: WorkflowState, agent_name: str) -> None:
+        """
+        Initialize accumulator.
+
+        Args:
+            state: Workflow state at node entry
+            agent_name: Name of agent consuming tokens
+        """
+        self.state = state
+        self.agent_name = agent_name
+        self.total_tokens = 0
+        self.total_cost_usd = 0.0
+        self.calls = 0
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def add(self, tokens: int, cost_usd: float) -> None:
+        """
+        Record usage of one LLM call.
+
+        Args:
+            tokens: Tokens consumed by the call
+            cost_usd: Cost of the call in USD
+        """
+        self.total_tokens += tokens
+        self.total_cost_usd += cost_usd
+        self.calls += 1
+
+    def finalize(self) -> dict[str, Any]:
+        """
+        Build the node's budget update.
+
+        Returns:
+            dict[str, Any]: update_budget() delta for all recorded calls,
+                or an empty update if nothing was recorded
+        """
+        if not self.calls:
+            return {}
+        return update_budget(
+            self.state, self.total_tokens, self.total_cost_usd, self.agent_name
+        )
+
+
+def format_timestamp_ns(timestamp_ns: int) -> str:
+    """
+    Format a time.time_ns() timestamp as ISO 8601 (UTC).
+
+    Args:
+        timestamp_ns: Nanoseconds since the epoch
+
+    Returns:
+        str: ISO 8601 timestamp
+    """
+    return datetime.fromtimestamp(timestamp_ns / 1e9, UTC).isoformat()
+
+
+def parse_timestamp_ns(timestamp: str) -> int:
+    """
+    Parse an ISO 8601 timestamp into a time.time_ns() value.
+
+    Args:
+        timestamp: ISO 8601 timestamp (naive values are taken as UTC)
+
+    Returns:
+        int: Nanoseconds since the epoch
+    """
+    parsed = datetime.fromisoformat(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return (parsed - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def upgrade_timestamps(state: WorkflowState) -> WorkflowState:
+    """
+    Fill in integer timestamps on a state checkpointed before they existed.
+
+    Older checkpoints carry only the created_at/updated_at ISO strings; the
+    matching *_ns fields are derived from them, in place.
+
+    Args:
+        state: Workflow state as loaded from a checkpoint
+
+    Returns:
+        WorkflowState: The same state
+    """
+    fields = cast(dict[str, Any], state)
+    for ns_key, iso_key in _TIMESTAMP_FIELDS:
+        if ns_key not in fields and fields.get(iso_key):
+            fields[ns_key] = parse_timestamp_ns(fields[iso_key])
+    return state
+
+
+def as_api_dict(state: WorkflowState) -> dict[str, Any]:
+    """
+    Copy workflow state for egress, with ISO 8601 timestamps filled in.
+
+    Legacy states without integer timestamps keep their ISO strings.
+
+    Args:
+        state: Workflow state
+
+    Returns:
+        dict[str, Any]: State copy including created_at and updated_at
+    """
+    api_state: dict[str, Any] = dict(state)
+    for ns_key, iso_key in _TIMESTAMP_FIELDS:
+        if ns_key in api_state:
+            api_state[iso_key] = format_timestamp_ns(api_state[ns_key])
+    return api_state
@@ -8,11 +8,22 @@ Implements async operations for uploading, downloading, and listing artifacts.
 from __future__ import annotations
 
 import asyncio
+import functools
+import gzip
 import io
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from itertools import islice
+from typing import Any, BinaryIO
 
+import certifi
 import structlog
+import urllib3
 from minio import Minio
+from minio.deleteobjects import DeleteError, DeleteObject
 from minio.error import S3Error
 
 from src.config import settings
@@ -21,6 +32,87 @@ from src.exceptions import StorageError
 
 logger = structlog.get_logger(__name__)
 
+# Objects fetched per list request (the S3 maximum)
+_LIST_PAGE_SIZE = 1000
+
+# Default transfers in flight for the multi-artifact helpers; throughput
+# stops improving beyond this
+_TRANSFER_CONCURRENCY = 8
+
+# Bytes read per chunk when streaming a download into a sink
+_DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Text artifacts stored gzip-compressed (Content-Encoding: gzip); smaller
+# payloads are not worth the gzip header overhead
+_COMPRESSIBLE_TYPES = ("text/", "application/json", "application/xml")
+_COMPRESSIBLE_SUFFIXES = (".py", ".md", ".log", ".json")
+_COMPRESS_MIN_BYTES = 1024
+_COMPRESS_LEVEL = 1
+
+# (endpoint, bucket) pairs already verified to exist in this process
+_checked_buckets: set[tuple[str, str]] = set()
+
+# (bucket, object_name) -> (etag, content), least recently used first.
+# Shared by every ArtifactStorage so settings.artifact_cache_max_bytes
+# bounds the whole process, not each instance.
+_download_cache: OrderedDict[tuple[str, str], tuple[str, bytes]] = OrderedDict()
+_download_cache_bytes = 0
+
+
+@functools.lru_cache(maxsize=1)
+def _http_pool() -> urllib3.PoolManager:
+    """
+    Return the connection pool shared by every MinIO client in the process.
+
+    Mirrors the MinIO client's own defaults apart from the pool size, so
+    connections stay alive across ArtifactStorage instances instead of
+    each instance paying its own TCP and TLS handshakes.
+    """
+    timeout = timedelta(minutes=5).seconds
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        maxsize=settings.minio_max_connections,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
+
+
+def _is_compressible(object_name: str, content_type: str, size: int) -> bool:
+    """
+    Check whether an artifact should be stored gzip-compressed.
+
+    Args:
+        object_name: Full object name
+        content_type: MIME type of the content
+        size: Uncompressed size in bytes
+
+    Returns:
+        True for text artifacts of at least _COMPRESS_MIN_BYTES
+    """
+    return size >= _COMPRESS_MIN_BYTES and (
+        content_type.startswith(_COMPRESSIBLE_TYPES)
+        or object_name.endswith(_COMPRESSIBLE_SUFFIXES)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _io_executor() -> ThreadPoolExecutor:
+    """
+    Return the thread pool that runs blocking MinIO calls.
+
+    Kept separate from the event loop's default executor so artifact I/O
+    neither starves nor is starved by other blocking work, and capped
+    because S3 throughput regresses past roughly 16 concurrent requests.
+    """
+    return ThreadPoolExecutor(
+        max_workers=settings.minio_io_workers, thread_name_prefix="minio-io"
+    )
+
 
 class ArtifactStorage:
     """
@@ -30,16 +122,49 @@ class ArtifactStorage:
     including generated code, reports, and logs.
     """
 
-    def __init__(self) -> None:
-        """Initialize MinIO client with configuration from settings."""
+    def __init__(self, ensure_bucket: bool = True) -> None:
+        """
+        Initialize MinIO client with configuration from settings.
+
+        The bucket is checked (and created if missing) only by the first
+        instance per process; later instances skip the round-trip.
+
+        Args:
+            ensure_bucket: Set False to skip the bucket check entirely when
+                the bucket is known to exist
+        """
         self.client = Minio(
             endpoint=settings.minio_endpoint,
             access_key=settings.minio_access_key,
             secret_key=settings.minio_secret_key,
             secure=settings.minio_secure,
+            region=settings.minio_region,
+            http_client=_http_pool(),
         )
         self.bucket_name = settings.minio_bucket
-        self._ensure_bucket()
+        self._executor = _io_executor()
+
+        bucket_key = (settings.minio_endpoint, self.bucket_name)
+        if ensure_bucket and bucket_key not in _checked_buckets:
+            self._ensure_bucket()
+            _checked_buckets.add(bucket_key)
+
+    async def _run(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking call on the MinIO I/O thread pool.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The result of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
 
     def _ensure_bucket(self) -> None:
         """
@@ -66,6 +191,41 @@ class ArtifactStorage:
             )
             raise StorageError(f"Failed to create bucket: {e}") from e
 
+    def _put_bytes(self, object_name: str, content: bytes, content_type: str) -> int:
+        """
+        Upload bytes, compressing text artifacts first (blocking).
+
+        Compressed objects are stored with Content-Encoding: gzip, which the
+        HTTP layer decodes on download, so readers get the original bytes
+        back both through this class and through presigned URLs.
+
+        Args:
+            object_name: Full object name
+            content: Artifact content
+            content_type: MIME type of the content
+
+        Returns:
+            Number of bytes stored
+        """
+        metadata = None
+        if _is_compressible(object_name, content_type, len(content)):
+            compressed = gzip.compress(content, compresslevel=_COMPRESS_LEVEL, mtime=0)
+            if len(compressed) < len(content):
+                content = compressed
+                metadata = {"Content-Encoding": "gzip"}
+
+        # Payloads larger than one part are sent as parallel multipart parts
+        self.client.put_object(
+            bucket_name=self.bucket_name,
+            object_name=object_name,
+            data=io.BytesIO(content),
+            length=len(content),
+            content_type=content_type,
+            metadata=metadata,
+            part_size=settings.minio_part_size_bytes,
+        )
+        return len(content)
+
     async def upload_artifact(
         self,
         workflow_id: str,
@@ -76,6 +236,9 @@ class ArtifactStorage:
         """
         Upload an artifact to MinIO.
 
+        Text artifacts (text/*, JSON, XML, or .py/.md/.log/.json paths) are
+        stored gzip-compressed and decompressed transparently on download.
+
         Args:
             workflow_id: Workflow identifier for organizing artifacts
             artifact_path: Relative path within workflow (e.g., 'code/main.py')
@@ -98,35 +261,93 @@ class ArtifactStorage:
             ... )
         """
         object_name = f"{workflow_id}/{artifact_path}"
+        self._forget_download(object_name)
 
         # Convert string to bytes if needed
         content_bytes = content.encode("utf-8") if isinstance(content, str) else content
 
-        content_stream = io.BytesIO(content_bytes)
-        content_length = len(content_bytes)
+        try:
+            # Run blocking compression and MinIO operation in thread pool
+            stored_bytes = await self._run(
+                self._put_bytes, object_name, content_bytes, content_type
+            )
+
+            logger.info(
+                "artifact.uploaded",
+                workflow_id=workflow_id,
+                artifact_path=artifact_path,
+                size_bytes=len(content_bytes),
+                stored_bytes=stored_bytes,
+                content_type=content_type,
+            )
+
+            return object_name
+
+        except S3Error as e:
+            logger.error(
+                "artifact.upload_failed",
+                workflow_id=workflow_id,
+                artifact_path=artifact_path,
+                error=str(e),
+            )
+            raise StorageError(f"Failed to upload artifact: {e}") from e
+
+    async def upload_artifact_file(
+        self,
+        workflow_id: str,
+        artifact_path: str,
+        file_path: str,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """
+        Upload an artifact from a local file.
+
+        The file is streamed from disk part by part instead of being read
+        into memory first.
+
+        Args:
+            workflow_id: Workflow identifier for organizing artifacts
+            artifact_path: Relative path within workflow (e.g., 'logs/run.log')
+            file_path: Local file to upload
+            content_type: MIME type of the content
+
+        Returns:
+            Full object path in MinIO (workflow_id/artifact_path)
+
+        Raises:
+            StorageError: If upload fails
+
+        Example:
+            >>> storage = ArtifactStorage()
+            >>> path = await storage.upload_artifact_file(
+            ...     "wf-001", "logs/execution.log", "/tmp/execution.log"
+            ... )
+        """
+        object_name = f"{workflow_id}/{artifact_path}"
+        self._forget_download(object_name)
 
         try:
             # Run blocking MinIO operation in thread pool
-            await asyncio.to_thread(
-                self.client.put_object,
+            await self._run(
+                self.client.fput_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
-                data=content_stream,
-                length=content_length,
+                file_path=file_path,
                 content_type=content_type,
+                part_size=settings.minio_part_size_bytes,
             )
 
             logger.info(
                 "artifact.uploaded",
                 workflow_id=workflow_id,
                 artifact_path=artifact_path,
-                size_bytes=content_length,
+                file_path=file_path,
                 content_type=content_type,
             )
 
             return object_name
 
-        except S3Error as e:
+        except (S3Error, OSError) as e:
             logger.error(
                 "artifact.upload_failed",
                 workflow_id=workflow_id,
@@ -135,10 +356,75 @@ class ArtifactStorage:
             )
             raise StorageError(f"Failed to upload artifact: {e}") from e
 
+    def _read_object(self, object_name: str) -> tuple[str, bytes]:
+        """
+        Fetch an object's full content (blocking).
+
+        The request, body read and connection release all happen in the
+        calling thread, so a download costs one executor hop and never
+        blocks the event loop on socket reads.
+
+        Args:
+            object_name: Full object name
+
+        Returns:
+            (etag, content) for the object
+        """
+        response = self.client.get_object(
+            bucket_name=self.bucket_name,
+            object_name=object_name,
+        )
+        try:
+            etag = str(response.headers.get("ETag", "")).strip('"')
+            return etag, response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _object_etag(self, object_name: str) -> str:
+        """
+        Fetch an object's current ETag with a HEAD request (blocking).
+
+        Args:
+            object_name: Full object name
+
+        Returns:
+            ETag of the object
+        """
+        stat = self.client.stat_object(
+            bucket_name=self.bucket_name,
+            object_name=object_name,
+        )
+        return str(stat.etag).strip('"')
+
+    def _remember_download(self, object_name: str, etag: str, content: bytes) -> None:
+        """Cache downloaded content by ETag (LRU-bounded by total bytes)."""
+        global _download_cache_bytes
+        max_bytes = settings.artifact_cache_max_bytes
+        if not etag or len(content) > max_bytes:
+            return
+        self._forget_download(object_name)
+        _download_cache[(self.bucket_name, object_name)] = (etag, content)
+        _download_cache_bytes += len(content)
+        while _download_cache_bytes > max_bytes:
+            _, (_, evicted) = _download_cache.popitem(last=False)
+            _download_cache_bytes -= len(evicted)
+
+    def _forget_download(self, object_name: str) -> None:
+        """Drop an object from the download cache, if present."""
+        global _download_cache_bytes
+        entry = _download_cache.pop((self.bucket_name, object_name), None)
+        if entry is not None:
+            _download_cache_bytes -= len(entry[1])
+
     async def download_artifact(self, workflow_id: str, artifact_path: str) -> bytes:
         """
         Download an artifact from MinIO.
 
+        Recently downloaded artifacts are kept in memory. A repeat download
+        only sends a HEAD request and returns the cached bytes while the
+        ETag is unchanged.
+
         Args:
             workflow_id: Workflow identifier
             artifact_path: Relative path within workflow
@@ -159,22 +445,32 @@ class ArtifactStorage:
         object_name = f"{workflow_id}/{artifact_path}"
 
         try:
-            # Run blocking MinIO operation in thread pool
-            response = await asyncio.to_thread(
-                self.client.get_object,
-                bucket_name=self.bucket_name,
-                object_name=object_name,
-            )
-
-            content = response.read()
-            response.close()
-            response.release_conn()
+            # Run blocking MinIO operations in thread pool
+            cache_key = (self.bucket_name, object_name)
+            cached = _download_cache.get(cache_key)
+            if cached is not None:
+                cached_etag, cached_content = cached
+                if await self._run(self._object_etag, object_name) == cached_etag:
+                    if cache_key in _download_cache:
+                        _download_cache.move_to_end(cache_key)
+                    logger.info(
+                        "artifact.downloaded",
+                        workflow_id=workflow_id,
+                        artifact_path=artifact_path,
+                        size_bytes=len(cached_content),
+                        cached=True,
+                    )
+                    return cached_content
+
+            etag, content = await self._run(self._read_object, object_name)
+            self._remember_download(object_name, etag, content)
 
             logger.info(
                 "artifact.downloaded",
                 workflow_id=workflow_id,
                 artifact_path=artifact_path,
                 size_bytes=len(content),
+                cached=False,
             )
 
             return content
@@ -188,50 +484,235 @@ class ArtifactStorage:
             )
             raise StorageError(f"Failed to download artifact: {e}") from e
 
-    async def list_artifacts(self, workflow_id: str) -> list[str]:
+    def _stream_object(self, object_name: str, sink: BinaryIO, chunk_size: int) -> int:
         """
-        List all artifacts for a workflow.
+        Copy an object into a sink chunk by chunk (blocking).
+
+        Args:
+            object_name: Full object name
+            sink: Writable binary file object
+            chunk_size: Bytes read per chunk
+
+        Returns:
+            Number of bytes written
+        """
+        response = self.client.get_object(
+            bucket_name=self.bucket_name,
+            object_name=object_name,
+        )
+        size = 0
+        try:
+            for chunk in response.stream(amt=chunk_size):
+                sink.write(chunk)
+                size += len(chunk)
+        finally:
+            response.close()
+            response.release_conn()
+        return size
+
+    async def download_artifact_to(
+        self,
+        workflow_id: str,
+        artifact_path: str,
+        sink: BinaryIO,
+        chunk_size: int = _DOWNLOAD_CHUNK_SIZE,
+    ) -> int:
+        """
+        Download an artifact into a caller-provided sink.
+
+        The object is streamed in chunks, so at most one chunk is held in
+        memory regardless of artifact size.
 
         Args:
             workflow_id: Workflow identifier
+            artifact_path: Relative path within workflow
+            sink: Writable binary file object (e.g. an open file)
+            chunk_size: Bytes read per chunk (default: 4 MiB)
 
         Returns:
-            List of artifact paths (relative to workflow_id)
+            Number of bytes written to the sink
 
         Raises:
-            StorageError: If listing fails
+            StorageError: If download fails or artifact not found
 
         Example:
             >>> storage = ArtifactStorage()
-            >>> artifacts = await storage.list_artifacts("wf-001")
-            >>> print(artifacts)
-            ['code/main.py', 'reports/VALIDATION_REPORT.md']
+            >>> with open("/tmp/execution.log", "wb") as f:
+            ...     size = await storage.download_artifact_to(
+            ...         "wf-001", "logs/execution.log", f
+            ...     )
         """
-        prefix = f"{workflow_id}/"
+        object_name = f"{workflow_id}/{artifact_path}"
 
         try:
-            # Run blocking MinIO operation in thread pool
-            objects = await asyncio.to_thread(
-                self.client.list_objects,
-                bucket_name=self.bucket_name,
-                prefix=prefix,
-                recursive=True,
+            # Run blocking MinIO operation and sink writes in thread pool
+            size = await self._run(self._stream_object, object_name, sink, chunk_size)
+
+            logger.info(
+                "artifact.downloaded",
+                workflow_id=workflow_id,
+                artifact_path=artifact_path,
+                size_bytes=size,
             )
 
-            # Extract relative paths
-            artifact_paths = []
-            for obj in objects:
-                # Remove workflow_id prefix
-                relative_path = obj.object_name[len(prefix) :]
-                artifact_paths.append(relative_path)
+            return size
 
-            logger.info(
-                "artifacts.listed",
+        except (S3Error, OSError) as e:
+            logger.error(
+                "artifact.download_failed",
                 workflow_id=workflow_id,
-                count=len(artifact_paths),
+                artifact_path=artifact_path,
+                error=str(e),
             )
+            raise StorageError(f"Failed to download artifact: {e}") from e
+
+    async def upload_artifacts(
+        self,
+        workflow_id: str,
+        items: Sequence[tuple[str, bytes | str, str]],
+        concurrency: int = _TRANSFER_CONCURRENCY,
+    ) -> list[str]:
+        """
+        Upload several artifacts concurrently.
 
-            return artifact_paths
+        Args:
+            workflow_id: Workflow identifier for organizing artifacts
+            items: (artifact_path, content, content_type) per artifact
+            concurrency: Maximum uploads in flight at once
+
+        Returns:
+            Full object paths in MinIO, in the order of items
+
+        Raises:
+            StorageError: If any upload fails
+
+        Example:
+            >>> storage = ArtifactStorage()
+            >>> paths = await storage.upload_artifacts(
+            ...     "wf-001",
+            ...     [
+            ...         ("code/main.py", "print('hi')", "text/x-python"),
+            ...         ("reports/QA.md", "# QA", "text/markdown"),
+            ...     ],
+            ... )
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload(path: str, content: bytes | str, content_type: str) -> str:
+            async with semaphore:
+                return await self.upload_artifact(
+                    workflow_id, path, content, content_type
+                )
+
+        return list(await asyncio.gather(*(upload(*item) for item in items)))
+
+    async def download_artifacts(
+        self,
+        workflow_id: str,
+        artifact_paths: Sequence[str],
+        concurrency: int = _TRANSFER_CONCURRENCY,
+    ) -> list[bytes]:
+        """
+        Download several artifacts concurrently.
+
+        Args:
+            workflow_id: Workflow identifier
+            artifact_paths: Relative paths within workflow
+            concurrency: Maximum downloads in flight at once
+
+        Returns:
+            File contents, in the order of artifact_paths
+
+        Raises:
+            StorageError: If any download fails
+
+        Example:
+            >>> storage = ArtifactStorage()
+            >>> main_py, report = await storage.download_artifacts(
+            ...     "wf-001", ["code/main.py", "reports/QA.md"]
+            ... )
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download(path: str) -> bytes:
+            async with semaphore:
+                return await self.download_artifact(workflow_id, path)
+
+        return list(await asyncio.gather(*(download(path) for path in artifact_paths)))
+
+    def _list_page(self, prefix: str, start_after: str | None) -> list[str]:
+        """
+        Fetch one page of object names under a prefix (blocking).
+
+        Only the first page of the MinIO listing generator is consumed, so
+        each call is a single list request.
+
+        Args:
+            prefix: Object name prefix
+            start_after: Object name to continue after (None for first page)
+
+        Returns:
+            Up to _LIST_PAGE_SIZE full object names
+        """
+        objects = self.client.list_objects(
+            bucket_name=self.bucket_name,
+            prefix=prefix,
+            recursive=True,
+            start_after=start_after,
+        )
+        return [obj.object_name for obj in islice(objects, _LIST_PAGE_SIZE)]
+
+    async def _iter_object_pages(self, prefix: str) -> AsyncIterator[list[str]]:
+        """
+        Page through object names under a prefix.
+
+        Each page is fetched in the thread pool; only one page is held in
+        memory at a time.
+
+        Args:
+            prefix: Object name prefix
+
+        Yields:
+            Pages of up to _LIST_PAGE_SIZE full object names
+        """
+        start_after = None
+        while True:
+            names = await self._run(self._list_page, prefix, start_after)
+            if names:
+                yield names
+            if len(names) < _LIST_PAGE_SIZE:
+                return
+            start_after = names[-1]
+
+    async def list_artifacts(self, workflow_id: str) -> AsyncIterator[str]:
+        """
+        Stream all artifact paths for a workflow.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Yields:
+            Artifact paths (relative to workflow_id)
+
+        Raises:
+            StorageError: If listing fails
+
+        Example:
+            >>> storage = ArtifactStorage()
+            >>> async for path in storage.list_artifacts("wf-001"):
+            ...     print(path)
+            code/main.py
+            reports/VALIDATION_REPORT.md
+        """
+        prefix = f"{workflow_id}/"
+        count = 0
+
+        try:
+            async for names in self._iter_object_pages(prefix):
+                count += len(names)
+                for name in names:
+                    # Remove workflow_id prefix
+                    yield name[len(prefix) :]
 
         except S3Error as e:
             logger.error(
@@ -241,6 +722,73 @@ class ArtifactStorage:
             )
             raise StorageError(f"Failed to list artifacts: {e}") from e
 
+        logger.info(
+            "artifacts.listed",
+            workflow_id=workflow_id,
+            count=count,
+        )
+
+    async def list_artifacts_all(self, workflow_id: str) -> list[str]:
+        """
+        List all artifacts for a workflow.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            List of artifact paths (relative to workflow_id)
+
+        Raises:
+            StorageError: If listing fails
+
+        Example:
+            >>> storage = ArtifactStorage()
+            >>> artifacts = await storage.list_artifacts_all("wf-001")
+            >>> print(artifacts)
+            ['code/main.py', 'reports/VALIDATION_REPORT.md']
+        """
+        return [path async for path in self.list_artifacts(workflow_id)]
+
+    async def artifact_exists(self, workflow_id: str, artifact_path: str) -> bool:
+        """
+        Check whether an artifact exists with a HEAD request.
+
+        Args:
+            workflow_id: Workflow identifier
+            artifact_path: Relative path within workflow
+
+        Returns:
+            True if the object exists
+
+        Raises:
+            StorageError: If the check fails for another reason
+
+        Example:
+            >>> storage = ArtifactStorage()
+            >>> await storage.artifact_exists("wf-001", "code/main.py")
+            True
+        """
+        object_name = f"{workflow_id}/{artifact_path}"
+
+        try:
+            await self._run(
+                self.client.stat_object,
+                bucket_name=self.bucket_name,
+                object_name=object_name,
+            )
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return False
+            logger.error(
+                "artifact.stat_failed",
+                workflow_id=workflow_id,
+                artifact_path=artifact_path,
+                error=str(e),
+            )
+            raise StorageError(f"Failed to check artifact: {e}") from e
+
+        return True
+
     async def delete_artifact(self, workflow_id: str, artifact_path: str) -> None:
         """
         Delete an artifact from MinIO.
@@ -257,10 +805,11 @@ class ArtifactStorage:
             >>> await storage.delete_artifact("wf-001", "code/main.py")
         """
         object_name = f"{workflow_id}/{artifact_path}"
+        self._forget_download(object_name)
 
         try:
             # Run blocking MinIO operation in thread pool
-            await asyncio.to_thread(
+            await self._run(
                 self.client.remove_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
@@ -281,6 +830,23 @@ class ArtifactStorage:
             )
             raise StorageError(f"Failed to delete artifact: {e}") from e
 
+    def _remove_page(self, object_names: list[str]) -> list[DeleteError]:
+        """
+        Delete a page of objects with one batch request (blocking).
+
+        Args:
+            object_names: Up to _LIST_PAGE_SIZE full object names
+
+        Returns:
+            Errors for objects that could not be deleted
+        """
+        # remove_objects is lazy; draining the error iterator sends the request
+        return list(
+            self.client.remove_objects(
+                self.bucket_name, (DeleteObject(name) for name in object_names)
+            )
+        )
+
     async def delete_workflow_artifacts(self, workflow_id: str) -> int:
         """
         Delete all artifacts for a workflow.
@@ -288,11 +854,13 @@ class ArtifactStorage:
         Args:
             workflow_id: Workflow identifier
 
+        Objects that fail to delete are logged and not counted.
+
         Returns:
             Number of artifacts deleted
 
         Raises:
-            StorageError: If deletion fails
+            StorageError: If listing or a batch delete request fails
 
         Example:
             >>> storage = ArtifactStorage()
@@ -302,23 +870,20 @@ class ArtifactStorage:
         prefix = f"{workflow_id}/"
 
         try:
-            # List all objects with prefix
-            objects = await asyncio.to_thread(
-                self.client.list_objects,
-                bucket_name=self.bucket_name,
-                prefix=prefix,
-                recursive=True,
-            )
-
-            # Delete each object
+            # One batch delete request per listed page
             deleted_count = 0
-            for obj in objects:
-                await asyncio.to_thread(
-                    self.client.remove_object,
-                    bucket_name=self.bucket_name,
-                    object_name=obj.object_name,
-                )
-                deleted_count += 1
+            async for names in self._iter_object_pages(prefix):
+                for name in names:
+                    self._forget_download(name)
+                errors = await self._run(self._remove_page, names)
+                deleted_count += len(names) - len(errors)
+                for error in errors:
+                    logger.warning(
+                        "artifact.deletion_failed",
+                        workflow_id=workflow_id,
+                        object_name=error.name,
+                        error=error.message,
+                    )
 
             logger.info(
                 "workflow_artifacts.deleted",
@@ -365,9 +930,9 @@ class ArtifactStorage:
         expires = timedelta(hours=expires_hours)
 
         try:
-            # Run blocking MinIO operation in thread pool
-            url = await asyncio.to_thread(
-                self.client.presigned_get_object,
+            # Presigning is local HMAC signing (the region is configured, so
+            # no bucket-location lookup); no thread pool hop needed
+            url = self.client.presigned_get_object(
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 expires=expires,
@@ -391,6 +956,61 @@ class ArtifactStorage:
             )
             raise StorageError(f"Failed to generate artifact URL: {e}") from e
 
+    async def get_artifact_urls(
+        self,
+        workflow_id: str,
+        artifact_paths: Sequence[str],
+        expires_hours: int = 24,
+    ) -> list[str]:
+        """
+        Generate presigned URLs for several artifacts.
+
+        Args:
+            workflow_id: Workflow identifier
+            artifact_paths: Relative paths within workflow
+            expires_hours: URL expiration time in hours (default: 24)
+
+        Returns:
+            Presigned URLs, in the order of artifact_paths
+
+        Raises:
+            StorageError: If URL generation fails
+
+        Example:
+            >>> storage = ArtifactStorage()
+            >>> urls = await storage.get_artifact_urls(
+            ...     "wf-001", ["code/main.py", "reports/QA.md"], expires_hours=1
+            ... )
+        """
+        expires = timedelta(hours=expires_hours)
+
+        try:
+            urls = [
+                self.client.presigned_get_object(
+                    bucket_name=self.bucket_name,
+                    object_name=f"{workflow_id}/{path}",
+                    expires=expires,
+                )
+                for path in artifact_paths
+            ]
+
+            logger.info(
+                "artifact.urls_generated",
+                workflow_id=workflow_id,
+                count=len(urls),
+                expires_hours=expires_hours,
+            )
+
+            return urls
+
+        except S3Error as e:
+            logger.error(
+                "artifact.url_generation_failed",
+                workflow_id=workflow_id,
+                error=str(e),
+            )
+            raise StorageError(f"Failed to generate artifact URLs: {e}") from e
+
 
 # Global artifact storage instance (lazy-loaded to avoid connection
 # errors during testing)
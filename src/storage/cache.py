@@ -7,11 +7,19 @@ Implements async operations with connection pooling and error handling.
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import logging
+import secrets
+import time
+from collections.abc import AsyncGenerator, Mapping
 from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
 import structlog
+from redis.commands.core import AsyncScript
 
 from src.config import settings
 from src.exceptions import CacheError
@@ -19,6 +27,67 @@ from src.exceptions import CacheError
 
 logger = structlog.get_logger(__name__)
 
+# Per-call debug events are skipped unless debug logging is configured, so
+# hot cache paths don't build and process event dicts that get discarded.
+# Checked per call: isEnabledFor is cached by the stdlib and follows the
+# level that configure_logging() sets, whenever it runs.
+_stdlib_logger = logging.getLogger(__name__)
+
+# Sliding-window log: one sorted-set member per allowed request, scored by
+# server time in ms so all app hosts share one clock. Entries older than the
+# window are trimmed before counting, and the key expires once idle.
+# KEYS[1] = window key; ARGV = window_seconds, max_requests, unique member
+# Returns {allowed (1/0), requests in window including this one if allowed}
+_RATE_LIMIT_SCRIPT = """
+if redis.call('TYPE', KEYS[1]).ok == 'string' then
+    -- counter left by the earlier fixed-window limiter
+    redis.call('DEL', KEYS[1])
+end
+local now = redis.call('TIME')
+local now_ms = now[1] * 1000 + math.floor(now[2] / 1000)
+local window_ms = tonumber(ARGV[1]) * 1000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now_ms - window_ms)
+local count = redis.call('ZCARD', KEYS[1])
+if count >= tonumber(ARGV[2]) then
+    return {0, count}
+end
+redis.call('ZADD', KEYS[1], now_ms, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], window_ms)
+return {1, count + 1}
+"""
+
+# Delete a lock only while it still holds this owner's token, so a holder
+# whose lock expired cannot release a lock since taken by someone else.
+# KEYS[1] = lock key; ARGV[1] = owner token. Returns 1 if released, else 0.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _decode_session(value: str | bytes) -> dict[str, Any]:
+    """
+    Parse a stored session payload.
+
+    Sessions written before payloads were JSON hold the bare user ID.
+
+    Args:
+        value: Raw value of a session key
+
+    Returns:
+        Session attributes, always including user_id
+    """
+    try:
+        session = orjson.loads(value)
+    except orjson.JSONDecodeError:
+        session = None
+    if not isinstance(session, dict):
+        user_id = value.decode() if isinstance(value, bytes) else value
+        return {"user_id": user_id}
+    return session
+
 
 class RedisCache:
     """
@@ -33,6 +102,7 @@ class RedisCache:
         self.redis_url = settings.redis_url
         self.pool: redis.ConnectionPool | None = None
         self.client: redis.Redis | None = None
+        self._scripts: dict[str, AsyncScript] = {}
 
     async def connect(self) -> None:
         """
@@ -42,12 +112,17 @@ class RedisCache:
             CacheError: If connection fails
         """
         try:
+            # Replies stay bytes; only the helpers that return text decode.
+            # Keepalive and periodic health checks stop idle connections
+            # from being silently dropped by NAT or load balancer timeouts.
             self.pool = redis.ConnectionPool.from_url(
                 self.redis_url,
-                decode_responses=True,
-                max_connections=10,
+                max_connections=settings.redis_max_connections,
+                socket_keepalive=True,
+                health_check_interval=30,
             )
             self.client = redis.Redis(connection_pool=self.pool)
+            self._scripts.clear()
 
             # Test connection
             await self.client.ping()
@@ -55,7 +130,7 @@ class RedisCache:
             logger.info(
                 "redis.connected",
                 url=self.redis_url,
-                max_connections=10,
+                max_connections=settings.redis_max_connections,
             )
 
         except redis.RedisError as e:
@@ -80,7 +155,7 @@ class RedisCache:
             key: Cache key
 
         Returns:
-            Cached value or None if not found
+            Cached value decoded as UTF-8, or None if not found
 
         Raises:
             CacheError: If operation fails
@@ -90,19 +165,43 @@ class RedisCache:
             >>> await cache.connect()
             >>> value = await cache.get("user:123:session")
         """
+        value = await self.get_bytes(key)
+        return None if value is None else value.decode()
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """
+        Get raw value from cache without decoding.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached bytes or None if not found
+
+        Raises:
+            CacheError: If operation fails
+
+        Example:
+            >>> cache = RedisCache()
+            >>> await cache.connect()
+            >>> payload = await cache.get_bytes("session:sess-123")
+        """
         if not self.client:
             raise CacheError("Redis client not connected")
 
         try:
-            value = await self.client.get(key)
-            logger.debug("cache.get", key=key, found=value is not None)
-            return value  # type: ignore[no-any-return]
+            value: bytes | None = await self.client.get(key)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("cache.get", key=key, found=value is not None)
+            return value
 
         except redis.RedisError as e:
             logger.error("cache.get_failed", key=key, error=str(e))
             raise CacheError(f"Failed to get cache key: {e}") from e
 
-    async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> None:
+    async def set(
+        self, key: str, value: str | bytes, ttl_seconds: int | None = None
+    ) -> None:
         """
         Set value in cache with optional TTL.
 
@@ -128,16 +227,117 @@ class RedisCache:
             else:
                 await self.client.set(key, value)
 
-            logger.debug(
-                "cache.set",
-                key=key,
-                ttl_seconds=ttl_seconds,
-            )
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "cache.set",
+                    key=key,
+                    ttl_seconds=ttl_seconds,
+                )
 
         except redis.RedisError as e:
             logger.error("cache.set_failed", key=key, error=str(e))
             raise CacheError(f"Failed to set cache key: {e}") from e
 
+    async def mset(
+        self, mapping: Mapping[str, str], ttl_seconds: int | None = None
+    ) -> None:
+        """
+        Set several values in one round trip.
+
+        Args:
+            mapping: Key/value pairs to store
+            ttl_seconds: Time-to-live in seconds for every key
+                (None = no expiration)
+
+        Raises:
+            CacheError: If operation fails
+
+        Example:
+            >>> cache = RedisCache()
+            >>> await cache.connect()
+            >>> await cache.mset({"a": "1", "b": "2"}, ttl_seconds=3600)
+        """
+        if not self.client:
+            raise CacheError("Redis client not connected")
+
+        if not mapping:
+            return
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(key, value, ex=ttl_seconds)
+                await pipe.execute()
+
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("cache.mset", keys=len(mapping), ttl_seconds=ttl_seconds)
+
+        except redis.RedisError as e:
+            logger.error("cache.mset_failed", keys=len(mapping), error=str(e))
+            raise CacheError(f"Failed to set cache keys: {e}") from e
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        """
+        Get all fields of a hash.
+
+        Args:
+            key: Hash key
+
+        Returns:
+            Field/value mapping (empty if the key does not exist)
+
+        Raises:
+            CacheError: If operation fails
+
+        Example:
+            >>> cache = RedisCache()
+            >>> await cache.connect()
+            >>> budget = await cache.hgetall("budget:workflow:wf-001")
+        """
+        if not self.client:
+            raise CacheError("Redis client not connected")
+
+        try:
+            value: dict[bytes, bytes] = await self.client.hgetall(key)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("cache.hgetall", key=key, found=bool(value))
+            return {field.decode(): data.decode() for field, data in value.items()}
+
+        except redis.RedisError as e:
+            logger.error("cache.hgetall_failed", key=key, error=str(e))
+            raise CacheError(f"Failed to get cache hash: {e}") from e
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """
+        Get several values in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values in key order (None for missing keys)
+
+        Raises:
+            CacheError: If operation fails
+
+        Example:
+            >>> cache = RedisCache()
+            >>> await cache.connect()
+            >>> values = await cache.mget(["session:abc", "session:def"])
+        """
+        if not self.client:
+            raise CacheError("Redis client not connected")
+
+        try:
+            values: list[bytes | None] = await self.client.mget(keys)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("cache.mget", keys=len(keys))
+            return [None if value is None else value.decode() for value in values]
+
+        except redis.RedisError as e:
+            logger.error("cache.mget_failed", keys=len(keys), error=str(e))
+            raise CacheError(f"Failed to get cache keys: {e}") from e
+
     async def delete(self, key: str) -> bool:
         """
         Delete key from cache.
@@ -163,7 +363,8 @@ class RedisCache:
             result = await self.client.delete(key)
             deleted = result > 0
 
-            logger.debug("cache.delete", key=key, deleted=deleted)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("cache.delete", key=key, deleted=deleted)
             return deleted  # type: ignore[no-any-return]
 
         except redis.RedisError as e:
@@ -195,7 +396,8 @@ class RedisCache:
             result = await self.client.exists(key)
             exists = result > 0
 
-            logger.debug("cache.exists", key=key, exists=exists)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("cache.exists", key=key, exists=exists)
             return exists  # type: ignore[no-any-return]
 
         except redis.RedisError as e:
@@ -226,19 +428,132 @@ class RedisCache:
 
         try:
             new_value = await self.client.incrby(key, amount)
-            logger.debug("cache.increment", key=key, amount=amount, new_value=new_value)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "cache.increment", key=key, amount=amount, new_value=new_value
+                )
             return new_value  # type: ignore[no-any-return]
 
         except redis.RedisError as e:
             logger.error("cache.increment_failed", key=key, error=str(e))
             raise CacheError(f"Failed to increment cache key: {e}") from e
 
+    async def increment_float(
+        self, key: str, amount: float, expire_at: datetime | None = None
+    ) -> float:
+        """
+        Increment a float counter in cache.
+
+        Args:
+            key: Cache key
+            amount: Amount to add (may be negative)
+            expire_at: Absolute expiry time for the key (optional)
+
+        Returns:
+            New value after increment
+
+        Raises:
+            CacheError: If operation fails
+
+        Example:
+            >>> cache = RedisCache()
+            >>> await cache.connect()
+            >>> total = await cache.increment_float("budget:month:2026-01", 0.25)
+        """
+        if not self.client:
+            raise CacheError("Redis client not connected")
+
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.incrbyfloat(key, amount)
+                if expire_at is not None:
+                    pipe.expireat(key, expire_at)
+                results = await pipe.execute()
+
+            new_value = float(results[0])
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "cache.increment_float", key=key, amount=amount, new_value=new_value
+                )
+            return new_value
+
+        except redis.RedisError as e:
+            logger.error("cache.increment_float_failed", key=key, error=str(e))
+            raise CacheError(f"Failed to increment cache key: {e}") from e
+
+    def _script(self, script: str) -> AsyncScript:
+        """
+        Return the registered handle for a Lua script, registering it once.
+
+        Args:
+            script: Lua script source
+
+        Returns:
+            Script handle invoked via EVALSHA (reloaded on NOSCRIPT)
+
+        Raises:
+            CacheError: If not connected
+        """
+        if not self.client:
+            raise CacheError("Redis client not connected")
+
+        registered = self._scripts.get(script)
+        if registered is None:
+            registered = self.client.register_script(script)
+            self._scripts[script] = registered
+        return registered
+
+    async def run_script(
+        self,
+        script: str,
+        keys: list[str],
+        args: list[str | int | float],
+    ) -> Any:
+        """
+        Run a Lua script atomically on the server.
+
+        Scripts are registered once per connection and invoked via EVALSHA,
+        falling back to a SCRIPT LOAD transparently if the server lost them.
+
+        Args:
+            script: Lua script source
+            keys: Keys accessed by the script (KEYS[...])
+            args: Script arguments (ARGV[...])
+
+        Returns:
+            Raw script result
+
+        Raises:
+            CacheError: If operation fails
+
+        Example:
+            >>> cache = RedisCache()
+            >>> await cache.connect()
+            >>> await cache.run_script("return redis.call('GET', KEYS[1])", ["k"], [])
+        """
+        if not self.client:
+            raise CacheError("Redis client not connected")
+
+        try:
+            result = await self._script(script)(keys=keys, args=args)
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("cache.run_script", keys=keys)
+            return result
+
+        except redis.RedisError as e:
+            logger.error("cache.run_script_failed", keys=keys, error=str(e))
+            raise CacheError(f"Failed to run cache script: {e}") from e
+
     async def rate_limit(
         self, key: str, max_requests: int, window_seconds: int
     ) -> bool:
         """
         Check rate limit using sliding window.
 
+        Counts the requests allowed within the last window_seconds, so a
+        client cannot burst past max_requests at a window boundary. Rejected
+        requests are not counted.
+
         Args:
             key: Rate limit key (e.g., "api:user:123")
             max_requests: Maximum requests allowed in window
@@ -265,14 +580,11 @@ class RedisCache:
             raise CacheError("Redis client not connected")
 
         try:
-            # Increment counter
-            current = await self.client.incr(key)
-
-            # Set expiration on first request
-            if current == 1:
-                await self.client.expire(key, window_seconds)
-
-            allowed = current <= max_requests
+            # Trim, count and record the request atomically in one round trip
+            allowed_flag, current = await self._script(_RATE_LIMIT_SCRIPT)(
+                keys=[key], args=[window_seconds, max_requests, uuid4().hex]
+            )
+            allowed = bool(allowed_flag)
 
             logger.info(
                 "rate_limit.checked",
@@ -283,7 +595,7 @@ class RedisCache:
                 allowed=allowed,
             )
 
-            return allowed  # type: ignore[no-any-return]
+            return allowed
 
         except redis.RedisError as e:
             logger.error("rate_limit.check_failed", key=key, error=str(e))
@@ -320,11 +632,14 @@ class RedisCache:
             raise CacheError("Redis client not connected")
 
         lock_key = f"lock:{key}"
+        token = secrets.token_hex(16)
         acquired = False
 
         try:
             # Try to acquire lock
-            acquired = await self.client.set(lock_key, "1", nx=True, ex=timeout_seconds)
+            acquired = await self.client.set(
+                lock_key, token, nx=True, ex=timeout_seconds
+            )
 
             if acquired:
                 logger.info(
@@ -346,24 +661,42 @@ class RedisCache:
             raise CacheError(f"Lock operation failed: {e}") from e
 
         finally:
-            # Release lock if we acquired it
+            # Release lock if we acquired it and still own it
             if acquired:
                 try:
-                    await self.client.delete(lock_key)
-                    logger.info("lock.released", key=key)
+                    released = await self._script(_RELEASE_LOCK_SCRIPT)(
+                        keys=[lock_key], args=[token]
+                    )
+                    if released:
+                        logger.info("lock.released", key=key)
+                    else:
+                        logger.warning(
+                            "lock.release_skipped",
+                            key=key,
+                            reason="Lock expired before release",
+                        )
                 except redis.RedisError as e:
                     logger.error("lock.release_failed", key=key, error=str(e))
 
     async def set_session(
-        self, session_id: str, user_id: str, ttl_hours: int = 24
+        self,
+        session_id: str,
+        user_id: str,
+        ttl_hours: int = 24,
+        attributes: Mapping[str, Any] | None = None,
     ) -> None:
         """
         Store user session with TTL.
 
+        The session is one JSON payload, so every attribute comes back from
+        a single GET.
+
         Args:
             session_id: Session identifier
             user_id: User identifier
             ttl_hours: Session expiration in hours (default: 24)
+            attributes: Extra JSON-serializable session attributes
+                (e.g. roles)
 
         Raises:
             CacheError: If operation fails
@@ -371,12 +704,21 @@ class RedisCache:
         Example:
             >>> cache = RedisCache()
             >>> await cache.connect()
-            >>> await cache.set_session("sess-123", "user-456", ttl_hours=24)
+            >>> await cache.set_session(
+            ...     "sess-123", "user-456", attributes={"roles": ["developer"]}
+            ... )
         """
         key = f"session:{session_id}"
         ttl_seconds = ttl_hours * 3600
+        payload = orjson.dumps(
+            {
+                **(attributes or {}),
+                "user_id": user_id,
+                "created_at": int(time.time()),
+            }
+        )
 
-        await self.set(key, user_id, ttl_seconds=ttl_seconds)
+        await self.set(key, payload, ttl_seconds=ttl_seconds)
 
         logger.info(
             "session.created",
@@ -385,6 +727,39 @@ class RedisCache:
             ttl_hours=ttl_hours,
         )
 
+    async def get_session_data(self, session_id: str) -> dict[str, Any] | None:
+        """
+        Retrieve all session attributes.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Session attributes (user_id, created_at, extra attributes) if
+            session exists, None otherwise
+
+        Raises:
+            CacheError: If operation fails
+
+        Example:
+            >>> cache = RedisCache()
+            >>> await cache.connect()
+            >>> session = await cache.get_session_data("sess-123")
+            >>> session["roles"]
+            ['developer']
+        """
+        key = f"session:{session_id}"
+        value = await self.get_bytes(key)
+
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "session.retrieved",
+                session_id=session_id,
+                found=value is not None,
+            )
+
+        return None if value is None else _decode_session(value)
+
     async def get_session(self, session_id: str) -> str | None:
         """
         Retrieve user ID from session.
@@ -403,16 +778,43 @@ class RedisCache:
             >>> await cache.connect()
             >>> user_id = await cache.get_session("sess-123")
         """
-        key = f"session:{session_id}"
-        user_id = await self.get(key)
+        session = await self.get_session_data(session_id)
+        return None if session is None else session["user_id"]
 
-        logger.debug(
-            "session.retrieved",
-            session_id=session_id,
-            found=user_id is not None,
-        )
+    async def get_sessions(self, session_ids: list[str]) -> dict[str, str | None]:
+        """
+        Retrieve user IDs for several sessions in one round trip.
+
+        Args:
+            session_ids: Session identifiers
+
+        Returns:
+            User ID per session ID (None where the session does not exist)
+
+        Raises:
+            CacheError: If operation fails
+
+        Example:
+            >>> cache = RedisCache()
+            >>> await cache.connect()
+            >>> users = await cache.get_sessions(["sess-123", "sess-456"])
+        """
+        if not session_ids:
+            return {}
+
+        values = await self.mget([f"session:{sid}" for sid in session_ids])
+
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "sessions.retrieved",
+                sessions=len(session_ids),
+                found=sum(value is not None for value in values),
+            )
 
-        return user_id
+        return {
+            session_id: None if value is None else _decode_session(value)["user_id"]
+            for session_id, value in zip(session_ids, values, strict=True)
+        }
 
     async def delete_session(self, session_id: str) -> bool:
         """
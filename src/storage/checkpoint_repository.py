@@ -6,18 +6,74 @@ Provides async database operations for:
 - Audit events (agent executions, approvals, rejections)
 """
 
-import json
+import asyncio
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 from uuid import uuid4
 
 import asyncpg  # type: ignore[import-untyped]
+import orjson
 
 from src.config import Settings
 from src.exceptions import CheckpointNotFoundError, DatabaseConnectionError
+from src.observability.metrics import db_connections_active, db_connections_idle
 from src.orchestration.state import WorkflowState
 
 
+# Rows removed per DELETE statement in cleanup_old_checkpoints
+_CLEANUP_BATCH_SIZE = 10_000
+
+
+# Leading version byte of the jsonb binary wire format
+_JSONB_VERSION = b"\x01"
+
+
+def _json_encode(obj: Any) -> bytes:
+    """Serialize to JSON bytes with orjson (the json binary wire format)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _jsonb_encode(obj: Any) -> bytes:
+    """Serialize to the jsonb binary wire format (version byte + JSON)."""
+    return _JSONB_VERSION + _json_encode(obj)
+
+
+def _jsonb_decode(data: bytes) -> Any:
+    """Deserialize the jsonb binary wire format, skipping the version byte."""
+    return orjson.loads(memoryview(data)[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Register binary orjson codecs for json/jsonb on a new pool connection.
+
+    Runs once per physical connection, so queries take and return Python
+    objects directly: payloads go between orjson and the wire as bytes,
+    with no intermediate str and no stdlib json module on the hot path.
+    """
+    await conn.set_type_codec(
+        "json",
+        encoder=_json_encode,
+        decoder=orjson.loads,
+        schema="pg_catalog",
+        format="binary",
+    )
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_jsonb_encode,
+        decoder=_jsonb_decode,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
+def _export_pool_metrics(pool: asyncpg.Pool) -> None:
+    """Report pool occupancy to Prometheus, read at scrape time."""
+    db_connections_active.labels(database="postgresql").set_function(
+        lambda: pool.get_size() - pool.get_idle_size()
+    )
+    db_connections_idle.labels(database="postgresql").set_function(pool.get_idle_size)
+
+
 class CheckpointRepository:
     """Async PostgreSQL repository for workflow persistence.
 
@@ -26,56 +82,155 @@ class CheckpointRepository:
     - Workflows (metadata)
     - Audit events (execution history)
 
+    Reads go to a replica pool when postgres_replica_url is set, so they
+    may lag behind writes by the replication delay. With
+    postgres_socket_dir set, the primary pool connects over that Unix
+    socket instead of TCP.
+
     Attributes:
-        pool: asyncpg connection pool
-        min_connections: Minimum pool size (default: 5)
-        max_connections: Maximum pool size (default: 20)
+        pool: asyncpg connection pool (primary)
+        read_pool: asyncpg pool on the read replica, if configured
+        min_connections: Minimum pool size (default: postgres_pool_min_size)
+        max_connections: Maximum pool size (default: postgres_pool_max_size)
     """
 
     def __init__(
         self,
         settings: Settings,
-        min_connections: int = 5,
-        max_connections: int = 20,
+        min_connections: int | None = None,
+        max_connections: int | None = None,
     ) -> None:
         """Initialize repository with connection pool settings.
 
         Args:
-            settings: Application settings with postgres_url
-            min_connections: Minimum pool size
-            max_connections: Maximum pool size
+            settings: Application settings with postgres_url, optional
+                postgres_replica_url and pool sizes
+            min_connections: Minimum pool size (overrides settings)
+            max_connections: Maximum pool size (overrides settings)
         """
         self.postgres_url = settings.postgres_url
-        self.min_connections = min_connections
-        self.max_connections = max_connections
+        self.max_connections = (
+            settings.postgres_pool_max_size
+            if max_connections is None
+            else max_connections
+        )
+        self.min_connections = min(
+            (
+                settings.postgres_pool_min_size
+                if min_connections is None
+                else min_connections
+            ),
+            self.max_connections,
+        )
+        self.replica_url = settings.postgres_replica_url
+        self.socket_dir = settings.postgres_socket_dir
         self.pool: asyncpg.Pool | None = None
+        self.read_pool: asyncpg.Pool | None = None
 
     async def connect(self) -> None:
-        """Establish connection pool to PostgreSQL.
+        """Establish connection pools to PostgreSQL (and the read replica).
+
+        Raises:
+            DatabaseConnectionError: On connection failures
+        """
+        self.pool = await self._create_pool(self.postgres_url, host=self.socket_dir)
+        _export_pool_metrics(self.pool)
+        if self.replica_url:
+            try:
+                self.read_pool = await self._create_pool(self.replica_url)
+            except DatabaseConnectionError:
+                await self.disconnect()
+                raise
+
+    async def _create_pool(
+        self,
+        url: str,
+        host: str | None = None,
+    ) -> asyncpg.Pool:
+        """Create a connection pool with the repository's pool settings.
+
+        Args:
+            url: PostgreSQL connection URL
+            host: Host or Unix socket directory overriding the one in url
+
+        Returns:
+            Connected pool
 
         Raises:
             DatabaseConnectionError: On connection failures
         """
         try:
-            self.pool = await asyncpg.create_pool(
-                self.postgres_url,
+            return await asyncpg.create_pool(
+                url,
+                host=host,
                 min_size=self.min_connections,
                 max_size=self.max_connections,
                 command_timeout=60,
+                # Recycle connections so idle ones and long-lived server
+                # backends don't accumulate memory
+                max_inactive_connection_lifetime=300.0,
+                max_queries=50_000,
+                # Short OLTP queries never pay off JIT compilation
+                server_settings={
+                    "application_name": "ordo-checkpoint",
+                    "jit": "off",
+                },
+                init=_init_connection,
             )
         except (asyncpg.PostgresError, OSError) as e:
             raise DatabaseConnectionError(
                 database="postgresql",
                 operation="connect",
-                details={"error": str(e), "url": self.postgres_url[:30] + "..."},
+                details={"error": str(e), "url": url[:30] + "..."},
             ) from e
 
     async def disconnect(self) -> None:
-        """Close connection pool gracefully."""
+        """Close connection pools gracefully."""
+        if self.read_pool:
+            await self.read_pool.close()
+            self.read_pool = None
         if self.pool:
             await self.pool.close()
             self.pool = None
 
+    def _require_pool(self, operation: str) -> asyncpg.Pool:
+        """Return the connection pool, failing if connect() hasn't run.
+
+        Args:
+            operation: Name of the calling operation (for the error)
+
+        Returns:
+            The connection pool
+
+        Raises:
+            DatabaseConnectionError: If the pool is not initialized
+        """
+        pool = self.pool
+        if pool is None:
+            raise DatabaseConnectionError(
+                database="postgresql",
+                operation=operation,
+                details={
+                    "error": "Connection pool not initialized. Call connect() first."
+                },
+            )
+        return pool
+
+    def _require_read_pool(self, operation: str) -> asyncpg.Pool:
+        """Return the pool for reads: the replica if configured, else primary.
+
+        Args:
+            operation: Name of the calling operation (for the error)
+
+        Returns:
+            The read replica pool, or the primary pool without one
+
+        Raises:
+            DatabaseConnectionError: If the pool is not initialized
+        """
+        pool = self._require_pool(operation)
+        return pool if self.read_pool is None else self.read_pool
+
     async def save_checkpoint(
         self,
         workflow_id: str,
@@ -87,7 +242,8 @@ class CheckpointRepository:
         Args:
             workflow_id: Unique workflow identifier
             state: Current workflow state
-            checkpoint_id: Optional checkpoint ID (generates UUID if None)
+            checkpoint_id: Optional checkpoint ID (Postgres generates a UUID
+                if None)
 
         Returns:
             Checkpoint ID (UUID string)
@@ -95,37 +251,139 @@ class CheckpointRepository:
         Raises:
             DatabaseConnectionError: On database errors
         """
-        if not self.pool:
+        pool = self._require_pool("save_checkpoint")
+
+        state_version = state.get("state_version", 1)
+
+        try:
+            async with pool.acquire() as conn:
+                saved_id = await conn.fetchval(
+                    """
+                    INSERT INTO checkpoints
+                    (checkpoint_id, workflow_id, state_version, state, created_at)
+                    VALUES (
+                        COALESCE($1::text, gen_random_uuid()::text),
+                        $2, $3, $4, NOW()
+                    )
+                    RETURNING checkpoint_id
+                    """,
+                    checkpoint_id,
+                    workflow_id,
+                    state_version,
+                    state,
+                )
+                return str(saved_id)
+
+        except asyncpg.PostgresError as e:
             raise DatabaseConnectionError(
                 database="postgresql",
                 operation="save_checkpoint",
                 details={
-                    "error": "Connection pool not initialized. Call connect() first."
+                    "error": str(e),
+                    "workflow_id": workflow_id,
+                    "checkpoint_id": checkpoint_id,
                 },
-            )
+            ) from e
+
+    async def save_checkpoint_bundle(
+        self,
+        workflow_id: str,
+        state: WorkflowState,
+        user_request: str,
+        status: str,
+        current_phase: str | None = None,
+        current_agent: str | None = None,
+        budget_used_usd: float = 0.0,
+        rejection_count: int = 0,
+        event_type: str = "CHECKPOINT_SAVED",
+        agent_name: str = "system",
+        checkpoint_id: str | None = None,
+    ) -> str:
+        """Save a checkpoint with its workflow metadata and audit event.
+
+        Equivalent to save_checkpoint() + save_workflow_metadata() +
+        log_audit_event(), but issued as one statement: a single round trip,
+        and either all three rows are written or none are.
+
+        Args:
+            workflow_id: Unique workflow identifier
+            state: Current workflow state
+            user_request: Original user request text
+            status: Workflow status
+            current_phase: Current execution phase
+            current_agent: Currently executing agent
+            budget_used_usd: Total budget consumed
+            rejection_count: Number of rejections
+            event_type: Audit event type
+            agent_name: Name of agent triggering the audit event
+            checkpoint_id: Optional checkpoint ID (generates UUID if None)
+
+        Returns:
+            Checkpoint ID (UUID string)
+
+        Raises:
+            DatabaseConnectionError: On database errors
+        """
+        pool = self._require_pool("save_checkpoint_bundle")
 
         checkpoint_id = checkpoint_id or str(uuid4())
         state_version = state.get("state_version", 1)
+        event_data = {"checkpoint_id": checkpoint_id, "state_version": state_version}
 
         try:
-            async with self.pool.acquire() as conn:
+            async with pool.acquire() as conn:
                 await conn.execute(
                     """
-                    INSERT INTO checkpoints
-                    (checkpoint_id, workflow_id, state_version, state, created_at)
-                    VALUES ($1, $2, $3, $4, NOW())
+                    WITH saved_checkpoint AS (
+                        INSERT INTO checkpoints
+                        (checkpoint_id, workflow_id, state_version, state, created_at)
+                        VALUES ($1, $2, $3, $4, NOW())
+                    ),
+                    saved_workflow AS (
+                        INSERT INTO workflows (
+                            workflow_id, user_request, status, current_phase,
+                            current_agent, budget_used_usd, rejection_count,
+                            created_at, updated_at
+                        )
+                        VALUES ($2, $5, $6, $7, $8, $9, $10, NOW(), NOW())
+                        ON CONFLICT (workflow_id) DO UPDATE SET
+                            status = EXCLUDED.status,
+                            current_phase = EXCLUDED.current_phase,
+                            current_agent = EXCLUDED.current_agent,
+                            budget_used_usd = EXCLUDED.budget_used_usd,
+                            rejection_count = EXCLUDED.rejection_count,
+                            updated_at = NOW(),
+                            completed_at = CASE WHEN EXCLUDED.status IN (
+                                'COMPLETED', 'FAILED'
+                            ) THEN NOW() ELSE workflows.completed_at END
+                    )
+                    INSERT INTO audit_events (
+                        event_id, workflow_id, event_type, agent_name,
+                        details, timestamp
+                    )
+                    VALUES ($11, $2, $12, $13, $14, NOW())
                     """,
                     checkpoint_id,
                     workflow_id,
                     state_version,
-                    json.dumps(state),
+                    state,
+                    user_request,
+                    status,
+                    current_phase,
+                    current_agent,
+                    budget_used_usd,
+                    rejection_count,
+                    str(uuid4()),
+                    event_type,
+                    agent_name,
+                    event_data,
                 )
                 return checkpoint_id
 
         except asyncpg.PostgresError as e:
             raise DatabaseConnectionError(
                 database="postgresql",
-                operation="save_checkpoint",
+                operation="save_checkpoint_bundle",
                 details={
                     "error": str(e),
                     "workflow_id": workflow_id,
@@ -149,17 +407,10 @@ class CheckpointRepository:
             CheckpointNotFoundError: If checkpoint doesn't exist
             DatabaseConnectionError: On database errors
         """
-        if not self.pool:
-            raise DatabaseConnectionError(
-                database="postgresql",
-                operation="load_checkpoint",
-                details={
-                    "error": "Connection pool not initialized. Call connect() first."
-                },
-            )
+        pool = self._require_read_pool("load_checkpoint")
 
         try:
-            async with self.pool.acquire() as conn:
+            async with pool.acquire() as conn:
                 row = await conn.fetchrow(
                     """
                     SELECT state FROM checkpoints
@@ -168,14 +419,6 @@ class CheckpointRepository:
                     checkpoint_id,
                 )
 
-                if not row:
-                    raise CheckpointNotFoundError(
-                        checkpoint_id=checkpoint_id,
-                        details={"operation": "load_checkpoint"},
-                    )
-
-                return cast(WorkflowState, json.loads(row["state"]))
-
         except asyncpg.PostgresError as e:
             raise DatabaseConnectionError(
                 database="postgresql",
@@ -186,16 +429,80 @@ class CheckpointRepository:
                 },
             ) from e
 
+        if not row:
+            raise CheckpointNotFoundError(
+                checkpoint_id=checkpoint_id,
+                details={"operation": "load_checkpoint"},
+            )
+
+        return cast(WorkflowState, row["state"])
+
+    async def load_checkpoints_bulk(
+        self,
+        checkpoint_ids: list[str],
+    ) -> dict[str, WorkflowState]:
+        """Load several checkpoints in a single query.
+
+        Only states that are JSON objects are returned: rows holding any
+        other JSON value are filtered out in SQL, and checkpoints that don't
+        exist are left out too. Callers decide how to report the missing IDs.
+
+        Args:
+            checkpoint_ids: Checkpoint identifiers to load
+
+        Returns:
+            Mapping of checkpoint ID to WorkflowState
+
+        Raises:
+            DatabaseConnectionError: On database errors
+        """
+        pool = self._require_read_pool("load_checkpoints_bulk")
+
+        if not checkpoint_ids:
+            return {}
+
+        try:
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT checkpoint_id, state FROM checkpoints
+                    WHERE checkpoint_id = ANY($1::text[])
+                      AND json_typeof(state::json) = 'object'
+                    """,
+                    checkpoint_ids,
+                )
+
+        except asyncpg.PostgresError as e:
+            raise DatabaseConnectionError(
+                database="postgresql",
+                operation="load_checkpoints_bulk",
+                details={
+                    "error": str(e),
+                    "checkpoint_ids": checkpoint_ids,
+                },
+            ) from e
+
+        return {
+            str(row["checkpoint_id"]): cast(WorkflowState, row["state"])
+            for row in rows
+            if isinstance(row["state"], dict)
+        }
+
     async def list_checkpoints(
         self,
         workflow_id: str,
         limit: int = 10,
+        before_version: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Get checkpoint history for a workflow.
+        """Get checkpoint history for a workflow, newest first.
+
+        Pages by keyset rather than OFFSET: pass the last state_version of
+        one page as before_version to fetch the next.
 
         Args:
             workflow_id: Workflow identifier
             limit: Maximum number of checkpoints to return (default: 10)
+            before_version: Only return checkpoints older than this version
 
         Returns:
             List of checkpoint metadata (id, version, created_at)
@@ -203,37 +510,35 @@ class CheckpointRepository:
         Raises:
             DatabaseConnectionError: On database errors
         """
-        if not self.pool:
-            raise DatabaseConnectionError(
-                database="postgresql",
-                operation="list_checkpoints",
-                details={
-                    "error": "Connection pool not initialized. Call connect() first."
-                },
-            )
+        pool = self._require_read_pool("list_checkpoints")
 
         try:
-            async with self.pool.acquire() as conn:
-                rows = await conn.fetch(
-                    """
-                    SELECT checkpoint_id, state_version, created_at
-                    FROM checkpoints
-                    WHERE workflow_id = $1
-                    ORDER BY state_version DESC
-                    LIMIT $2
-                    """,
-                    workflow_id,
-                    limit,
-                )
-
-                return [
-                    {
-                        "checkpoint_id": str(row["checkpoint_id"]),
-                        "state_version": row["state_version"],
-                        "created_at": row["created_at"].isoformat(),
-                    }
-                    for row in rows
-                ]
+            async with pool.acquire() as conn:
+                if before_version is None:
+                    rows = await conn.fetch(
+                        """
+                        SELECT checkpoint_id, state_version, created_at
+                        FROM checkpoints
+                        WHERE workflow_id = $1
+                        ORDER BY state_version DESC
+                        LIMIT $2
+                        """,
+                        workflow_id,
+                        limit,
+                    )
+                else:
+                    rows = await conn.fetch(
+                        """
+                        SELECT checkpoint_id, state_version, created_at
+                        FROM checkpoints
+                        WHERE workflow_id = $1 AND state_version < $3
+                        ORDER BY state_version DESC
+                        LIMIT $2
+                        """,
+                        workflow_id,
+                        limit,
+                        before_version,
+                    )
 
         except asyncpg.PostgresError as e:
             raise DatabaseConnectionError(
@@ -245,6 +550,16 @@ class CheckpointRepository:
                 },
             ) from e
 
+        # Formatted after the connection is back in the pool
+        return [
+            {
+                "checkpoint_id": str(row["checkpoint_id"]),
+                "state_version": row["state_version"],
+                "created_at": row["created_at"].isoformat(),
+            }
+            for row in rows
+        ]
+
     async def cleanup_old_checkpoints(
         self,
         retention_hours: int = 48,
@@ -260,29 +575,37 @@ class CheckpointRepository:
         Raises:
             DatabaseConnectionError: On database errors
         """
-        if not self.pool:
-            raise DatabaseConnectionError(
-                database="postgresql",
-                operation="cleanup_old_checkpoints",
-                details={
-                    "error": "Connection pool not initialized. Call connect() first."
-                },
-            )
+        pool = self._require_pool("cleanup_old_checkpoints")
 
         cutoff_time = datetime.now(UTC) - timedelta(hours=retention_hours)
+        deleted = 0
 
         try:
-            async with self.pool.acquire() as conn:
-                result = await conn.execute(
-                    """
-                    DELETE FROM checkpoints
-                    WHERE created_at < $1
-                    """,
-                    cutoff_time,
-                )
+            # Delete in bounded batches so no single statement holds row
+            # locks (or a pool connection) for the whole backlog
+            while True:
+                async with pool.acquire() as conn:
+                    result = await conn.execute(
+                        """
+                        WITH expired AS (
+                            SELECT ctid FROM checkpoints
+                            WHERE created_at < $1
+                            LIMIT $2
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        DELETE FROM checkpoints c
+                        USING expired
+                        WHERE c.ctid = expired.ctid
+                        """,
+                        cutoff_time,
+                        _CLEANUP_BATCH_SIZE,
+                    )
                 # Extract count from result string "DELETE N"
                 count = int(result.split()[-1]) if result else 0
-                return count
+                deleted += count
+                if count < _CLEANUP_BATCH_SIZE:
+                    return deleted
+                await asyncio.sleep(0)
 
         except asyncpg.PostgresError as e:
             raise DatabaseConnectionError(
@@ -291,6 +614,7 @@ class CheckpointRepository:
                 details={
                     "error": str(e),
                     "retention_hours": retention_hours,
+                    "deleted": deleted,
                 },
             ) from e
 
@@ -318,17 +642,10 @@ class CheckpointRepository:
         Raises:
             DatabaseConnectionError: On database errors
         """
-        if not self.pool:
-            raise DatabaseConnectionError(
-                database="postgresql",
-                operation="save_workflow_metadata",
-                details={
-                    "error": "Connection pool not initialized. Call connect() first."
-                },
-            )
+        pool = self._require_pool("save_workflow_metadata")
 
         try:
-            async with self.pool.acquire() as conn:
+            async with pool.acquire() as conn:
                 await conn.execute(
                     """
                     INSERT INTO workflows (
@@ -387,34 +704,25 @@ class CheckpointRepository:
         Raises:
             DatabaseConnectionError: On database errors
         """
-        if not self.pool:
-            raise DatabaseConnectionError(
-                database="postgresql",
-                operation="log_audit_event",
-                details={
-                    "error": "Connection pool not initialized. Call connect() first."
-                },
-            )
-
-        event_id = str(uuid4())
+        pool = self._require_pool("log_audit_event")
 
         try:
-            async with self.pool.acquire() as conn:
-                await conn.execute(
+            async with pool.acquire() as conn:
+                event_id = await conn.fetchval(
                     """
                     INSERT INTO audit_events (
                         event_id, workflow_id, event_type, agent_name,
                         details, timestamp
                     )
-                    VALUES ($1, $2, $3, $4, $5, NOW())
+                    VALUES (gen_random_uuid()::text, $1, $2, $3, $4, NOW())
+                    RETURNING event_id
                     """,
-                    event_id,
                     workflow_id,
                     event_type,
                     agent_name,
-                    json.dumps(event_data or {}),
+                    event_data or {},
                 )
-                return event_id
+                return str(event_id)
 
         except asyncpg.PostgresError as e:
             raise DatabaseConnectionError(
@@ -426,3 +734,64 @@ class CheckpointRepository:
                     "event_type": event_type,
                 },
             ) from e
+
+    async def log_audit_events_bulk(
+        self,
+        events: list[dict[str, Any]],
+    ) -> list[str]:
+        """Log several audit events with one binary COPY.
+
+        Args:
+            events: Events with workflow_id, event_type, agent_name and an
+                optional event_data, as for log_audit_event()
+
+        Returns:
+            Event IDs (UUID strings), in the order of events
+
+        Raises:
+            DatabaseConnectionError: On database errors
+        """
+        pool = self._require_pool("log_audit_events_bulk")
+
+        if not events:
+            return []
+
+        timestamp = datetime.now(UTC)
+        records = [
+            (
+                str(uuid4()),
+                event["workflow_id"],
+                event["event_type"],
+                event["agent_name"],
+                event.get("event_data") or {},
+                timestamp,
+            )
+            for event in events
+        ]
+
+        try:
+            async with pool.acquire() as conn:
+                await conn.copy_records_to_table(
+                    "audit_events",
+                    records=records,
+                    columns=[
+                        "event_id",
+                        "workflow_id",
+                        "event_type",
+                        "agent_name",
+                        "details",
+                        "timestamp",
+                    ],
+                )
+
+        except asyncpg.PostgresError as e:
+            raise DatabaseConnectionError(
+                database="postgresql",
+                operation="log_audit_events_bulk",
+                details={
+                    "error": str(e),
+                    "event_count": len(events),
+                },
+            ) from e
+
+        return [record[0] for record in records]
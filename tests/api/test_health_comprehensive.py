@@ -10,12 +10,17 @@ Tests cover:
 - Socket connection failures
 """
 
+import errno
+import socket
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src import __version__
 from src.api.health import (
+    _probe_cache,
+    _probe_tcp,
     check_minio_health,
     check_postgres_health,
     check_redis_health,
@@ -28,160 +33,203 @@ from src.api.health import (
 from src.api.schemas import HealthStatus
 
 
-class TestCheckPostgresHealth:
-    """Tests for PostgreSQL health check function."""
+@pytest.fixture(autouse=True)
+def clear_probe_cache():
+    """Start every test without cached probe results."""
+    _probe_cache.clear()
+    yield
+    _probe_cache.clear()
 
-    def test_check_postgres_health_test_environment(self):
-        """Test PostgreSQL health check in test environment."""
-        with patch("src.api.health.settings.environment", "test"):
-            result = check_postgres_health()
-            assert result == HealthStatus.HEALTHY
 
-    def test_check_postgres_health_healthy(self):
-        """Test PostgreSQL health check when service is healthy."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.postgres_host", "localhost"),
-            patch("src.api.health.settings.postgres_port", 5432),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.return_value = MagicMock()
-            result = check_postgres_health()
-            assert result == HealthStatus.HEALTHY
+class TestProbeTcp:
+    """Tests for the TCP probe helper."""
+
+    def test_probe_tcp_listening_port(self):
+        """Test probing a listening port succeeds and leaves no socket open."""
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
+            _probe_tcp("127.0.0.1", port, 0.5)
+
+    def test_probe_tcp_refused_port(self):
+        """Test probing a closed port raises OSError."""
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
 
-    def test_check_postgres_health_unhealthy(self):
-        """Test PostgreSQL health check when service is unhealthy."""
+        with pytest.raises(OSError):
+            _probe_tcp("127.0.0.1", port, 0.5)
+
+    def test_probe_tcp_timeout(self):
+        """Test a probe that never completes gives up at the deadline."""
+        selector = MagicMock()
+        selector.__enter__.return_value = selector
+        selector.select.return_value = []
         with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.postgres_host", "localhost"),
-            patch("src.api.health.settings.postgres_port", 5432),
-            patch("src.api.health.socket.create_connection") as mock_socket,
+            socket.create_server(("127.0.0.1", 0)) as server,
+            patch("src.api.health.selectors.DefaultSelector", return_value=selector),
+            patch("socket.socket.connect_ex", return_value=errno.EINPROGRESS),
+        ):
+            port = server.getsockname()[1]
+            started = time.monotonic()
+            with pytest.raises(TimeoutError):
+                _probe_tcp("127.0.0.1", port, 0.05)
+
+        assert time.monotonic() - started < 1.0
+
+    def test_probe_tcp_dns_timeout(self):
+        """Test a hung DNS lookup is bounded by the same deadline."""
+        with patch(
+            "src.api.health.socket.getaddrinfo",
+            side_effect=lambda *args, **kwargs: time.sleep(0.5),
         ):
-            mock_socket.side_effect = OSError("Connection refused")
-            result = check_postgres_health()
-            assert result == HealthStatus.UNHEALTHY
+            started = time.monotonic()
+            with pytest.raises(TimeoutError):
+                _probe_tcp("db.invalid", 5432, 0.05)
+
+        assert time.monotonic() - started < 0.4
+
+
+SERVICE_PROBES = [
+    pytest.param(
+        check_postgres_health,
+        {"postgres_host": "localhost", "postgres_port": 5432},
+        ("localhost", 5432),
+        id="postgres",
+    ),
+    pytest.param(
+        check_redis_health,
+        {"redis_host": "localhost", "redis_port": 6379},
+        ("localhost", 6379),
+        id="redis",
+    ),
+    pytest.param(
+        check_minio_health,
+        {"minio_endpoint": "localhost:9000", "minio_secure": False},
+        ("localhost", 9000),
+        id="minio",
+    ),
+]
+
+
+@pytest.fixture
+def probe_env(monkeypatch):
+    """Run health checks as outside the test environment."""
+    monkeypatch.setattr("src.api.health.settings.environment", "production")
+    return monkeypatch
+
+
+@pytest.fixture
+def mock_probe():
+    """Replace the TCP probe so no connection is attempted."""
+    with patch("src.api.health._probe_tcp") as mock:
+        yield mock
+
+
+class TestCheckServiceHealth:
+    """Tests shared by the PostgreSQL, Redis and MinIO health checks."""
+
+    @pytest.mark.parametrize(("check", "service_settings", "target"), SERVICE_PROBES)
+    def test_check_health_test_environment(
+        self, check, service_settings, target, monkeypatch, mock_probe
+    ):
+        """Test health checks short-circuit in the test environment."""
+        monkeypatch.setattr("src.api.health.settings.environment", "test")
+
+        assert check() == HealthStatus.HEALTHY
+        mock_probe.assert_not_called()
+
+    @pytest.mark.parametrize(("check", "service_settings", "target"), SERVICE_PROBES)
+    def test_check_health_healthy(
+        self, check, service_settings, target, probe_env, mock_probe
+    ):
+        """Test health checks probe the configured endpoint."""
+        for name, value in service_settings.items():
+            probe_env.setattr(f"src.api.health.settings.{name}", value)
+
+        assert check() == HealthStatus.HEALTHY
+        mock_probe.assert_called_once_with(*target, 0.5)
+
+    @pytest.mark.parametrize(("check", "service_settings", "target"), SERVICE_PROBES)
+    def test_check_health_unhealthy(
+        self, check, service_settings, target, probe_env, mock_probe
+    ):
+        """Test health checks report a failed connection as unhealthy."""
+        for name, value in service_settings.items():
+            probe_env.setattr(f"src.api.health.settings.{name}", value)
+        mock_probe.side_effect = OSError("Connection refused")
+
+        assert check() == HealthStatus.UNHEALTHY
 
 
-class TestCheckRedisHealth:
-    """Tests for Redis health check function."""
+class TestCheckPostgresHealth:
+    """Tests for PostgreSQL health check function."""
 
-    def test_check_redis_health_test_environment(self):
-        """Test Redis health check in test environment."""
-        with patch("src.api.health.settings.environment", "test"):
-            result = check_redis_health()
-            assert result == HealthStatus.HEALTHY
+    def test_check_postgres_health_reuses_recent_probe(self, probe_env, mock_probe):
+        """Test repeated checks within the TTL connect only once."""
+        probe_env.setattr("src.api.health.settings.postgres_host", "localhost")
+        probe_env.setattr("src.api.health.settings.postgres_port", 5432)
+        probe_env.setattr("src.api.health.settings.health_probe_ttl_seconds", 60.0)
 
-    def test_check_redis_health_healthy(self):
-        """Test Redis health check when service is healthy."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.redis_host", "localhost"),
-            patch("src.api.health.settings.redis_port", 6379),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.return_value = MagicMock()
-            result = check_redis_health()
-            assert result == HealthStatus.HEALTHY
+        assert check_postgres_health() == HealthStatus.HEALTHY
+        mock_probe.side_effect = OSError("Connection refused")
+        assert check_postgres_health() == HealthStatus.HEALTHY
+        mock_probe.assert_called_once()
 
-    def test_check_redis_health_unhealthy(self):
-        """Test Redis health check when service is unhealthy."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.redis_host", "localhost"),
-            patch("src.api.health.settings.redis_port", 6379),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.side_effect = OSError("Connection refused")
-            result = check_redis_health()
-            assert result == HealthStatus.UNHEALTHY
+    def test_check_postgres_health_ttl_zero_always_probes(self, probe_env, mock_probe):
+        """Test a zero TTL disables probe caching."""
+        probe_env.setattr("src.api.health.settings.postgres_host", "localhost")
+        probe_env.setattr("src.api.health.settings.postgres_port", 5432)
+        probe_env.setattr("src.api.health.settings.health_probe_ttl_seconds", 0)
+
+        assert check_postgres_health() == HealthStatus.HEALTHY
+        mock_probe.side_effect = OSError("Connection refused")
+        assert check_postgres_health() == HealthStatus.UNHEALTHY
+        assert mock_probe.call_count == 2
 
 
 class TestCheckMinioHealth:
     """Tests for MinIO health check function."""
 
-    def test_check_minio_health_test_environment(self):
-        """Test MinIO health check in test environment."""
-        with patch("src.api.health.settings.environment", "test"):
-            result = check_minio_health()
-            assert result == HealthStatus.HEALTHY
-
-    def test_check_minio_health_healthy_with_protocol(self):
+    def test_check_minio_health_healthy_with_protocol(self, probe_env, mock_probe):
         """Test MinIO health check when service is healthy with protocol."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.minio_endpoint", "http://localhost:9000"),
-            patch("src.api.health.settings.minio_secure", False),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.return_value = MagicMock()
-            result = check_minio_health()
-            assert result == HealthStatus.HEALTHY
+        probe_env.setattr(
+            "src.api.health.settings.minio_endpoint", "http://localhost:9000"
+        )
+        probe_env.setattr("src.api.health.settings.minio_secure", False)
 
-    def test_check_minio_health_healthy_without_protocol(self):
-        """Test MinIO health check when service is healthy without protocol."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.minio_endpoint", "localhost:9000"),
-            patch("src.api.health.settings.minio_secure", False),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.return_value = MagicMock()
-            result = check_minio_health()
-            assert result == HealthStatus.HEALTHY
-
-    def test_check_minio_health_unhealthy(self):
-        """Test MinIO health check when service is unhealthy."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.minio_endpoint", "localhost:9000"),
-            patch("src.api.health.settings.minio_secure", False),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.side_effect = OSError("Connection refused")
-            result = check_minio_health()
-            assert result == HealthStatus.UNHEALTHY
+        result = check_minio_health()
+        assert result == HealthStatus.HEALTHY
 
-    def test_check_minio_health_invalid_endpoint(self):
+    def test_check_minio_health_invalid_endpoint(self, probe_env):
         """Test MinIO health check with invalid endpoint."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.minio_endpoint", ""),
-            patch("src.api.health.settings.minio_secure", False),
-        ):
-            result = check_minio_health()
-            assert result == HealthStatus.UNHEALTHY
+        probe_env.setattr("src.api.health.settings.minio_endpoint", "")
+        probe_env.setattr("src.api.health.settings.minio_secure", False)
 
-    def test_check_minio_health_secure_default_port(self):
+        result = check_minio_health()
+        assert result == HealthStatus.UNHEALTHY
+
+    def test_check_minio_health_secure_default_port(self, probe_env, mock_probe):
         """Test MinIO health check with secure connection default port."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.minio_endpoint", "localhost"),
-            patch("src.api.health.settings.minio_secure", True),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.return_value = MagicMock()
-            result = check_minio_health()
-            assert result == HealthStatus.HEALTHY
-            # Verify port 443 was used for secure connection
-            mock_socket.assert_called_once()
-            call_args = mock_socket.call_args
-            assert call_args[0][0][1] == 443
-
-    def test_check_minio_health_insecure_default_port(self):
+        probe_env.setattr("src.api.health.settings.minio_endpoint", "localhost")
+        probe_env.setattr("src.api.health.settings.minio_secure", True)
+
+        result = check_minio_health()
+        assert result == HealthStatus.HEALTHY
+        # Verify port 443 was used for secure connection
+        mock_probe.assert_called_once()
+        call_args = mock_probe.call_args
+        assert call_args[0][1] == 443
+
+    def test_check_minio_health_insecure_default_port(self, probe_env, mock_probe):
         """Test MinIO health check with insecure connection default port."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.minio_endpoint", "localhost"),
-            patch("src.api.health.settings.minio_secure", False),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.return_value = MagicMock()
-            result = check_minio_health()
-            assert result == HealthStatus.HEALTHY
-            # Verify port 80 was used for insecure connection
-            mock_socket.assert_called_once()
-            call_args = mock_socket.call_args
-            assert call_args[0][0][1] == 80
+        probe_env.setattr("src.api.health.settings.minio_endpoint", "localhost")
+        probe_env.setattr("src.api.health.settings.minio_secure", False)
+
+        result = check_minio_health()
+        assert result == HealthStatus.HEALTHY
+        # Verify port 80 was used for insecure connection
+        mock_probe.assert_called_once()
+        call_args = mock_probe.call_args
+        assert call_args[0][1] == 80
 
 
 class TestHealthCheckEndpoint:
@@ -273,6 +321,27 @@ class TestReadinessCheckEndpoint:
             assert response.status == HealthStatus.DEGRADED
             assert response.dependencies["postgres"] == HealthStatus.DEGRADED
 
+    @pytest.mark.asyncio
+    async def test_readiness_check_probes_concurrently(self):
+        """Test dependency probes run in parallel rather than one by one."""
+
+        def slow_probe() -> HealthStatus:
+            time.sleep(0.2)
+            return HealthStatus.HEALTHY
+
+        with (
+            patch("src.api.health.check_postgres_health", side_effect=slow_probe),
+            patch("src.api.health.check_redis_health", side_effect=slow_probe),
+            patch("src.api.health.check_minio_health", side_effect=slow_probe),
+            patch("src.api.health.bind_agent_context"),
+        ):
+            started = time.perf_counter()
+            response = await readiness_check()
+            elapsed = time.perf_counter() - started
+
+        assert response.status == HealthStatus.HEALTHY
+        assert elapsed < 0.5
+
     @pytest.mark.asyncio
     async def test_readiness_check_response_structure(self):
         """Test readiness check response structure."""
@@ -434,18 +503,14 @@ class TestHealthCheckEdgeCases:
             # Unhealthy takes precedence
             assert response.status == HealthStatus.UNHEALTHY
 
-    def test_check_minio_health_with_explicit_port(self):
+    def test_check_minio_health_with_explicit_port(self, probe_env, mock_probe):
         """Test MinIO health check with explicit port in endpoint."""
-        with (
-            patch("src.api.health.settings.environment", "production"),
-            patch("src.api.health.settings.minio_endpoint", "localhost:9001"),
-            patch("src.api.health.settings.minio_secure", False),
-            patch("src.api.health.socket.create_connection") as mock_socket,
-        ):
-            mock_socket.return_value = MagicMock()
-            result = check_minio_health()
-            assert result == HealthStatus.HEALTHY
-            # Verify explicit port was used
-            mock_socket.assert_called_once()
-            call_args = mock_socket.call_args
-            assert call_args[0][0][1] == 9001
+        probe_env.setattr("src.api.health.settings.minio_endpoint", "localhost:9001")
+        probe_env.setattr("src.api.health.settings.minio_secure", False)
+
+        result = check_minio_health()
+        assert result == HealthStatus.HEALTHY
+        # Verify explicit port was used
+        mock_probe.assert_called_once()
+        call_args = mock_probe.call_args
+        assert call_args[0][1] == 9001
@@ -141,9 +141,9 @@ class TestCheckpointManagerAput:
         """Test aput() saves checkpoint to repository."""
         # Arrange
         manager = CheckpointManager(settings=mock_settings)
-        manager.repository.save_checkpoint = AsyncMock(return_value="checkpoint-123")
-        manager.repository.save_workflow_metadata = AsyncMock()
-        manager.repository.log_audit_event = AsyncMock()
+        manager.repository.save_checkpoint_bundle = AsyncMock(
+            return_value="checkpoint-123"
+        )
 
         config = {"workflow_id": "test-workflow-456"}
         checkpoint = {
@@ -161,7 +161,7 @@ class TestCheckpointManagerAput:
         result_config = await manager.aput(config, checkpoint, metadata, {})
 
         # Assert
-        manager.repository.save_checkpoint.assert_called_once()
+        manager.repository.save_checkpoint_bundle.assert_called_once()
         assert result_config["checkpoint_id"] == "checkpoint-123"
 
     @pytest.mark.asyncio
@@ -173,9 +173,9 @@ class TestCheckpointManagerAput:
         """Test aput() saves workflow metadata."""
         # Arrange
         manager = CheckpointManager(settings=mock_settings)
-        manager.repository.save_checkpoint = AsyncMock(return_value="checkpoint-123")
-        manager.repository.save_workflow_metadata = AsyncMock()
-        manager.repository.log_audit_event = AsyncMock()
+        manager.repository.save_checkpoint_bundle = AsyncMock(
+            return_value="checkpoint-123"
+        )
 
         config = {"workflow_id": "test-workflow-456"}
         checkpoint = {
@@ -193,8 +193,8 @@ class TestCheckpointManagerAput:
         await manager.aput(config, checkpoint, metadata, {})
 
         # Assert
-        manager.repository.save_workflow_metadata.assert_called_once()
-        call_kwargs = manager.repository.save_workflow_metadata.call_args.kwargs
+        manager.repository.save_checkpoint_bundle.assert_called_once()
+        call_kwargs = manager.repository.save_checkpoint_bundle.call_args.kwargs
         assert call_kwargs["workflow_id"] == "test-workflow-456"
         assert call_kwargs["user_request"] == "Test checkpoint functionality"
         assert call_kwargs["budget_used_usd"] == 0.01
@@ -208,9 +208,9 @@ class TestCheckpointManagerAput:
         """Test aput() logs audit event."""
         # Arrange
         manager = CheckpointManager(settings=mock_settings)
-        manager.repository.save_checkpoint = AsyncMock(return_value="checkpoint-123")
-        manager.repository.save_workflow_metadata = AsyncMock()
-        manager.repository.log_audit_event = AsyncMock()
+        manager.repository.save_checkpoint_bundle = AsyncMock(
+            return_value="checkpoint-123"
+        )
 
         config = {"workflow_id": "test-workflow-456"}
         checkpoint = {
@@ -228,8 +228,8 @@ class TestCheckpointManagerAput:
         await manager.aput(config, checkpoint, metadata, {})
 
         # Assert
-        manager.repository.log_audit_event.assert_called_once()
-        call_kwargs = manager.repository.log_audit_event.call_args.kwargs
+        manager.repository.save_checkpoint_bundle.assert_called_once()
+        call_kwargs = manager.repository.save_checkpoint_bundle.call_args.kwargs
         assert call_kwargs["event_type"] == "CHECKPOINT_SAVED"
         assert call_kwargs["agent_name"] == "CheckpointManager"
 
@@ -323,8 +323,11 @@ class TestCheckpointManagerAlist:
                 },
             ]
         )
-        manager.repository.load_checkpoint = AsyncMock(
-            return_value=sample_workflow_state
+        manager.repository.load_checkpoints_bulk = AsyncMock(
+            return_value={
+                "checkpoint-1": sample_workflow_state,
+                "checkpoint-2": sample_workflow_state,
+            }
         )
 
         config = {"configurable": {"workflow_id": "test-workflow-456"}}
@@ -337,6 +340,9 @@ class TestCheckpointManagerAlist:
         # Assert
         assert len(checkpoints) == 2
         manager.repository.list_checkpoints.assert_called_once()
+        manager.repository.load_checkpoints_bulk.assert_awaited_once_with(
+            ["checkpoint-1", "checkpoint-2"]
+        )
 
     @pytest.mark.asyncio
     async def test_alist_respects_limit(
@@ -6,11 +6,12 @@ import os
 from unittest.mock import MagicMock
 
 import pytest
+from langgraph.errors import GraphRecursionError
 from langgraph.graph import END
 
 from src.config import Settings
 from src.exceptions import BudgetExhaustedError, InfiniteLoopDetectedError
-from src.orchestration.controller import OrchestrationController
+from src.orchestration.controller import OrchestrationController, _make_budget_check
 
 
 pytestmark = pytest.mark.skipif(
@@ -20,12 +21,18 @@ pytestmark = pytest.mark.skipif(
 
 
 class AsyncGraph:
-    def __init__(self, updates):
+    def __init__(self, updates, error=None):
         self._updates = updates
+        self._error = error
+        self.config = None
 
-    async def astream(self, _state, _config):
+    async def astream(self, _state, config, stream_mode="updates"):
+        assert stream_mode == "values"
+        self.config = config
         for update in self._updates:
             yield update
+        if self._error is not None:
+            raise self._error
 
 
 def _make_state(workflow_id: str, remaining_tokens: int) -> dict:
@@ -63,8 +70,8 @@ async def test_execute_workflow_happy_path(controller) -> None:
     workflow_id = "wf-1"
     controller.graph = AsyncGraph(
         [
-            {"tier_1_requirements": _make_state(workflow_id, 10)},
-            {"tier_2_planner": _make_state(workflow_id, 5)},
+            _make_state(workflow_id, 10),
+            _make_state(workflow_id, 5),
         ]
     )
 
@@ -75,14 +82,13 @@ async def test_execute_workflow_happy_path(controller) -> None:
 
 
 @pytest.mark.asyncio
-async def test_execute_workflow_budget_exhausted(controller) -> None:
-    workflow_id = "wf-2"
-    controller.graph = AsyncGraph(
-        [{"tier_1_requirements": _make_state(workflow_id, 0)}]
-    )
+async def test_budget_check_node_raises_when_exhausted() -> None:
+    budget_check = _make_budget_check(1000)
+
+    assert await budget_check(_make_state("wf-2", 10)) == {}
 
     with pytest.raises(BudgetExhaustedError):
-        await controller.execute_workflow("Do work", workflow_id)
+        await budget_check(_make_state("wf-2", 0))
 
 
 @pytest.mark.asyncio
@@ -90,23 +96,22 @@ async def test_execute_workflow_infinite_loop(controller) -> None:
     controller.max_iterations = 1
     workflow_id = "wf-3"
     controller.graph = AsyncGraph(
-        [
-            {"tier_1_requirements": _make_state(workflow_id, 10)},
-            {"tier_2_planner": _make_state(workflow_id, 10)},
-        ]
+        [_make_state(workflow_id, 10)],
+        error=GraphRecursionError("Recursion limit of 1 reached"),
     )
 
     with pytest.raises(InfiniteLoopDetectedError):
         await controller.execute_workflow("Do work", workflow_id)
 
 
-def test_routing_functions(controller) -> None:
+@pytest.mark.asyncio
+async def test_routing_functions(controller) -> None:
     state = _make_state("wf-4", 10)
 
-    assert controller._route_validator_output(state) == "tier_1_architect"
+    assert (await controller._tier_1_validator(state)).goto == "tier_1_architect"
 
     state["blocking_issues"] = ["issue"]
-    assert controller._route_validator_output(state) == "tier_0_deviation"
+    assert (await controller._tier_1_validator(state)).goto == "tier_0_deviation"
 
     state["blocking_issues"] = []
     assert controller._route_deviation_output(state) == "tier_1_requirements"
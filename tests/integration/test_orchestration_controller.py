@@ -1,7 +1,7 @@
 """Integration tests for OrchestrationController with mock agents."""
 
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -35,7 +35,8 @@ def mock_budget_guard() -> MagicMock:
     """Create mock budget guard."""
     guard = MagicMock(spec=BudgetGuard)
     guard.reserve_budget = MagicMock()
-    guard.record_usage = MagicMock()
+    guard.refresh_monthly_usage = AsyncMock()
+    guard.record_usage_async = AsyncMock()
     return guard
 
 
@@ -335,13 +336,14 @@ class TestOrchestrationControllerTierNodes:
 class TestOrchestrationControllerRoutingLogic:
     """Test OrchestrationController routing decision functions."""
 
-    def test_route_validator_output_with_no_issues(
+    @pytest.mark.asyncio
+    async def test_validator_routes_with_no_issues(
         self,
         mock_settings: Settings,
         mock_budget_guard: MagicMock,
         mock_checkpoint_manager: MagicMock,
     ) -> None:
-        """Test _route_validator_output() with no blocking issues."""
+        """Test _tier_1_validator() routing with no blocking issues."""
         # Arrange
         controller = OrchestrationController(
             settings=mock_settings,
@@ -389,18 +391,19 @@ class TestOrchestrationControllerRoutingLogic:
         }
 
         # Act
-        route = controller._route_validator_output(state)
+        route = (await controller._tier_1_validator(state)).goto
 
         # Assert
         assert route == "tier_1_architect"
 
-    def test_route_validator_output_with_blocking_issues(
+    @pytest.mark.asyncio
+    async def test_validator_routes_with_blocking_issues(
         self,
         mock_settings: Settings,
         mock_budget_guard: MagicMock,
         mock_checkpoint_manager: MagicMock,
     ) -> None:
-        """Test _route_validator_output() with blocking issues."""
+        """Test _tier_1_validator() routing with blocking issues."""
         # Arrange
         controller = OrchestrationController(
             settings=mock_settings,
@@ -448,7 +451,7 @@ class TestOrchestrationControllerRoutingLogic:
         }
 
         # Act
-        route = controller._route_validator_output(state)
+        route = (await controller._tier_1_validator(state)).goto
 
         # Assert
         assert route == "tier_0_deviation"
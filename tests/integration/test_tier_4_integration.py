@@ -5,6 +5,7 @@ import pytest
 from src.agents.tier_4.product_validator import ProductValidatorAgent
 from src.agents.tier_4.security_validator import SecurityValidatorAgent
 from src.llm.base_client import LLMResponse
+from src.orchestration.budget_guard import BudgetGuard
 from src.orchestration.state import WorkflowState
 
 
@@ -12,7 +13,7 @@ from src.orchestration.state import WorkflowState
 def mock_deps():
     return {
         "llm_client": AsyncMock(),
-        "budget_guard": MagicMock(),
+        "budget_guard": MagicMock(spec=BudgetGuard),
         "settings": MagicMock(),
     }
 
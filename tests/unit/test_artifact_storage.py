@@ -1,11 +1,40 @@
 """Unit tests for ArtifactStorage (MinIO client)."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import gzip
+import io
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import urllib3
+from minio import Minio
+from minio.error import S3Error
 
 from src.exceptions import StorageError
-from src.storage.artifact_storage import ArtifactStorage
+from src.storage import artifact_storage
+from src.storage.artifact_storage import (
+    ArtifactStorage,
+    _checked_buckets,
+    _download_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_checked_buckets():
+    """Forget which buckets were checked so each test starts cold."""
+    _checked_buckets.clear()
+    yield
+    _checked_buckets.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_download_cache(monkeypatch):
+    """Start every test with an empty process-wide download cache."""
+    _download_cache.clear()
+    monkeypatch.setattr(artifact_storage, "_download_cache_bytes", 0)
+    yield
+    _download_cache.clear()
 
 
 @pytest.fixture
@@ -84,6 +113,78 @@ class TestArtifactStorageInit:
         ):
             ArtifactStorage()
 
+    def test_init_checks_bucket_once_per_process(self):
+        """Test only the first instance pays the bucket round-trip."""
+        mock_client = MagicMock()
+        mock_client.bucket_exists = MagicMock(return_value=True)
+
+        with patch("src.storage.artifact_storage.Minio", return_value=mock_client):
+            ArtifactStorage()
+            ArtifactStorage()
+
+        mock_client.bucket_exists.assert_called_once()
+
+    def test_init_can_skip_bucket_check(self):
+        """Test ensure_bucket=False never touches the bucket."""
+        mock_client = MagicMock()
+
+        with patch("src.storage.artifact_storage.Minio", return_value=mock_client):
+            ArtifactStorage(ensure_bucket=False)
+
+        mock_client.bucket_exists.assert_not_called()
+
+    def test_init_rechecks_bucket_after_failure(self):
+        """Test a failed check is retried by the next instance."""
+        from minio.error import S3Error
+
+        mock_client = MagicMock()
+        mock_client.bucket_exists = MagicMock(
+            side_effect=[
+                S3Error(
+                    response=MagicMock(),
+                    code="AccessDenied",
+                    message="denied",
+                    resource="/agent-artifacts",
+                    request_id="test-request-id",
+                    host_id="test-host-id",
+                ),
+                True,
+            ]
+        )
+
+        with patch("src.storage.artifact_storage.Minio", return_value=mock_client):
+            with pytest.raises(StorageError):
+                ArtifactStorage()
+            ArtifactStorage()
+
+        assert mock_client.bucket_exists.call_count == 2
+
+    def test_init_shares_http_pool(self):
+        """Test every instance's MinIO client reuses one connection pool."""
+        with patch(
+            "src.storage.artifact_storage.Minio", return_value=MagicMock()
+        ) as mock_minio:
+            ArtifactStorage()
+            ArtifactStorage()
+
+        first, second = (
+            call.kwargs["http_client"] for call in mock_minio.call_args_list
+        )
+        assert first is second
+        assert isinstance(first, urllib3.PoolManager)
+
+    @pytest.mark.anyio
+    async def test_blocking_calls_use_dedicated_executor(self, storage):
+        """Test MinIO calls run on the minio-io pool, not the default one."""
+        thread_names = []
+        storage.client.put_object = MagicMock(
+            side_effect=lambda **_: thread_names.append(threading.current_thread().name)
+        )
+
+        await storage.upload_artifact("wf-001", "code/main.py", b"x")
+
+        assert thread_names[0].startswith("minio-io")
+
 
 class TestUploadArtifact:
     """Test upload_artifact method."""
@@ -137,6 +238,64 @@ class TestUploadArtifact:
 
         assert result == f"{workflow_id}/{artifact_path}"
         storage.client.put_object.assert_called_once()
+        part_size = storage.client.put_object.call_args.kwargs["part_size"]
+        assert part_size >= 5 * 1024 * 1024
+
+    @pytest.mark.anyio
+    async def test_upload_artifact_compresses_text(self, storage):
+        """Test text artifacts are stored gzip-compressed."""
+        content = "log line\n" * 1000
+
+        await storage.upload_artifact("wf-001", "logs/run.log", content, "text/plain")
+
+        kwargs = storage.client.put_object.call_args.kwargs
+        assert kwargs["metadata"] == {"Content-Encoding": "gzip"}
+        assert kwargs["length"] < len(content)
+        assert gzip.decompress(kwargs["data"].read()) == content.encode()
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("artifact_path", "content", "content_type"),
+        [
+            ("bin/model.bin", b"\x00" * 4096, "application/octet-stream"),
+            ("code/main.py", b"x = 1\n", "text/x-python"),
+        ],
+    )
+    async def test_upload_artifact_skips_compression(
+        self, storage, artifact_path, content, content_type
+    ):
+        """Test binary and tiny artifacts are stored as-is."""
+        await storage.upload_artifact("wf-001", artifact_path, content, content_type)
+
+        kwargs = storage.client.put_object.call_args.kwargs
+        assert kwargs["metadata"] is None
+        assert kwargs["data"].read() == content
+
+    @pytest.mark.anyio
+    async def test_upload_artifact_file_streams_from_disk(self, storage, tmp_path):
+        """Test file uploads go through fput_object instead of memory."""
+        log_file = tmp_path / "execution.log"
+        log_file.write_text("line\n")
+        storage.client.fput_object = MagicMock()
+
+        result = await storage.upload_artifact_file(
+            "wf-001", "logs/execution.log", str(log_file), "text/plain"
+        )
+
+        assert result == "wf-001/logs/execution.log"
+        kwargs = storage.client.fput_object.call_args.kwargs
+        assert kwargs["file_path"] == str(log_file)
+        storage.client.put_object.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_upload_artifact_file_missing_file(self, storage, tmp_path):
+        """Test a missing local file surfaces as StorageError."""
+        storage.client.fput_object = MagicMock(side_effect=FileNotFoundError("gone"))
+
+        with pytest.raises(StorageError):
+            await storage.upload_artifact_file(
+                "wf-001", "logs/execution.log", str(tmp_path / "missing.log")
+            )
 
 
 class TestDownloadArtifact:
@@ -162,6 +321,183 @@ class TestDownloadArtifact:
         mock_response.close.assert_called_once()
         mock_response.release_conn.assert_called_once()
 
+    @pytest.mark.anyio
+    async def test_download_artifact_reads_off_event_loop(self, storage):
+        """Test the body is read and released on the I/O pool thread."""
+        thread_names = []
+
+        def read():
+            thread_names.append(threading.current_thread().name)
+            return b"test content"
+
+        mock_response = MagicMock()
+        mock_response.read = MagicMock(side_effect=read)
+        storage.client.get_object = MagicMock(return_value=mock_response)
+
+        result = await storage.download_artifact("wf-001", "code/main.py")
+
+        assert result == b"test content"
+        assert thread_names[0].startswith("minio-io")
+        mock_response.release_conn.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_download_artifact_decodes_gzip(self, storage):
+        """Test gzip-encoded objects come back as the original bytes."""
+        content = b"# Report\n" * 1000
+        storage.client.get_object = MagicMock(
+            return_value=urllib3.HTTPResponse(
+                body=io.BytesIO(gzip.compress(content)),
+                headers={"Content-Encoding": "gzip"},
+                preload_content=False,
+            )
+        )
+
+        assert await storage.download_artifact("wf-001", "reports/QA.md") == content
+
+    @pytest.mark.anyio
+    async def test_download_artifact_to_streams_chunks(self, storage):
+        """Test download_artifact_to writes chunks into the sink."""
+        mock_response = MagicMock()
+        mock_response.stream = MagicMock(return_value=iter([b"abc", b"def"]))
+        storage.client.get_object = MagicMock(return_value=mock_response)
+        sink = io.BytesIO()
+
+        size = await storage.download_artifact_to(
+            "wf-001", "logs/execution.log", sink, chunk_size=3
+        )
+
+        assert size == 6
+        assert sink.getvalue() == b"abcdef"
+        mock_response.stream.assert_called_once_with(amt=3)
+        mock_response.read.assert_not_called()
+        mock_response.close.assert_called_once()
+        mock_response.release_conn.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_download_artifact_to_releases_on_sink_error(self, storage):
+        """Test the response is released when writing to the sink fails."""
+        mock_response = MagicMock()
+        mock_response.stream = MagicMock(return_value=iter([b"abc"]))
+        storage.client.get_object = MagicMock(return_value=mock_response)
+        sink = MagicMock()
+        sink.write = MagicMock(side_effect=OSError("disk full"))
+
+        with pytest.raises(StorageError):
+            await storage.download_artifact_to("wf-001", "logs/execution.log", sink)
+
+        mock_response.close.assert_called_once()
+        mock_response.release_conn.assert_called_once()
+
+
+class TestDownloadCache:
+    """Test the ETag-validated download cache."""
+
+    def _mock_get(self, storage, content, etag='"etag-1"'):
+        """Helper to mock get_object returning content with an ETag."""
+        response = MagicMock()
+        response.read = MagicMock(return_value=content)
+        response.headers = {"ETag": etag}
+        storage.client.get_object = MagicMock(return_value=response)
+
+    @pytest.mark.anyio
+    async def test_repeat_download_served_from_cache(self, storage):
+        """Test an unchanged ETag skips the GET."""
+        self._mock_get(storage, b"# Report")
+        storage.client.stat_object = MagicMock(return_value=MagicMock(etag="etag-1"))
+
+        first = await storage.download_artifact("wf-001", "reports/QA.md")
+        second = await storage.download_artifact("wf-001", "reports/QA.md")
+
+        assert first == second == b"# Report"
+        storage.client.get_object.assert_called_once()
+        storage.client.stat_object.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_changed_etag_refetches(self, storage):
+        """Test a changed object is downloaded again."""
+        self._mock_get(storage, b"v1")
+        await storage.download_artifact("wf-001", "reports/QA.md")
+        self._mock_get(storage, b"v2", etag='"etag-2"')
+        storage.client.stat_object = MagicMock(return_value=MagicMock(etag="etag-2"))
+
+        assert await storage.download_artifact("wf-001", "reports/QA.md") == b"v2"
+        storage.client.get_object.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_delete_invalidates_cache(self, storage):
+        """Test deleting an artifact drops its cached content."""
+        self._mock_get(storage, b"# Report")
+        await storage.download_artifact("wf-001", "reports/QA.md")
+
+        await storage.delete_artifact("wf-001", "reports/QA.md")
+
+        assert _download_cache == {}
+        assert artifact_storage._download_cache_bytes == 0
+
+    @pytest.mark.anyio
+    async def test_cache_evicts_least_recently_used(self, storage):
+        """Test the cache stays within its byte budget."""
+        with patch(
+            "src.storage.artifact_storage.settings.artifact_cache_max_bytes", 10
+        ):
+            for name in ("a", "b", "c"):
+                self._mock_get(storage, b"x" * 4)
+                await storage.download_artifact("wf-001", name)
+
+        assert [name for _, name in _download_cache] == ["wf-001/b", "wf-001/c"]
+        assert artifact_storage._download_cache_bytes == 8
+
+    @pytest.mark.anyio
+    async def test_cache_shared_across_instances(self, storage, mock_minio_client):
+        """Test the byte budget covers every instance in the process."""
+        with patch(
+            "src.storage.artifact_storage.Minio", return_value=mock_minio_client
+        ):
+            other = ArtifactStorage()
+        self._mock_get(storage, b"# Report")
+        await storage.download_artifact("wf-001", "reports/QA.md")
+        storage.client.stat_object = MagicMock(return_value=MagicMock(etag="etag-1"))
+
+        assert await other.download_artifact("wf-001", "reports/QA.md") == b"# Report"
+        storage.client.get_object.assert_called_once()
+        assert artifact_storage._download_cache_bytes == len(b"# Report")
+
+
+class TestMultiArtifactTransfers:
+    """Test upload_artifacts and download_artifacts methods."""
+
+    @pytest.mark.anyio
+    async def test_upload_artifacts_bounded_concurrency(self, storage):
+        """Test uploads run concurrently up to the limit and keep item order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_upload(workflow_id, artifact_path, _content, _content_type):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"{workflow_id}/{artifact_path}"
+
+        storage.upload_artifact = fake_upload
+        items = [(f"code/f{i}.py", b"x", "text/x-python") for i in range(5)]
+
+        result = await storage.upload_artifacts("wf-001", items, concurrency=2)
+
+        assert result == [f"wf-001/code/f{i}.py" for i in range(5)]
+        assert max_in_flight == 2
+
+    @pytest.mark.anyio
+    async def test_download_artifacts_keeps_order(self, storage):
+        """Test downloads return contents in the order of the paths."""
+        storage.download_artifact = AsyncMock(side_effect=[b"a", b"b"])
+
+        result = await storage.download_artifacts("wf-001", ["a.txt", "b.txt"])
+
+        assert result == [b"a", b"b"]
+        storage.download_artifact.assert_any_await("wf-001", "b.txt")
+
 
 class TestListArtifacts:
     """Test list_artifacts method."""
@@ -177,7 +513,7 @@ class TestListArtifacts:
 
         storage.client.list_objects = MagicMock(return_value=[mock_obj1, mock_obj2])
 
-        result = await storage.list_artifacts(workflow_id="wf-001")
+        result = await storage.list_artifacts_all(workflow_id="wf-001")
 
         assert len(result) == 2
         assert "code/main.py" in result
@@ -188,10 +524,66 @@ class TestListArtifacts:
         """Test listing artifacts when none exist."""
         storage.client.list_objects = MagicMock(return_value=[])
 
-        result = await storage.list_artifacts(workflow_id="wf-001")
+        result = await storage.list_artifacts_all(workflow_id="wf-001")
 
         assert result == []
 
+    @pytest.mark.anyio
+    async def test_list_artifacts_streams_pages(self, storage):
+        """Test listing continues after the last key of each full page."""
+        first_page = [MagicMock(object_name=f"wf-001/f{i:04d}") for i in range(1000)]
+        last_page = [MagicMock(object_name="wf-001/zz")]
+        storage.client.list_objects = MagicMock(side_effect=[first_page, last_page])
+
+        result = [path async for path in storage.list_artifacts("wf-001")]
+
+        assert len(result) == 1001
+        assert result[-1] == "zz"
+        calls = storage.client.list_objects.call_args_list
+        assert [call.kwargs["start_after"] for call in calls] == [None, "wf-001/f0999"]
+
+
+class TestArtifactExists:
+    """Test artifact_exists method."""
+
+    @staticmethod
+    def _s3_error(code):
+        return S3Error(
+            response=MagicMock(),
+            code=code,
+            message="error",
+            resource="/agent-artifacts/wf-001/a.json",
+            request_id="test-request-id",
+            host_id="test-host-id",
+        )
+
+    @pytest.mark.anyio
+    async def test_artifact_exists(self, storage):
+        """Test an object found by HEAD exists."""
+        storage.client.stat_object = MagicMock()
+
+        assert await storage.artifact_exists("wf-001", "a.json") is True
+        storage.client.stat_object.assert_called_once_with(
+            bucket_name=storage.bucket_name, object_name="wf-001/a.json"
+        )
+
+    @pytest.mark.anyio
+    async def test_artifact_missing(self, storage):
+        """Test a missing object reports False."""
+        storage.client.stat_object = MagicMock(side_effect=self._s3_error("NoSuchKey"))
+
+        assert await storage.artifact_exists("wf-001", "a.json") is False
+
+    @pytest.mark.anyio
+    async def test_artifact_exists_error(self, storage):
+        """Test other S3 errors raise StorageError."""
+        storage.client.stat_object = MagicMock(
+            side_effect=self._s3_error("AccessDenied")
+        )
+
+        with pytest.raises(StorageError):
+            await storage.artifact_exists("wf-001", "a.json")
+
 
 class TestDeleteWorkflowArtifacts:
     """Test delete_workflow_artifacts method."""
@@ -206,23 +598,86 @@ class TestDeleteWorkflowArtifacts:
         mock_obj2.object_name = "wf-001/reports/VALIDATION_REPORT.md"
 
         storage.client.list_objects = MagicMock(return_value=[mock_obj1, mock_obj2])
-        storage.client.remove_object = MagicMock()
+        storage.client.remove_objects = MagicMock(return_value=iter([]))
 
         result = await storage.delete_workflow_artifacts(workflow_id="wf-001")
 
         assert result == 2
-        assert storage.client.remove_object.call_count == 2
+        storage.client.remove_objects.assert_called_once()
+        bucket, delete_objects = storage.client.remove_objects.call_args.args
+        assert bucket == storage.bucket_name
+        assert [obj.name for obj in delete_objects] == [
+            "wf-001/code/main.py",
+            "wf-001/reports/VALIDATION_REPORT.md",
+        ]
+        storage.client.remove_object.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_delete_workflow_artifacts_counts_failures(self, storage):
+        """Test objects the batch delete reports as failed are not counted."""
+        storage.client.list_objects = MagicMock(
+            return_value=[
+                MagicMock(object_name="wf-001/a.txt"),
+                MagicMock(object_name="wf-001/b.txt"),
+            ]
+        )
+        failure = MagicMock()
+        failure.name = "wf-001/b.txt"
+        failure.message = "Access Denied"
+        storage.client.remove_objects = MagicMock(return_value=iter([failure]))
+
+        result = await storage.delete_workflow_artifacts(workflow_id="wf-001")
+
+        assert result == 1
 
     @pytest.mark.anyio
     async def test_delete_workflow_artifacts_empty(self, storage):
         """Test deletion when no artifacts exist."""
         storage.client.list_objects = MagicMock(return_value=[])
-        storage.client.remove_object = MagicMock()
+        storage.client.remove_objects = MagicMock()
 
         result = await storage.delete_workflow_artifacts(workflow_id="wf-001")
 
         assert result == 0
-        storage.client.remove_object.assert_not_called()
+        storage.client.remove_objects.assert_not_called()
+
+
+class TestArtifactUrls:
+    """Test presigned URL generation."""
+
+    @pytest.fixture
+    def offline_storage(self, storage):
+        """Storage whose client points at a port nothing listens on."""
+        storage.client = Minio(
+            "localhost:1",
+            access_key="minioadmin",
+            secret_key="minioadmin123",
+            secure=False,
+            region="us-east-1",
+        )
+        return storage
+
+    @pytest.mark.anyio
+    async def test_get_artifact_url_signs_locally(self, offline_storage):
+        """Test a URL is signed without contacting the server."""
+        url = await offline_storage.get_artifact_url(
+            "wf-001", "reports/QA.md", expires_hours=1
+        )
+
+        assert "/wf-001/reports/QA.md?" in url
+        assert "X-Amz-Expires=3600" in url
+        assert "X-Amz-Signature=" in url
+
+    @pytest.mark.anyio
+    async def test_get_artifact_urls_keeps_order(self, offline_storage):
+        """Test batch signing returns one URL per path in order."""
+        urls = await offline_storage.get_artifact_urls(
+            "wf-001", ["code/main.py", "reports/QA.md"]
+        )
+
+        assert len(urls) == 2
+        assert "/wf-001/code/main.py?" in urls[0]
+        assert "/wf-001/reports/QA.md?" in urls[1]
 
 
 class TestArtifactStorageEdgeCases:
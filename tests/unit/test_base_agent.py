@@ -35,7 +35,8 @@ def mock_llm_client():
 def mock_budget_guard():
     guard = MagicMock()
     guard.reserve_budget = MagicMock()
-    guard.record_usage = MagicMock()
+    guard.refresh_monthly_usage = AsyncMock()
+    guard.record_usage_async = AsyncMock()
     return guard
 
 
@@ -88,7 +89,7 @@ async def test_execute_success(
     mock_llm_client.generate.assert_called_once()
 
     # Verify budget recording
-    mock_budget_guard.record_usage.assert_called_once_with(
+    mock_budget_guard.record_usage_async.assert_called_once_with(
         operation_name="TestAgent.execute",
         tokens_used=100,
         cost_usd=0.001,
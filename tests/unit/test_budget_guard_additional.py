@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import json
+import time
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,19 +17,51 @@ class _FakeCache:
         self._data = data
         self._connect_error = connect_error
         self.set_calls: list[tuple[str, str, int | None]] = []
+        self.script_calls: list[tuple[list[str], list]] = []
+        self.counters: dict[str, float] = {}
+        self.get_calls = 0
+        self.hgetall_calls = 0
 
     async def connect(self) -> None:
         if self._connect_error:
             raise RuntimeError("connect failed")
 
-    async def get(self, _key: str) -> str | None:
+    async def get(self, key: str) -> str | None:
+        self.get_calls += 1
+        value = self.counters.get(key)
+        return None if value is None else str(value)
+
+    async def increment_float(self, key: str, amount: float, expire_at=None) -> float:
+        self.counters[key] = self.counters.get(key, 0.0) + amount
+        return self.counters[key]
+
+    async def hgetall(self, _key: str) -> dict[str, str]:
+        self.hgetall_calls += 1
         if self._data is None:
-            return None
-        return json.dumps(self._data)
+            return {}
+        return {field: str(value) for field, value in self._data.items()}
 
     async def set(self, key: str, value: str, ttl_seconds: int | None = None) -> None:
         self.set_calls.append((key, value, ttl_seconds))
 
+    async def run_script(self, _script: str, keys: list[str], args: list) -> list:
+        """Emulate the reserve script: check caps, then apply the increment."""
+        self.script_calls.append((keys, args))
+        tokens, cost, max_tokens, max_usd = args[:4]
+        data = self._data or {"tokens_used": 0, "cost_used": 0.0}
+        month_used = self.counters.get(keys[1], 0.0)
+        new_tokens = data["tokens_used"] + tokens
+        new_cost = data["cost_used"] + cost
+        if new_tokens > max_tokens or new_cost > max_usd or month_used + cost > max_usd:
+            return [
+                0,
+                str(data["tokens_used"]),
+                str(data["cost_used"]),
+                str(month_used),
+            ]
+        self._data = {"tokens_used": new_tokens, "cost_used": new_cost}
+        return [1, str(new_tokens), str(new_cost), str(month_used)]
+
 
 def _state() -> dict:
     return {
@@ -77,6 +110,68 @@ def test_reserve_budget_warns_on_cost_threshold() -> None:
     assert result["alert"] is not None
 
 
+@pytest.mark.parametrize(
+    ("estimated_tokens", "expect_alert"),
+    [(24, False), (25, True)],
+)
+def test_reserve_budget_token_threshold_boundary(
+    estimated_tokens: int, expect_alert: bool
+) -> None:
+    guard = BudgetGuard(
+        max_tokens_per_workflow=100,
+        max_monthly_budget_usd=100.0,
+        alert_threshold_pct=75.0,
+    )
+
+    result = guard.reserve_budget(
+        "op",
+        estimated_tokens=estimated_tokens,
+        estimated_cost_usd=0.0,
+        workflow_state=_state(),
+    )
+
+    assert (result["alert"] is not None) is expect_alert
+    if expect_alert:
+        assert result["alert"].startswith("Token budget at 75.0%")
+
+
+def test_reserve_budget_below_thresholds_skips_alert_path() -> None:
+    guard = BudgetGuard(
+        max_tokens_per_workflow=1_000,
+        max_monthly_budget_usd=float("inf"),
+        alert_threshold_pct=75.0,
+    )
+    guard.current_month_used_usd = 1_000_000.0
+
+    with patch("src.orchestration.budget_guard.logger") as mock_logger:
+        first = guard.reserve_budget(
+            "op", estimated_tokens=10, estimated_cost_usd=1.0, workflow_state=_state()
+        )
+        second = guard.reserve_budget(
+            "op", estimated_tokens=10, estimated_cost_usd=1.0, workflow_state=_state()
+        )
+
+    assert first == {"allowed": True, "reason": "Budget available", "alert": None}
+    # Each call gets its own result so callers can't corrupt a shared one
+    assert first is not second
+    mock_logger.warning.assert_not_called()
+    mock_logger.error.assert_not_called()
+
+
+def test_reserve_budget_logs_without_binding() -> None:
+    guard = BudgetGuard()
+
+    with patch("src.orchestration.budget_guard.logger") as mock_logger:
+        guard.reserve_budget(
+            "op", estimated_tokens=1, estimated_cost_usd=0.01, workflow_state=_state()
+        )
+
+    mock_logger.bind.assert_not_called()
+    kwargs = mock_logger.info.call_args.kwargs
+    assert kwargs["workflow_id"] == "wf-1"
+    assert kwargs["operation"] == "op"
+
+
 @pytest.mark.asyncio
 async def test_check_budget_requires_workflow_id() -> None:
     guard = BudgetGuard()
@@ -123,6 +218,70 @@ async def test_check_budget_raises_when_over_limit() -> None:
         )
 
 
+@pytest.mark.asyncio
+async def test_check_budget_reuses_recent_workflow_usage() -> None:
+    cache = _FakeCache({"tokens_used": 10, "cost_used": 1.0})
+    guard = BudgetGuard(
+        max_tokens_per_workflow=100,
+        max_monthly_budget_usd=10.0,
+        cache=cache,
+    )
+
+    first = await guard.check_budget(workflow_id="wf-1", estimated_tokens=5)
+    second = await guard.check_budget(workflow_id="wf-1", estimated_tokens=5)
+
+    assert first["remaining_tokens"] == second["remaining_tokens"] == 90
+    assert cache.hgetall_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_check_budget_rereads_after_ttl() -> None:
+    cache = _FakeCache({"tokens_used": 10, "cost_used": 1.0})
+    guard = BudgetGuard(
+        max_tokens_per_workflow=100,
+        max_monthly_budget_usd=10.0,
+        cache=cache,
+    )
+
+    await guard.check_budget(workflow_id="wf-1", estimated_tokens=5)
+    with patch(
+        "src.orchestration.budget_guard.time.monotonic",
+        return_value=time.monotonic() + 1.0,
+    ):
+        await guard.check_budget(workflow_id="wf-1", estimated_tokens=5)
+
+    assert cache.hgetall_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_reserve_budget_async_refreshes_workflow_usage() -> None:
+    cache = _FakeCache({"tokens_used": 10, "cost_used": 1.0})
+    guard = BudgetGuard(
+        max_tokens_per_workflow=100,
+        max_monthly_budget_usd=10.0,
+        cache=cache,
+    )
+
+    await guard.check_budget(workflow_id="wf-1", estimated_tokens=5)
+    await guard.reserve_budget_async("op", 20, 0.5, workflow_id="wf-1")
+    result = await guard.check_budget(workflow_id="wf-1", estimated_tokens=5)
+
+    assert result["remaining_tokens"] == 70
+    assert cache.hgetall_calls == 1
+
+
+def test_workflow_usage_cache_is_bounded() -> None:
+    from src.orchestration import budget_guard as budget_guard_module
+
+    guard = BudgetGuard()
+    with patch.object(budget_guard_module, "_WORKFLOW_USAGE_CACHE_SIZE", 2):
+        for workflow_id in ("wf-1", "wf-2", "wf-3"):
+            guard._remember_workflow_usage(workflow_id, 1, 0.1)
+
+    assert guard._cached_workflow_usage("wf-1") is None
+    assert guard._cached_workflow_usage("wf-3") == (1, 0.1)
+
+
 @pytest.mark.asyncio
 async def test_reserve_budget_async_persists_to_cache() -> None:
     cache = _FakeCache({"tokens_used": 1, "cost_used": 1.0})
@@ -132,31 +291,72 @@ async def test_reserve_budget_async_persists_to_cache() -> None:
         cache=cache,
     )
 
-    mock_logger = MagicMock()
-    mock_logger.bind.return_value = mock_logger
-    mock_logger.new.return_value = mock_logger
-    mock_logger.current_timestamp = "now"
+    with patch.object(guard, "check_budget", new=AsyncMock()) as mock_check:
+        result = await guard.reserve_budget_async(
+            operation_name="op",
+            estimated_tokens=5,
+            estimated_cost_usd=1.0,
+            workflow_id="wf-1",
+        )
+
+    mock_check.assert_not_called()
+    assert result["reserved"] is True
+    assert result["remaining_tokens"] == 99
+    assert result["remaining_cost_usd"] == 9.0
+    assert cache.script_calls[0][0][0] == "budget:workflow:wf-1"
+    # last_updated is an ISO-8601 UTC timestamp
+    assert datetime.fromisoformat(cache.script_calls[0][1][5]).tzinfo is not None
+    assert cache._data == {"tokens_used": 6, "cost_used": 2.0}
+
+
+@pytest.mark.asyncio
+async def test_reserve_budget_async_rejects_when_script_refuses() -> None:
+    cache = _FakeCache({"tokens_used": 98, "cost_used": 1.0})
+    guard = BudgetGuard(
+        max_tokens_per_workflow=100,
+        max_monthly_budget_usd=10.0,
+        cache=cache,
+    )
 
     logger_wrapper = MagicMock()
-    logger_wrapper.get_logger.return_value = mock_logger
 
     with (
-        patch.object(
-            guard,
-            "check_budget",
-            new=AsyncMock(return_value={"allowed": True}),
-        ),
         patch("src.orchestration.budget_guard.logger", logger_wrapper),
+        pytest.raises(BudgetExhaustedError) as exc_info,
     ):
-        result = await guard.reserve_budget_async(
+        await guard.reserve_budget_async(
             operation_name="op",
             estimated_tokens=5,
             estimated_cost_usd=1.0,
             workflow_id="wf-1",
         )
 
-    assert result["reserved"] is True
-    assert cache.set_calls
+    assert exc_info.value.budget_type == "tokens"
+    assert exc_info.value.used == 98
+    assert cache._data == {"tokens_used": 98, "cost_used": 1.0}
+    logger_wrapper.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_reserve_budget_async_enforces_monthly_total() -> None:
+    from src.orchestration.budget_guard import _monthly_usage_key
+
+    cache = _FakeCache({"tokens_used": 0, "cost_used": 0.0})
+    cache.counters[_monthly_usage_key(datetime.now(UTC))] = 9.5
+    guard = BudgetGuard(
+        max_tokens_per_workflow=100,
+        max_monthly_budget_usd=10.0,
+        cache=cache,
+    )
+
+    with pytest.raises(BudgetExhaustedError) as exc_info:
+        await guard.reserve_budget_async("op", 5, 1.0, workflow_id="wf-1")
+
+    assert exc_info.value.budget_type == "monthly USD"
+    assert exc_info.value.used == 9.5
+    assert guard.current_month_used_usd == 9.5
+    assert cache.script_calls[0][0][1].startswith("budget:month:")
+    assert cache._data == {"tokens_used": 0, "cost_used": 0.0}
 
 
 @pytest.mark.asyncio
@@ -180,6 +380,67 @@ def test_record_usage_updates_monthly_total() -> None:
     assert guard.current_month_used_usd == 1.5
 
 
+@pytest.mark.asyncio
+async def test_record_usage_async_updates_shared_monthly_total() -> None:
+    cache = _FakeCache()
+    guard = BudgetGuard(max_monthly_budget_usd=10.0, cache=cache)
+    other_worker = BudgetGuard(max_monthly_budget_usd=10.0, cache=cache)
+
+    with patch("src.orchestration.budget_guard.logger.info"):
+        await guard.record_usage_async(
+            "op", tokens_used=2, cost_usd=1.5, workflow_state=_state()
+        )
+        await other_worker.record_usage_async(
+            "op", tokens_used=2, cost_usd=1.0, workflow_state=_state()
+        )
+
+    assert other_worker.current_month_used_usd == 2.5
+    assert list(cache.counters.values()) == [2.5]
+    assert next(iter(cache.counters)).startswith("budget:month:")
+
+
+@pytest.mark.asyncio
+async def test_refresh_monthly_usage_reuses_recent_value() -> None:
+    from src.orchestration.budget_guard import _monthly_usage_key
+
+    cache = _FakeCache()
+    guard = BudgetGuard(max_monthly_budget_usd=10.0, cache=cache)
+    cache.counters[_monthly_usage_key(datetime.now(UTC))] = 3.0
+
+    first = await guard.refresh_monthly_usage()
+    second = await guard.refresh_monthly_usage()
+
+    assert first == second == 3.0
+    assert cache.get_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_monthly_usage_falls_back_on_cache_error() -> None:
+    from src.exceptions import CacheError
+
+    cache = _FakeCache()
+    cache.get = AsyncMock(side_effect=CacheError("down"))
+    guard = BudgetGuard(max_monthly_budget_usd=10.0, cache=cache)
+    guard.current_month_used_usd = 4.0
+
+    with patch("src.orchestration.budget_guard.logger.warning") as mock_warn:
+        result = await guard.refresh_monthly_usage()
+
+    assert result == 4.0
+    mock_warn.assert_called_once()
+
+
+def test_month_end_rolls_over_year() -> None:
+    from src.orchestration.budget_guard import _month_end
+
+    assert _month_end(datetime(2026, 12, 15, tzinfo=UTC)) == datetime(
+        2027, 1, 1, tzinfo=UTC
+    )
+    assert _month_end(datetime(2026, 1, 31, tzinfo=UTC)) == datetime(
+        2026, 2, 1, tzinfo=UTC
+    )
+
+
 def test_get_budget_summary_flags_thresholds() -> None:
     guard = BudgetGuard(max_tokens_per_workflow=100, max_monthly_budget_usd=10.0)
     state = _state()
@@ -192,3 +453,35 @@ def test_get_budget_summary_flags_thresholds() -> None:
 
     assert summary["tokens"]["at_threshold"] is True
     assert summary["cost"]["at_threshold"] is True
+
+
+def test_get_budget_summary_values() -> None:
+    guard = BudgetGuard(
+        max_tokens_per_workflow=200,
+        max_monthly_budget_usd=10.0,
+        alert_threshold_pct=75.0,
+    )
+    guard.current_month_used_usd = 4.0
+
+    summary = guard.get_budget_summary(_state())
+
+    assert summary["tokens"]["usage_pct"] == pytest.approx(25.0)
+    assert summary["tokens"]["remaining"] == 50
+    assert summary["tokens"]["at_threshold"] is False
+    assert summary["cost"]["usage_pct"] == pytest.approx(50.0)
+    assert summary["cost"]["at_threshold"] is False
+    assert summary["monthly"]["remaining_usd"] == pytest.approx(6.0)
+
+
+def test_budget_guard_singleton_is_created_lazily() -> None:
+    from src.orchestration import budget_guard as budget_guard_module
+
+    budget_guard_module.get_budget_guard.cache_clear()
+    with patch.object(budget_guard_module, "BudgetGuard") as mock_cls:
+        assert "budget_guard" not in vars(budget_guard_module)
+        first = budget_guard_module.budget_guard
+        second = budget_guard_module.get_budget_guard()
+
+    assert first is second
+    mock_cls.assert_called_once_with()
+    budget_guard_module.get_budget_guard.cache_clear()
@@ -1,9 +1,11 @@
 """Unit tests for RedisCache (Redis client)."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.config import settings
 from src.exceptions import CacheError
 from src.storage.cache import RedisCache
 
@@ -31,7 +33,7 @@ class TestRedisCacheConnect:
             patch(
                 "src.storage.cache.redis.ConnectionPool.from_url",
                 return_value=mock_pool,
-            ),
+            ) as mock_from_url,
             patch("src.storage.cache.redis.Redis", return_value=mock_client),
         ):
             cache = RedisCache()
@@ -40,6 +42,11 @@ class TestRedisCacheConnect:
             assert cache.pool is not None
             assert cache.client is not None
             mock_client.ping.assert_called_once()
+            pool_kwargs = mock_from_url.call_args.kwargs
+            assert "decode_responses" not in pool_kwargs
+            assert pool_kwargs["max_connections"] == settings.redis_max_connections
+            assert pool_kwargs["socket_keepalive"] is True
+            assert pool_kwargs["health_check_interval"] == 30
 
     @pytest.mark.anyio
     async def test_connect_failure(self):
@@ -81,13 +88,37 @@ class TestRedisCacheGet:
     @pytest.mark.anyio
     async def test_get_success(self, cache):
         """Test successful cache get."""
-        cache.client.get = AsyncMock(return_value="test_value")
+        cache.client.get = AsyncMock(return_value=b"test_value")
 
         result = await cache.get("test_key")
 
         assert result == "test_value"
         cache.client.get.assert_called_once_with("test_key")
 
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("debug", [True, False])
+    async def test_get_debug_logging_gated(self, cache, debug):
+        """Test per-call debug events are only emitted at DEBUG level."""
+        cache.client.get = AsyncMock(return_value=b"test_value")
+
+        with (
+            patch(
+                "src.storage.cache._stdlib_logger.isEnabledFor",
+                return_value=debug,
+            ),
+            patch("src.storage.cache.logger") as mock_logger,
+        ):
+            await cache.get("test_key")
+
+        assert mock_logger.debug.called is debug
+
+    @pytest.mark.anyio
+    async def test_get_bytes_returns_raw_value(self, cache):
+        """Test get_bytes skips decoding."""
+        cache.client.get = AsyncMock(return_value=b"\x00\xff")
+
+        assert await cache.get_bytes("test_key") == b"\x00\xff"
+
     @pytest.mark.anyio
     async def test_get_not_found(self, cache):
         """Test cache get when key not found."""
@@ -117,6 +148,127 @@ class TestRedisCacheGet:
             await cache.get("test_key")
 
 
+class TestRedisCacheHgetall:
+    """Test cache hash read operation."""
+
+    @pytest.mark.anyio
+    async def test_hgetall_success(self, cache):
+        """Test successful hash read."""
+        cache.client.hgetall = AsyncMock(return_value={b"tokens_used": b"10"})
+
+        result = await cache.hgetall("budget:workflow:wf-1")
+
+        assert result == {"tokens_used": "10"}
+        cache.client.hgetall.assert_called_once_with("budget:workflow:wf-1")
+
+    @pytest.mark.anyio
+    async def test_hgetall_not_connected(self):
+        """Test hash read when not connected."""
+        cache = RedisCache()
+        cache.client = None
+
+        with pytest.raises(CacheError):
+            await cache.hgetall("key")
+
+    @pytest.mark.anyio
+    async def test_hgetall_redis_error(self, cache):
+        """Test hash read with Redis error."""
+        import redis.asyncio as redis
+
+        cache.client.hgetall = AsyncMock(side_effect=redis.RedisError("failed"))
+
+        with pytest.raises(CacheError):
+            await cache.hgetall("key")
+
+
+class TestRedisCacheMget:
+    """Test cache multi-key read operation."""
+
+    @pytest.mark.anyio
+    async def test_mget_success(self, cache):
+        """Test successful multi-key read."""
+        cache.client.mget = AsyncMock(return_value=[b"1.5", None])
+
+        result = await cache.mget(["a", "b"])
+
+        assert result == ["1.5", None]
+        cache.client.mget.assert_called_once_with(["a", "b"])
+
+    @pytest.mark.anyio
+    async def test_mget_not_connected(self):
+        """Test multi-key read when not connected."""
+        cache = RedisCache()
+        cache.client = None
+
+        with pytest.raises(CacheError):
+            await cache.mget(["key"])
+
+    @pytest.mark.anyio
+    async def test_mget_redis_error(self, cache):
+        """Test multi-key read with Redis error."""
+        import redis.asyncio as redis
+
+        cache.client.mget = AsyncMock(side_effect=redis.RedisError("failed"))
+
+        with pytest.raises(CacheError):
+            await cache.mget(["key"])
+
+
+class TestRedisCacheMset:
+    """Test cache multi-key write operation."""
+
+    def _mock_pipeline(self, cache):
+        """Helper to mock client.pipeline() as an async context manager."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        pipeline_ctx = MagicMock()
+        pipeline_ctx.__aenter__ = AsyncMock(return_value=pipe)
+        pipeline_ctx.__aexit__ = AsyncMock(return_value=False)
+        cache.client.pipeline = MagicMock(return_value=pipeline_ctx)
+        return pipe
+
+    @pytest.mark.anyio
+    async def test_mset_pipelines_writes(self, cache):
+        """Test every key is set in one non-transactional pipeline."""
+        pipe = self._mock_pipeline(cache)
+
+        await cache.mset({"a": "1", "b": "2"}, ttl_seconds=60)
+
+        cache.client.pipeline.assert_called_once_with(transaction=False)
+        pipe.set.assert_any_call("a", "1", ex=60)
+        pipe.set.assert_any_call("b", "2", ex=60)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_mset_empty_skips_redis(self, cache):
+        """Test an empty mapping sends nothing."""
+        cache.client.pipeline = MagicMock()
+
+        await cache.mset({})
+
+        cache.client.pipeline.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_mset_not_connected(self):
+        """Test multi-key write when not connected."""
+        cache = RedisCache()
+        cache.client = None
+
+        with pytest.raises(CacheError):
+            await cache.mset({"key": "value"})
+
+    @pytest.mark.anyio
+    async def test_mset_redis_error(self, cache):
+        """Test multi-key write with Redis error."""
+        import redis.asyncio as redis
+
+        pipe = self._mock_pipeline(cache)
+        pipe.execute = AsyncMock(side_effect=redis.RedisError("failed"))
+
+        with pytest.raises(CacheError):
+            await cache.mset({"key": "value"})
+
+
 class TestRedisCacheSet:
     """Test cache set operation."""
 
@@ -276,28 +428,100 @@ class TestRedisCacheIncrement:
             await cache.increment("counter_key")
 
 
+class TestRedisCacheIncrementFloat:
+    """Test float counter increment."""
+
+    @pytest.mark.anyio
+    async def test_increment_float_with_expiry(self, cache):
+        """Test float increment pipelined with an absolute expiry."""
+        from datetime import UTC, datetime
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=["2.5", True])
+        pipeline_ctx = MagicMock()
+        pipeline_ctx.__aenter__ = AsyncMock(return_value=pipe)
+        pipeline_ctx.__aexit__ = AsyncMock(return_value=False)
+        cache.client.pipeline = MagicMock(return_value=pipeline_ctx)
+        expire_at = datetime(2026, 2, 1, tzinfo=UTC)
+
+        result = await cache.increment_float("budget:month:2026-01", 0.5, expire_at)
+
+        assert result == 2.5
+        pipe.incrbyfloat.assert_called_once_with("budget:month:2026-01", 0.5)
+        pipe.expireat.assert_called_once_with("budget:month:2026-01", expire_at)
+
+    @pytest.mark.anyio
+    async def test_increment_float_not_connected(self):
+        """Test float increment when not connected."""
+        cache = RedisCache()
+        cache.client = None
+
+        with pytest.raises(CacheError):
+            await cache.increment_float("key", 1.0)
+
+
+class TestRedisCacheRunScript:
+    """Test Lua script execution."""
+
+    @pytest.mark.anyio
+    async def test_run_script_registers_once(self, cache):
+        """Test that a script is registered once and reused."""
+        script = AsyncMock(return_value=[1, "10", "0.5"])
+        cache.client.register_script = MagicMock(return_value=script)
+
+        first = await cache.run_script("return 1", ["key"], [1])
+        await cache.run_script("return 1", ["key"], [2])
+
+        assert first == [1, "10", "0.5"]
+        cache.client.register_script.assert_called_once_with("return 1")
+        script.assert_called_with(keys=["key"], args=[2])
+
+    @pytest.mark.anyio
+    async def test_run_script_not_connected(self):
+        """Test script execution when not connected."""
+        cache = RedisCache()
+        cache.client = None
+
+        with pytest.raises(CacheError):
+            await cache.run_script("return 1", [], [])
+
+    @pytest.mark.anyio
+    async def test_run_script_redis_error(self, cache):
+        """Test script execution with Redis error."""
+        import redis.asyncio as redis
+
+        cache.client.register_script = MagicMock(
+            return_value=AsyncMock(side_effect=redis.RedisError("Script failed"))
+        )
+
+        with pytest.raises(CacheError):
+            await cache.run_script("return 1", ["key"], [])
+
+
 class TestRedisCacheRateLimit:
     """Test rate limiting functionality."""
 
     @pytest.mark.anyio
     async def test_rate_limit_allowed(self, cache):
         """Test rate limit when request is allowed."""
-        cache.client.incr = AsyncMock(return_value=1)
-        cache.client.expire = AsyncMock()
+        script = AsyncMock(return_value=[1, 1])
+        cache.client.register_script = MagicMock(return_value=script)
 
         result = await cache.rate_limit(
             "api:user:123", max_requests=50, window_seconds=60
         )
 
         assert result is True
-        cache.client.incr.assert_called_once_with("api:user:123")
-        cache.client.expire.assert_called_once_with("api:user:123", 60)
+        script.assert_called_once_with(keys=["api:user:123"], args=[60, 50, ANY])
+        cache.client.incr.assert_not_called()
+        cache.client.expire.assert_not_called()
 
     @pytest.mark.anyio
     async def test_rate_limit_exceeded(self, cache):
         """Test rate limit when limit is exceeded."""
-        cache.client.incr = AsyncMock(return_value=51)
-        cache.client.expire = AsyncMock()
+        cache.client.register_script = MagicMock(
+            return_value=AsyncMock(return_value=[0, 50])
+        )
 
         result = await cache.rate_limit(
             "api:user:123", max_requests=50, window_seconds=60
@@ -308,8 +532,9 @@ class TestRedisCacheRateLimit:
     @pytest.mark.anyio
     async def test_rate_limit_at_boundary(self, cache):
         """Test rate limit at exact boundary."""
-        cache.client.incr = AsyncMock(return_value=50)
-        cache.client.expire = AsyncMock()
+        cache.client.register_script = MagicMock(
+            return_value=AsyncMock(return_value=[1, 50])
+        )
 
         result = await cache.rate_limit(
             "api:user:123", max_requests=50, window_seconds=60
@@ -317,6 +542,19 @@ class TestRedisCacheRateLimit:
 
         assert result is True
 
+    @pytest.mark.anyio
+    async def test_rate_limit_registers_script_once(self, cache):
+        """Test the script is registered once and each request is recorded."""
+        script = AsyncMock(return_value=[1, 1])
+        cache.client.register_script = MagicMock(return_value=script)
+
+        await cache.rate_limit("api:user:123", max_requests=50, window_seconds=60)
+        await cache.rate_limit("api:user:456", max_requests=50, window_seconds=60)
+
+        cache.client.register_script.assert_called_once()
+        members = {call.kwargs["args"][2] for call in script.call_args_list}
+        assert len(members) == 2
+
     @pytest.mark.anyio
     async def test_rate_limit_not_connected(self):
         """Test rate limit when not connected."""
@@ -331,7 +569,9 @@ class TestRedisCacheRateLimit:
         """Test rate limit with Redis error."""
         import redis.asyncio as redis
 
-        cache.client.incr = AsyncMock(side_effect=redis.RedisError("Rate limit failed"))
+        cache.client.register_script = MagicMock(
+            return_value=AsyncMock(side_effect=redis.RedisError("Rate limit failed"))
+        )
 
         with pytest.raises(CacheError):
             await cache.rate_limit("api:user:123", max_requests=50, window_seconds=60)
@@ -344,29 +584,63 @@ class TestRedisCacheLock:
     async def test_lock_acquired(self, cache):
         """Test successful lock acquisition."""
         cache.client.set = AsyncMock(return_value=True)
-        cache.client.delete = AsyncMock()
+        release = AsyncMock(return_value=1)
+        cache.client.register_script = MagicMock(return_value=release)
 
         async with cache.lock("workflow:wf-001", timeout_seconds=60) as acquired:
             assert acquired is True
 
-        cache.client.delete.assert_called_once_with("lock:workflow:wf-001")
+        token = cache.client.set.call_args.args[1]
+        cache.client.set.assert_called_once_with(
+            "lock:workflow:wf-001", token, nx=True, ex=60
+        )
+        release.assert_called_once_with(keys=["lock:workflow:wf-001"], args=[token])
+        cache.client.delete.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_lock_tokens_are_unique(self, cache):
+        """Test each acquisition stores its own owner token."""
+        cache.client.set = AsyncMock(return_value=True)
+        cache.client.register_script = MagicMock(return_value=AsyncMock(return_value=1))
+
+        async with cache.lock("workflow:wf-001"):
+            pass
+        async with cache.lock("workflow:wf-001"):
+            pass
+
+        first, second = (call.args[1] for call in cache.client.set.call_args_list)
+        assert first != second
+
+    @pytest.mark.anyio
+    async def test_lock_expired_before_release(self, cache):
+        """Test an expired lock taken over by another holder is left alone."""
+        cache.client.set = AsyncMock(return_value=True)
+        release = AsyncMock(return_value=0)
+        cache.client.register_script = MagicMock(return_value=release)
+
+        async with cache.lock("workflow:wf-001") as acquired:
+            assert acquired is True
+
+        release.assert_called_once()
+        cache.client.delete.assert_not_called()
 
     @pytest.mark.anyio
     async def test_lock_not_acquired(self, cache):
         """Test lock acquisition failure."""
         cache.client.set = AsyncMock(return_value=False)
-        cache.client.delete = AsyncMock()
+        cache.client.register_script = MagicMock()
 
         async with cache.lock("workflow:wf-001", timeout_seconds=60) as acquired:
             assert acquired is False
 
-        cache.client.delete.assert_not_called()
+        cache.client.register_script.assert_not_called()
 
     @pytest.mark.anyio
     async def test_lock_released_on_exception(self, cache):
         """Test that lock is released even on exception."""
         cache.client.set = AsyncMock(return_value=True)
-        cache.client.delete = AsyncMock()
+        release = AsyncMock(return_value=1)
+        cache.client.register_script = MagicMock(return_value=release)
 
         try:
             async with cache.lock("workflow:wf-001", timeout_seconds=60) as acquired:
@@ -375,7 +649,7 @@ class TestRedisCacheLock:
         except ValueError:
             pass
 
-        cache.client.delete.assert_called_once_with("lock:workflow:wf-001")
+        release.assert_called_once()
 
     @pytest.mark.anyio
     async def test_lock_not_connected(self):
@@ -413,7 +687,22 @@ class TestRedisCacheSession:
         call_args = cache.client.setex.call_args
         assert call_args[0][0] == "session:session-123"
         assert call_args[0][1] == 24 * 3600  # 24 hours in seconds
-        assert call_args[0][2] == "user-456"
+        payload = json.loads(call_args[0][2])
+        assert payload["user_id"] == "user-456"
+        assert isinstance(payload["created_at"], int)
+
+    @pytest.mark.anyio
+    async def test_set_session_with_attributes(self, cache):
+        """Test extra attributes are stored in the same payload."""
+        cache.client.setex = AsyncMock()
+
+        await cache.set_session(
+            "session-123", "user-456", attributes={"roles": ["developer"]}
+        )
+
+        payload = json.loads(cache.client.setex.call_args[0][2])
+        assert payload["roles"] == ["developer"]
+        assert payload["user_id"] == "user-456"
 
     @pytest.mark.anyio
     async def test_set_session_custom_ttl(self, cache):
@@ -429,7 +718,9 @@ class TestRedisCacheSession:
     @pytest.mark.anyio
     async def test_get_session_success(self, cache):
         """Test successful session retrieval."""
-        cache.client.get = AsyncMock(return_value="user-456")
+        cache.client.get = AsyncMock(
+            return_value='{"user_id": "user-456", "created_at": 1700000000}'
+        )
 
         result = await cache.get_session("session-123")
 
@@ -445,6 +736,39 @@ class TestRedisCacheSession:
 
         assert result is None
 
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("stored", ["user-456", b"user-456", "123"])
+    async def test_get_session_legacy_plain_value(self, cache, stored):
+        """Test sessions stored as a bare user ID are still readable."""
+        cache.client.get = AsyncMock(return_value=stored)
+
+        session = await cache.get_session_data("session-123")
+
+        expected = stored.decode() if isinstance(stored, bytes) else stored
+        assert session == {"user_id": expected}
+
+    @pytest.mark.anyio
+    async def test_get_session_data_returns_attributes(self, cache):
+        """Test every session attribute comes back from one GET."""
+        cache.client.get = AsyncMock(
+            return_value=b'{"user_id": "user-456", "roles": ["developer"]}'
+        )
+
+        session = await cache.get_session_data("session-123")
+
+        assert session == {"user_id": "user-456", "roles": ["developer"]}
+        cache.client.get.assert_called_once_with("session:session-123")
+
+    @pytest.mark.anyio
+    async def test_get_sessions_single_round_trip(self, cache):
+        """Test several sessions are fetched with one MGET."""
+        cache.client.mget = AsyncMock(return_value=[b'{"user_id": "user-1"}', None])
+
+        result = await cache.get_sessions(["sess-1", "sess-2"])
+
+        assert result == {"sess-1": "user-1", "sess-2": None}
+        cache.client.mget.assert_called_once_with(["session:sess-1", "session:sess-2"])
+
 
 class TestRedisCacheEdgeCases:
     """Test edge cases and error conditions."""
@@ -452,8 +776,9 @@ class TestRedisCacheEdgeCases:
     @pytest.mark.anyio
     async def test_rate_limit_multiple_requests(self, cache):
         """Test rate limit with multiple sequential requests."""
-        cache.client.incr = AsyncMock(side_effect=[1, 2, 3, 4, 5])
-        cache.client.expire = AsyncMock()
+        cache.client.register_script = MagicMock(
+            return_value=AsyncMock(side_effect=[[1, n] for n in range(1, 6)])
+        )
 
         for _i in range(5):
             result = await cache.rate_limit(
@@ -464,8 +789,9 @@ class TestRedisCacheEdgeCases:
     @pytest.mark.anyio
     async def test_rate_limit_exceeds_after_multiple_requests(self, cache):
         """Test rate limit exceeding after multiple requests."""
-        cache.client.incr = AsyncMock(side_effect=[1, 2, 3, 4, 5, 6])
-        cache.client.expire = AsyncMock()
+        cache.client.register_script = MagicMock(
+            return_value=AsyncMock(side_effect=[*([1, n] for n in range(1, 6)), [0, 5]])
+        )
 
         for _i in range(5):
             result = await cache.rate_limit(
@@ -482,7 +808,7 @@ class TestRedisCacheEdgeCases:
     async def test_concurrent_locks(self, cache):
         """Test concurrent lock attempts."""
         cache.client.set = AsyncMock(side_effect=[True, False])
-        cache.client.delete = AsyncMock()
+        cache.client.register_script = MagicMock(return_value=AsyncMock(return_value=1))
 
         # First lock succeeds
         async with cache.lock("workflow:wf-001") as acquired1:
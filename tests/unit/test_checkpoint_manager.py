@@ -7,7 +7,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.config import Settings
-from src.orchestration.checkpoints import CheckpointManager
+from src.exceptions import StorageError
+from src.orchestration.checkpoints import BufferedCheckpointer, CheckpointManager
 
 
 @pytest.fixture()
@@ -25,9 +26,11 @@ def repository_mock():
     repo.disconnect = AsyncMock()
     repo.load_checkpoint = AsyncMock()
     repo.save_checkpoint = AsyncMock(return_value="ckpt-123")
+    repo.save_checkpoint_bundle = AsyncMock(return_value="ckpt-123")
     repo.save_workflow_metadata = AsyncMock()
     repo.log_audit_event = AsyncMock()
     repo.list_checkpoints = AsyncMock()
+    repo.load_checkpoints_bulk = AsyncMock(return_value={})
     repo.cleanup_old_checkpoints = AsyncMock(return_value=2)
     return repo
 
@@ -69,6 +72,24 @@ async def test_aget_returns_checkpoint(manager, repository_mock):
     assert result["channel_values"]["state"]["workflow_id"] == "wf-1"
 
 
+@pytest.mark.asyncio
+async def test_aget_upgrades_legacy_timestamps(manager, repository_mock):
+    """Derive integer timestamps for checkpoints that only carry ISO strings."""
+    repository_mock.load_checkpoint.return_value = {
+        "workflow_id": "wf-1",
+        "state_version": 1,
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-01T00:00:01+00:00",
+    }
+
+    result = await manager.aget({"checkpoint_id": "ckpt-1"})
+
+    assert result is not None
+    state = result["channel_values"]["state"]
+    assert state["created_at_ns"] == 1_767_225_600_000_000_000
+    assert state["updated_at_ns"] == 1_767_225_601_000_000_000
+
+
 @pytest.mark.asyncio
 async def test_aput_saves_checkpoint_and_metadata(manager, repository_mock):
     """Save checkpoint, metadata, and audit event."""
@@ -79,15 +100,23 @@ async def test_aput_saves_checkpoint_and_metadata(manager, repository_mock):
         "current_agent": "AgentX",
         "budget_used_usd": 1.5,
         "rejection_count": 0,
+        "created_at_ns": 1_767_225_600_000_000_000,
     }
     checkpoint = {"v": 2, "channel_values": {"state": state}}
 
     updated = await manager.aput({"workflow_id": "wf-1"}, checkpoint, {}, {})
 
     assert updated["checkpoint_id"] == "ckpt-123"
-    repository_mock.save_checkpoint.assert_called_once()
-    repository_mock.save_workflow_metadata.assert_called_once()
-    repository_mock.log_audit_event.assert_called_once()
+    repository_mock.save_checkpoint_bundle.assert_awaited_once()
+    call_kwargs = repository_mock.save_checkpoint_bundle.call_args.kwargs
+    assert call_kwargs["workflow_id"] == "wf-1"
+    assert call_kwargs["agent_name"] == "AgentX"
+    assert call_kwargs["budget_used_usd"] == 1.5
+    assert call_kwargs["state"]["created_at"] == "2026-01-01T00:00:00+00:00"
+    assert "created_at" not in state
+    repository_mock.save_checkpoint.assert_not_called()
+    repository_mock.save_workflow_metadata.assert_not_called()
+    repository_mock.log_audit_event.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -97,10 +126,9 @@ async def test_alist_yields_checkpoints_and_skips_corrupt(manager, repository_mo
         {"checkpoint_id": "ckpt-1"},
         {"checkpoint_id": "ckpt-2"},
     ]
-    repository_mock.load_checkpoint.side_effect = [
-        {"workflow_id": "wf-1", "state_version": 1},
-        RuntimeError("bad checkpoint"),
-    ]
+    repository_mock.load_checkpoints_bulk.return_value = {
+        "ckpt-1": {"workflow_id": "wf-1", "state_version": 1},
+    }
 
     with patch("src.orchestration.checkpoints.logger.warning") as mock_warn:
         results = [
@@ -110,6 +138,8 @@ async def test_alist_yields_checkpoints_and_skips_corrupt(manager, repository_mo
     assert len(results) == 1
     assert results[0].checkpoint["id"] == "ckpt-1"
     mock_warn.assert_called_once()
+    repository_mock.load_checkpoints_bulk.assert_awaited_once_with(["ckpt-1", "ckpt-2"])
+    repository_mock.load_checkpoint.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -119,3 +149,302 @@ async def test_cleanup_old_checkpoints(manager, repository_mock):
 
     assert result == 2
     repository_mock.cleanup_old_checkpoints.assert_called_once_with(retention_hours=12)
+
+
+def test_state_checkpoint_conversion_shares_state_dict(manager):
+    """Conversions reference the state dict instead of copying it."""
+    state = {"workflow_id": "wf-1", "state_version": 2}
+
+    checkpoint = manager._state_to_checkpoint(state, "ckpt-1")
+    checkpoint["v"] = 5
+    restored = manager._checkpoint_to_state(checkpoint)
+
+    assert checkpoint["channel_values"]["state"] is state
+    assert restored is state
+    assert restored["state_version"] == 5
+
+
+@pytest.mark.asyncio
+async def test_alist_shares_metadata_across_tuples(manager, repository_mock):
+    """Listed tuples reuse one metadata mapping."""
+    repository_mock.list_checkpoints.return_value = [
+        {"checkpoint_id": "ckpt-1"},
+        {"checkpoint_id": "ckpt-2"},
+    ]
+    repository_mock.load_checkpoints_bulk.return_value = {
+        "ckpt-1": {"workflow_id": "wf-1", "state_version": 1},
+        "ckpt-2": {"workflow_id": "wf-1", "state_version": 2},
+    }
+
+    results = [item async for item in manager.alist({"workflow_id": "wf-1"})]
+
+    assert [r.config["configurable"]["checkpoint_id"] for r in results] == [
+        "ckpt-1",
+        "ckpt-2",
+    ]
+    assert results[0].metadata is results[1].metadata
+    assert results[0].metadata["step"] == -1
+
+
+def _checkpoint(checkpoint_id: str) -> dict:
+    return {"id": checkpoint_id, "v": 1, "channel_values": {}}
+
+
+@pytest.mark.asyncio
+async def test_buffered_checkpointer_flushes_latest_per_thread():
+    """Only the last buffered checkpoint of each thread reaches the saver."""
+    saver = MagicMock()
+    saver.aput = AsyncMock(return_value={"checkpoint_id": "saved"})
+    saver.aput_writes = AsyncMock()
+    buffered = BufferedCheckpointer(saver)
+    config = {"configurable": {"thread_id": "wf-1"}}
+
+    for checkpoint_id in ("ckpt-1", "ckpt-2", "ckpt-3"):
+        result = await buffered.aput(config, _checkpoint(checkpoint_id), {}, {})
+        await buffered.aput_writes(result, [("state", checkpoint_id)], "task-1")
+    other = {"configurable": {"thread_id": "wf-2"}}
+    await buffered.aput(other, _checkpoint("ckpt-x"), {}, {})
+
+    assert result["configurable"]["checkpoint_id"] == "ckpt-3"
+    saver.aput.assert_not_called()
+    saver.aput_writes.assert_not_called()
+
+    assert await buffered.flush("wf-1") == 1
+    assert saver.aput.call_args.args[1]["id"] == "ckpt-3"
+    # Only the writes against the flushed checkpoint are forwarded
+    saver.aput_writes.assert_awaited_once_with(
+        {"checkpoint_id": "saved"}, [("state", "ckpt-3")], "task-1", ""
+    )
+    assert await buffered.flush() == 1
+    assert await buffered.flush() == 0
+    assert saver.aput.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_buffered_checkpointer_reads_pending_then_saver():
+    """Reads see the buffered checkpoint before falling back to the saver."""
+    saver = MagicMock()
+    saver.aput = AsyncMock()
+    saver.aget_tuple = AsyncMock(return_value=None)
+    buffered = BufferedCheckpointer(saver)
+    config = {"configurable": {"thread_id": "wf-1"}}
+
+    await buffered.aput(config, _checkpoint("ckpt-1"), {"step": 1}, {})
+    pending = await buffered.aget_tuple(config)
+
+    assert pending.checkpoint["id"] == "ckpt-1"
+    saver.aget_tuple.assert_not_called()
+
+    await buffered.flush()
+    assert await buffered.aget_tuple(config) is None
+    saver.aget_tuple.assert_awaited_once_with(config)
+
+
+@pytest.mark.asyncio
+async def test_buffered_checkpointer_tuple_configs():
+    """A buffered tuple carries its own checkpoint ID and its parent's."""
+    buffered = BufferedCheckpointer(MagicMock())
+    first = {"configurable": {"thread_id": "wf-1"}}
+    parent = await buffered.aput(first, _checkpoint("parent-id"), {}, {})
+
+    root = await buffered.aget_tuple(first)
+
+    assert root.config == parent
+    assert root.parent_config is None
+
+    await buffered.aput(parent, _checkpoint("ckpt-2"), {}, {})
+    pending = await buffered.aget_tuple(first)
+
+    assert pending.config["configurable"]["checkpoint_id"] == "ckpt-2"
+    assert pending.parent_config["configurable"]["checkpoint_id"] == "parent-id"
+
+
+@pytest.mark.asyncio
+async def test_buffered_checkpointer_serves_pending_writes():
+    """Writes against the buffered checkpoint are returned with it."""
+    saver = MagicMock()
+    saver.aput_writes = AsyncMock()
+    buffered = BufferedCheckpointer(saver)
+    config = {"configurable": {"thread_id": "wf-1"}}
+
+    # No buffered checkpoint yet: writes belong to a persisted one
+    await buffered.aput_writes(config, [("state", 0)], "task-0")
+    saver.aput_writes.assert_awaited_once()
+
+    saved = await buffered.aput(config, _checkpoint("ckpt-1"), {}, {})
+    await buffered.aput_writes(saved, [("__interrupt__", "ask"), ("a", 1)], "t-1")
+    pending = await buffered.aget_tuple(config)
+
+    assert pending.pending_writes == [("t-1", "__interrupt__", "ask"), ("t-1", "a", 1)]
+    saver.aput_writes.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_buffered_checkpointer_keeps_checkpoint_when_write_fails():
+    """A failed flush leaves the checkpoint buffered for a retry."""
+    saver = MagicMock()
+    saver.aput = AsyncMock(side_effect=[RuntimeError("db down"), {}])
+    buffered = BufferedCheckpointer(saver)
+    config = {"configurable": {"thread_id": "wf-1"}}
+    await buffered.aput(config, _checkpoint("ckpt-1"), {}, {})
+
+    with pytest.raises(RuntimeError):
+        await buffered.flush("wf-1")
+    assert (await buffered.aget_tuple(config)).checkpoint["id"] == "ckpt-1"
+
+    assert await buffered.flush("wf-1") == 1
+    assert saver.aput.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_buffered_checkpointer_discard_drops_thread():
+    """Discarding a thread forgets its checkpoint without writing it."""
+    saver = MagicMock()
+    saver.aput = AsyncMock()
+    buffered = BufferedCheckpointer(saver)
+    config = {"configurable": {"thread_id": "wf-1"}}
+    await buffered.aput(config, _checkpoint("ckpt-1"), {}, {})
+
+    buffered.discard("wf-1")
+
+    assert await buffered.flush() == 0
+    saver.aput.assert_not_called()
+
+
+def _offloading_manager(mock_settings, repository_mock):
+    """Create a CheckpointManager with mocked artifact storage."""
+    storage = MagicMock()
+    storage.upload_artifact = AsyncMock(
+        side_effect=lambda workflow_id, path, *_: f"{workflow_id}/{path}"
+    )
+    storage.artifact_exists = AsyncMock(return_value=True)
+    with patch(
+        "src.orchestration.checkpoints.CheckpointRepository",
+        return_value=repository_mock,
+    ):
+        manager = CheckpointManager(settings=mock_settings, artifact_storage=storage)
+    return manager, storage
+
+
+@pytest.mark.asyncio
+async def test_aput_offloads_artifacts_once(mock_settings, repository_mock):
+    """Large fields go to artifact storage; unchanged ones are not re-uploaded."""
+    manager, storage = _offloading_manager(mock_settings, repository_mock)
+    state = {
+        "workflow_id": "wf-1",
+        "code_files": {"src/main.py": "print('hi')"},
+        "quality_report": "# Quality",
+        "test_files": {},
+    }
+    checkpoint = {"v": 2, "channel_values": {"state": state}}
+
+    await manager.aput({"workflow_id": "wf-1"}, checkpoint, {}, {})
+    await manager.aput({"workflow_id": "wf-1"}, checkpoint, {}, {})
+
+    saved = repository_mock.save_checkpoint_bundle.call_args.kwargs["state"]
+    assert saved["code_files"] == {}
+    assert saved["quality_report"] == ""
+    assert set(saved["artifact_refs"]) == {"code_files", "quality_report"}
+    assert storage.upload_artifact.await_count == 2
+    assert storage.artifact_exists.await_count == 2
+    assert state["code_files"] == {"src/main.py": "print('hi')"}
+
+
+@pytest.mark.asyncio
+async def test_aput_reuploads_deleted_artifacts(mock_settings, repository_mock):
+    """An uploaded artifact removed from storage since is uploaded again."""
+    manager, storage = _offloading_manager(mock_settings, repository_mock)
+    checkpoint = {
+        "v": 2,
+        "channel_values": {"state": {"workflow_id": "wf-1", "quality_report": "#"}},
+    }
+
+    await manager.aput({"workflow_id": "wf-1"}, checkpoint, {}, {})
+    storage.artifact_exists.return_value = False
+    await manager.aput({"workflow_id": "wf-1"}, checkpoint, {}, {})
+
+    assert storage.upload_artifact.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aput_bounds_uploaded_artifact_cache(mock_settings, repository_mock):
+    """Only the most recently uploaded artifact paths are remembered."""
+    manager, _ = _offloading_manager(mock_settings, repository_mock)
+
+    with patch("src.orchestration.checkpoints._STORED_ARTIFACTS_CACHE_SIZE", 2):
+        for report in ("a", "b", "c"):
+            state = {"workflow_id": "wf-1", "quality_report": report}
+            checkpoint = {"v": 2, "channel_values": {"state": state}}
+            await manager.aput({"workflow_id": "wf-1"}, checkpoint, {}, {})
+
+    assert len(manager._stored_artifacts) == 2
+
+
+@pytest.mark.asyncio
+async def test_aget_restores_offloaded_artifacts(mock_settings, repository_mock):
+    """Offloaded fields are downloaded back into the loaded state."""
+    storage = MagicMock()
+    storage.download_artifact = AsyncMock(return_value=b'{"src/main.py":"x = 1"}')
+    with patch(
+        "src.orchestration.checkpoints.CheckpointRepository",
+        return_value=repository_mock,
+    ):
+        manager = CheckpointManager(settings=mock_settings, artifact_storage=storage)
+    repository_mock.load_checkpoint.return_value = {
+        "workflow_id": "wf-1",
+        "state_version": 2,
+        "code_files": {},
+        "artifact_refs": {"code_files": "checkpoint_artifacts/code_files/abc.json"},
+    }
+
+    result = await manager.aget({"checkpoint_id": "ckpt-1"})
+
+    state = result["channel_values"]["state"]
+    assert state["code_files"] == {"src/main.py": "x = 1"}
+    assert "artifact_refs" not in state
+    storage.download_artifact.assert_awaited_once_with(
+        "wf-1", "checkpoint_artifacts/code_files/abc.json"
+    )
+
+
+@pytest.mark.asyncio
+async def test_alist_skips_checkpoint_with_missing_artifacts(
+    mock_settings, repository_mock
+):
+    """A checkpoint whose artifacts are gone or corrupt is skipped, not fatal."""
+    storage = MagicMock()
+    storage.download_artifact = AsyncMock(
+        side_effect=[StorageError("missing"), b"{trunc", b'{"src/main.py":"x = 1"}']
+    )
+    with patch(
+        "src.orchestration.checkpoints.CheckpointRepository",
+        return_value=repository_mock,
+    ):
+        manager = CheckpointManager(settings=mock_settings, artifact_storage=storage)
+    refs = {"code_files": "checkpoint_artifacts/code_files/abc.json"}
+    repository_mock.list_checkpoints.return_value = [
+        {"checkpoint_id": "ckpt-1"},
+        {"checkpoint_id": "ckpt-2"},
+        {"checkpoint_id": "ckpt-3"},
+    ]
+    repository_mock.load_checkpoints_bulk.return_value = {
+        checkpoint_id: {"workflow_id": "wf-1", "artifact_refs": dict(refs)}
+        for checkpoint_id in ("ckpt-1", "ckpt-2", "ckpt-3")
+    }
+
+    results = [item async for item in manager.alist({"workflow_id": "wf-1"})]
+
+    assert [r.config["configurable"]["checkpoint_id"] for r in results] == ["ckpt-3"]
+
+
+@pytest.mark.asyncio
+async def test_restore_artifacts_requires_artifact_storage(manager):
+    """Artifact refs without artifact storage fail instead of blanking fields."""
+    state = {
+        "workflow_id": "wf-1",
+        "code_files": {},
+        "artifact_refs": {"code_files": "checkpoint_artifacts/code_files/abc.json"},
+    }
+
+    with pytest.raises(StorageError):
+        await manager._restore_artifacts(state)
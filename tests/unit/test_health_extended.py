@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from unittest.mock import patch
 
 import pytest
 
 from src.api.health import (
+    _probe_cache,
     check_minio_health,
     check_postgres_health,
     check_redis_health,
@@ -19,6 +21,14 @@ from src.api.health import (
 from src.api.schemas import HealthStatus
 
 
+@pytest.fixture(autouse=True)
+def clear_probe_cache() -> Iterator[None]:
+    """Start every test without cached probe results."""
+    _probe_cache.clear()
+    yield
+    _probe_cache.clear()
+
+
 def test_check_postgres_health_in_test_env() -> None:
     """Test postgres health shortcut in test environment."""
     with patch("src.api.health.settings.environment", "test"):
@@ -29,7 +39,7 @@ def test_check_postgres_health_socket_ok() -> None:
     """Test postgres health when socket connect succeeds."""
     with (
         patch("src.api.health.settings.environment", "development"),
-        patch("src.api.health.socket.create_connection"),
+        patch("src.api.health._probe_tcp"),
     ):
         assert check_postgres_health() == HealthStatus.HEALTHY
 
@@ -38,7 +48,7 @@ def test_check_postgres_health_socket_error() -> None:
     """Test postgres health when socket connect fails."""
     with (
         patch("src.api.health.settings.environment", "development"),
-        patch("src.api.health.socket.create_connection", side_effect=OSError()),
+        patch("src.api.health._probe_tcp", side_effect=OSError()),
     ):
         assert check_postgres_health() == HealthStatus.UNHEALTHY
 
@@ -53,7 +63,7 @@ def test_check_redis_health_socket_ok() -> None:
     """Test redis health when socket connect succeeds."""
     with (
         patch("src.api.health.settings.environment", "development"),
-        patch("src.api.health.socket.create_connection"),
+        patch("src.api.health._probe_tcp"),
     ):
         assert check_redis_health() == HealthStatus.HEALTHY
 
@@ -62,7 +72,7 @@ def test_check_redis_health_socket_error() -> None:
     """Test redis health when socket connect fails."""
     with (
         patch("src.api.health.settings.environment", "development"),
-        patch("src.api.health.socket.create_connection", side_effect=OSError()),
+        patch("src.api.health._probe_tcp", side_effect=OSError()),
     ):
         assert check_redis_health() == HealthStatus.UNHEALTHY
 
@@ -88,10 +98,10 @@ def test_check_minio_health_uses_default_port() -> None:
         patch("src.api.health.settings.environment", "development"),
         patch("src.api.health.settings.minio_endpoint", "minio.local"),
         patch("src.api.health.settings.minio_secure", False),
-        patch("src.api.health.socket.create_connection") as mock_conn,
+        patch("src.api.health._probe_tcp") as mock_conn,
     ):
         assert check_minio_health() == HealthStatus.HEALTHY
-        mock_conn.assert_called_once_with(("minio.local", 80), timeout=0.5)
+        mock_conn.assert_called_once_with("minio.local", 80, 0.5)
 
 
 def test_check_minio_health_secure_port() -> None:
@@ -100,10 +110,10 @@ def test_check_minio_health_secure_port() -> None:
         patch("src.api.health.settings.environment", "development"),
         patch("src.api.health.settings.minio_endpoint", "https://minio.local"),
         patch("src.api.health.settings.minio_secure", True),
-        patch("src.api.health.socket.create_connection") as mock_conn,
+        patch("src.api.health._probe_tcp") as mock_conn,
     ):
         assert check_minio_health() == HealthStatus.HEALTHY
-        mock_conn.assert_called_once_with(("minio.local", 443), timeout=0.5)
+        mock_conn.assert_called_once_with("minio.local", 443, 0.5)
 
 
 @pytest.mark.asyncio
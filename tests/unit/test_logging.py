@@ -16,6 +16,17 @@ from src.observability.logging import (
 )
 
 
+class TestModuleExports:
+    """Test the module's public export list."""
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ is defined."""
+        from src.observability import logging as logging_module
+
+        for name in logging_module.__all__:
+            assert hasattr(logging_module, name), name
+
+
 class TestAddAppContext:
     """Test add_app_context processor."""
 
@@ -40,6 +51,82 @@ class TestAddAppContext:
         assert result["service"] == "agent-api"
 
 
+class TestMergeContextvarsCached:
+    """Test cached contextvars merge processor."""
+
+    def test_merges_bound_context_and_refreshes_after_bind(self):
+        """Test that the snapshot is reused and invalidated on bind."""
+        import contextvars
+
+        from src.observability.logging import merge_contextvars_cached
+
+        def scenario():
+            bind_workflow_context("wf-001", "trace-abc123")
+            first = merge_contextvars_cached(None, None, {"event": "a"})
+
+            bind_agent_context("software_engineer", 3)
+            second = merge_contextvars_cached(None, None, {"event": "b"})
+            return first, second
+
+        first, second = contextvars.copy_context().run(scenario)
+
+        assert first["workflow_id"] == "wf-001"
+        assert "agent_name" not in first
+        assert second["agent_name"] == "software_engineer"
+        assert second["trace_id"] == "trace-abc123"
+
+    def test_event_values_take_precedence(self):
+        """Test that explicit event keys are not overwritten by context."""
+        import contextvars
+
+        from src.observability.logging import merge_contextvars_cached
+
+        def scenario():
+            bind_workflow_context("wf-001", "trace-abc123")
+            return merge_contextvars_cached(
+                None, None, {"event": "a", "workflow_id": "override"}
+            )
+
+        result = contextvars.copy_context().run(scenario)
+
+        assert result["workflow_id"] == "override"
+
+
+class TestTimestamp:
+    """Test timestamp processor and orjson serialization."""
+
+    def test_add_timestamp_sets_aware_utc_datetime(self):
+        """Test that add_timestamp stores a raw UTC datetime."""
+        from datetime import UTC, datetime
+
+        from src.observability.logging import add_timestamp
+
+        result = add_timestamp(None, None, {"event": "test_event"})
+
+        assert isinstance(result["timestamp"], datetime)
+        assert result["timestamp"].tzinfo == UTC
+
+    def test_orjson_dumps_renders_zulu_timestamp(self):
+        """Test that the JSON serializer renders datetimes with a Z suffix."""
+        from datetime import UTC, datetime
+
+        from src.observability.logging import _orjson_dumps
+
+        rendered = _orjson_dumps(
+            {"timestamp": datetime(2026, 1, 26, 12, 0, tzinfo=UTC)}
+        )
+
+        assert rendered == '{"timestamp":"2026-01-26T12:00:00Z"}'
+
+    def test_orjson_dumps_uses_default_for_unknown_types(self):
+        """Test that the renderer's fallback handler is honoured."""
+        from src.observability.logging import _orjson_dumps
+
+        rendered = _orjson_dumps({"value": {1, 2}}, default=sorted)
+
+        assert rendered == '{"value":[1,2]}'
+
+
 class TestConfigureLogging:
     """Test logging configuration."""
 
@@ -91,6 +178,66 @@ class TestConfigureLogging:
             call_kwargs = mock_basic_config.call_args[1]
             assert call_kwargs["level"] == logging.DEBUG
 
+    def test_configure_logging_passes_single_fused_processor(self):
+        """Test that the processor chain is fused into one stage."""
+        with (
+            patch("src.observability.logging.logging.basicConfig"),
+            patch("src.observability.logging.structlog.configure") as mock_configure,
+        ):
+            configure_logging()
+
+            processors = mock_configure.call_args[1]["processors"]
+            assert len(processors) == 1
+            assert callable(processors[0])
+
+    def test_production_chain_omits_stack_info_renderer(self):
+        """Test that StackInfoRenderer is only wired up outside production."""
+        from src.observability.logging import _fuse_processors
+
+        chains = {}
+        for environment in ("production", "development"):
+            with (
+                patch("src.observability.logging.settings.environment", environment),
+                patch("src.observability.logging.logging.basicConfig"),
+                patch("src.observability.logging.structlog.configure"),
+                patch(
+                    "src.observability.logging._fuse_processors",
+                    wraps=_fuse_processors,
+                ) as mock_fuse,
+            ):
+                configure_logging()
+                chains[environment] = mock_fuse.call_args[0][0]
+
+        def has_stack_renderer(chain):
+            # Match by name: some test modules stub out structlog in sys.modules
+            return any(type(p).__name__ == "StackInfoRenderer" for p in chain)
+
+        assert not has_stack_renderer(chains["production"])
+        assert has_stack_renderer(chains["development"])
+
+
+class TestFuseProcessors:
+    """Test processor chain fusion."""
+
+    def test_fused_processor_runs_stages_in_order(self):
+        """Test that the fused callable applies every stage in sequence."""
+        from src.observability.logging import _fuse_processors
+
+        def first(_logger, _method, event_dict):
+            event_dict["order"] = ["first"]
+            return event_dict
+
+        def second(_logger, _method, event_dict):
+            event_dict["order"].append("second")
+            return event_dict
+
+        def render(_logger, _method, event_dict):
+            return ",".join(event_dict["order"])
+
+        fused = _fuse_processors([first, second, render])
+
+        assert fused(None, "info", {"event": "x"}) == "first,second"
+
 
 class TestGetLogger:
     """Test get_logger function."""
@@ -213,12 +360,12 @@ class TestLogLLMCall:
         mock_logger.info.assert_called_once()
         call_args = mock_logger.info.call_args
         assert call_args[0][0] == "llm.call_completed"
-        assert call_args[1]["llm"]["provider"] == "openrouter"
-        assert call_args[1]["llm"]["model"] == "deepseek/deepseek-chat"
-        assert call_args[1]["llm"]["tokens_input"] == 5400
-        assert call_args[1]["llm"]["tokens_output"] == 1200
-        assert call_args[1]["llm"]["cost_usd"] == 0.0012
-        assert call_args[1]["llm"]["latency_ms"] == 3450
+        assert call_args[1]["llm_provider"] == "openrouter"
+        assert call_args[1]["llm_model"] == "deepseek/deepseek-chat"
+        assert call_args[1]["llm_tokens_input"] == 5400
+        assert call_args[1]["llm_tokens_output"] == 1200
+        assert call_args[1]["llm_cost_usd"] == 0.0012
+        assert call_args[1]["llm_latency_ms"] == 3450
 
     def test_log_llm_call_with_different_providers(self):
         """Test log_llm_call with different LLM providers."""
@@ -236,7 +383,7 @@ class TestLogLLMCall:
 
         mock_logger.info.assert_called_once()
         call_args = mock_logger.info.call_args
-        assert call_args[1]["llm"]["provider"] == "google"
+        assert call_args[1]["llm_provider"] == "google"
 
     def test_log_llm_call_with_zero_cost(self):
         """Test log_llm_call with zero cost."""
@@ -254,7 +401,7 @@ class TestLogLLMCall:
 
         mock_logger.info.assert_called_once()
         call_args = mock_logger.info.call_args
-        assert call_args[1]["llm"]["cost_usd"] == 0.0
+        assert call_args[1]["llm_cost_usd"] == 0.0
 
 
 class TestLogBudgetStatus:
@@ -274,9 +421,9 @@ class TestLogBudgetStatus:
         mock_logger.info.assert_called_once()
         call_args = mock_logger.info.call_args
         assert call_args[0][0] == "budget.status"
-        assert call_args[1]["budget"]["remaining_tokens"] == 487600
-        assert call_args[1]["budget"]["remaining_budget_usd"] == 18.45
-        assert call_args[1]["budget"]["budget_percent_used"] == 7.75
+        assert call_args[1]["budget_remaining_tokens"] == 487600
+        assert call_args[1]["budget_remaining_usd"] == 18.45
+        assert call_args[1]["budget_percent_used"] == 7.75
 
     def test_log_budget_status_with_high_usage(self):
         """Test log_budget_status with high budget usage."""
@@ -291,7 +438,7 @@ class TestLogBudgetStatus:
 
         mock_logger.info.assert_called_once()
         call_args = mock_logger.info.call_args
-        assert call_args[1]["budget"]["budget_percent_used"] == 95.0
+        assert call_args[1]["budget_percent_used"] == 95.0
 
     def test_log_budget_status_with_zero_remaining(self):
         """Test log_budget_status with zero remaining budget."""
@@ -306,8 +453,8 @@ class TestLogBudgetStatus:
 
         mock_logger.info.assert_called_once()
         call_args = mock_logger.info.call_args
-        assert call_args[1]["budget"]["remaining_tokens"] == 0
-        assert call_args[1]["budget"]["remaining_budget_usd"] == 0.0
+        assert call_args[1]["budget_remaining_tokens"] == 0
+        assert call_args[1]["budget_remaining_usd"] == 0.0
 
 
 class TestLoggingEdgeCases:
@@ -360,8 +507,8 @@ class TestLoggingEdgeCases:
 
         mock_logger.info.assert_called_once()
         call_args = mock_logger.info.call_args
-        assert call_args[1]["budget"]["remaining_budget_usd"] == 12.3456
-        assert call_args[1]["budget"]["budget_percent_used"] == 45.6789
+        assert call_args[1]["budget_remaining_usd"] == 12.3456
+        assert call_args[1]["budget_percent_used"] == 45.6789
 
 
 class TestLoggingIntegration:
@@ -396,7 +543,7 @@ class TestAdditionalLoggingHelpers:
     """Tests for remaining logging helpers."""
 
     def test_log_error_includes_context(self):
-        """Test log_error passes error dict and context."""
+        """Test log_error passes flattened error fields and context."""
         mock_logger = MagicMock()
 
         from src.observability.logging import log_error
@@ -413,8 +560,8 @@ class TestAdditionalLoggingHelpers:
         mock_logger.error.assert_called_once()
         call_args = mock_logger.error.call_args
         assert call_args[0][0] == "error.occurred"
-        assert call_args[1]["error"]["type"] == "ValueError"
-        assert call_args[1]["error"]["file"] == "src/file.py"
+        assert call_args[1]["error_type"] == "ValueError"
+        assert call_args[1]["error_file"] == "src/file.py"
 
     def test_log_agent_execution_with_rejection(self):
         """Test log_agent_execution with rejection reason."""
@@ -161,6 +161,35 @@ class TestMetricsDefinition:
         assert isinstance(metrics.llm_fallback_triggered_total, Counter)
 
 
+class TestModuleExports:
+    """Test the module's public export list."""
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ is defined."""
+        for name in metrics.__all__:
+            assert hasattr(metrics, name), name
+
+
+class TestHistogramBuckets:
+    """Test shared histogram bucket constants."""
+
+    def test_bucket_constants_are_tuples(self):
+        """Test that shared bucket definitions are immutable."""
+        for name in dir(metrics):
+            if name.startswith("BUCKETS_"):
+                assert isinstance(getattr(metrics, name), tuple), name
+
+    def test_histograms_use_shared_buckets(self):
+        """Test that histograms are built from the shared bucket constants."""
+        upload = metrics.minio_upload_duration_seconds.labels(artifact_type="code")
+        request = metrics.http_request_duration_seconds.labels(
+            method="GET", endpoint="/health"
+        )
+
+        assert upload._upper_bounds[:-1] == list(metrics.BUCKETS_IO_MED)
+        assert request._upper_bounds[:-1] == list(metrics.BUCKETS_IO_MED)
+
+
 class TestREDMetrics:
     """Test RED (Request, Error, Duration) metrics."""
 
@@ -26,7 +26,8 @@ def mock_llm_client():
 def mock_budget_guard():
     guard = MagicMock()
     guard.reserve_budget = MagicMock()
-    guard.record_usage = MagicMock()
+    guard.refresh_monthly_usage = AsyncMock()
+    guard.record_usage_async = AsyncMock()
     return guard
 
 
@@ -6,11 +6,18 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langgraph.errors import GraphRecursionError
 from langgraph.graph import END
 
 from src.config import Settings
 from src.exceptions import BudgetExhaustedError, InfiniteLoopDetectedError
-from src.orchestration.controller import OrchestrationController
+from src.orchestration.controller import (
+    AGENT_ENGINEER,
+    PHASE_DEVELOPMENT,
+    OrchestrationController,
+    _make_budget_check,
+)
+from src.orchestration.state import create_initial_state
 
 
 def _make_settings():
@@ -52,12 +59,18 @@ class DummyGraph:
 class AsyncGraph:
     """Async graph stub with configurable updates."""
 
-    def __init__(self, updates):
+    def __init__(self, updates, error=None):
         self._updates = updates
+        self._error = error
+        self.config = None
 
-    async def astream(self, _state, _config):
+    async def astream(self, _state, config, stream_mode="updates"):
+        assert stream_mode == "values"
+        self.config = config
         for update in self._updates:
             yield update
+        if self._error is not None:
+            raise self._error
 
 
 def _make_controller():
@@ -87,8 +100,8 @@ async def test_execute_workflow_returns_final_state():
     workflow_id = "wf-123"
 
     updates = [
-        {"tier_1_requirements": _state_with_budget(workflow_id, 10)},
-        {"tier_2_planner": _state_with_budget(workflow_id, 5)},
+        _state_with_budget(workflow_id, 10),
+        _state_with_budget(workflow_id, 5),
     ]
     controller.graph = AsyncGraph(updates)
 
@@ -99,34 +112,35 @@ async def test_execute_workflow_returns_final_state():
 
 
 @pytest.mark.asyncio
-async def test_execute_workflow_budget_exhausted():
-    """Raise when budget is exhausted."""
-    controller = _make_controller()
-    workflow_id = "wf-999"
+async def test_budget_check_node_raises_when_exhausted():
+    """Budget check node passes with tokens left and raises once exhausted."""
+    budget_check = _make_budget_check(1000)
 
-    updates = [{"tier_1_requirements": _state_with_budget(workflow_id, 0)}]
-    controller.graph = AsyncGraph(updates)
+    assert await budget_check(_state_with_budget("wf-999", 10)) == {}
+    with pytest.raises(BudgetExhaustedError) as exc_info:
+        await budget_check(_state_with_budget("wf-999", 0))
 
-    with pytest.raises(BudgetExhaustedError):
-        await controller.execute_workflow("Do work", workflow_id)
+    assert exc_info.value.limit == 1000
 
 
 @pytest.mark.asyncio
 async def test_execute_workflow_infinite_loop():
-    """Raise when iteration limit is exceeded."""
+    """Raise when the graph hits its recursion limit."""
     controller = _make_controller()
     controller.max_iterations = 1
     workflow_id = "wf-loop"
 
-    updates = [
-        {"tier_1_requirements": _state_with_budget(workflow_id, 10)},
-        {"tier_2_planner": _state_with_budget(workflow_id, 10)},
-    ]
-    controller.graph = AsyncGraph(updates)
+    graph = AsyncGraph(
+        [_state_with_budget(workflow_id, 10)],
+        error=GraphRecursionError("Recursion limit of 1 reached"),
+    )
+    controller.graph = graph
 
     with pytest.raises(InfiniteLoopDetectedError):
         await controller.execute_workflow("Do work", workflow_id)
 
+    assert graph.config["recursion_limit"] == 1
+
 
 @pytest.mark.asyncio
 async def test_tier_nodes_update_state():
@@ -141,21 +155,30 @@ async def test_tier_nodes_update_state():
     state = await controller._tier_3_engineer(state)
     assert state["current_agent"] == "SoftwareEngineer"
     assert state["current_phase"] == "development"
+    assert state["current_agent"] is AGENT_ENGINEER
+    assert state["current_phase"] is PHASE_DEVELOPMENT
 
     state = await controller._tier_5_deployment(state)
     assert state["current_agent"] == "DeploymentAgent"
     assert state["current_phase"] == "completed"
 
+    assert await controller._tier_1_architect(state) == {
+        "current_agent": "SolutionArchitect"
+    }
 
-def test_routing_functions():
+
+@pytest.mark.asyncio
+async def test_routing_functions():
     """Routing respects blocking issues and escalation rules."""
     controller = _make_controller()
     state = _state_with_budget("wf-1", 10)
 
-    assert controller._route_validator_output(state) == "tier_1_architect"
+    command = await controller._tier_1_validator(state)
+    assert command.goto == "tier_1_architect"
+    assert command.update == {"current_agent": "StrategyValidator"}
 
     state["blocking_issues"] = ["issue"]
-    assert controller._route_validator_output(state) == "tier_0_deviation"
+    assert (await controller._tier_1_validator(state)).goto == "tier_0_deviation"
 
     state["blocking_issues"] = []
     assert controller._route_deviation_output(state) == "tier_1_requirements"
@@ -166,3 +189,90 @@ def test_routing_functions():
     state["escalation_flag"] = False
     state["rejection_count"] = 3
     assert controller._route_deviation_output(state) == END
+
+
+@pytest.mark.parametrize(
+    ("target_agent", "expected"),
+    [
+        ("tier_3_engineer", "tier_3_engineer"),
+        ("tier_4_security", "tier_4_security"),
+        ("tier_3_enginer", "tier_1_requirements"),
+        (None, "tier_1_requirements"),
+    ],
+)
+def test_route_deviation_output_validates_target(target_agent, expected):
+    """Deviation routing only returns known targets."""
+    state = _state_with_budget("wf-1", 10)
+    state["routing_decision"] = {"target_agent": target_agent}
+
+    assert _make_controller()._route_deviation_output(state) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("node_name", "pass_target"),
+    [
+        ("_tier_1_validator", "tier_1_architect"),
+        ("_tier_2_dependencies", "tier_3_budget_check"),
+        ("_tier_3_join", "tier_4_budget_check"),
+        ("_tier_4_join", "tier_5_budget_check"),
+    ],
+)
+async def test_blocking_nodes_route_with_command(node_name, pass_target):
+    """Routing nodes divert to the deviation handler only on issues."""
+    node = getattr(_make_controller(), node_name)
+    state = _state_with_budget("wf-1", 10)
+
+    assert (await node(state)).goto == pass_target
+
+    state["blocking_issues"] = ["issue"]
+    assert (await node(state)).goto == "tier_0_deviation"
+
+
+@pytest.mark.asyncio
+async def test_graph_runs_independent_tier_nodes_in_parallel():
+    """Tier 3-5 sibling nodes share a step and meet again at join nodes."""
+    controller = _make_controller()
+    controller.checkpointer = None
+    graph = controller.build_graph()
+
+    steps: dict[int, set[str]] = {}
+    async for event in graph.astream(
+        create_initial_state("wf-1", "Do work", "trace-1"),
+        {"configurable": {}},
+        stream_mode="debug",
+    ):
+        if event["type"] == "task":
+            steps.setdefault(event["step"], set()).add(event["payload"]["name"])
+    final_state = await graph.ainvoke(
+        create_initial_state("wf-1", "Do work", "trace-1"), {"configurable": {}}
+    )
+
+    assert {"tier_3_static_analysis", "tier_3_quality"} in steps.values()
+    assert {"tier_4_security", "tier_4_product"} in steps.values()
+    assert {"tier_5_docs", "tier_5_deployment"} in steps.values()
+    assert steps[max(steps)] == {"tier_5_join"}
+    assert final_state["current_phase"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_deviation_handler_clears_blocking_issues():
+    """Handled issues are cleared so the workflow moves past the gate."""
+    controller = _make_controller()
+    controller.checkpointer = None
+    graph = controller.build_graph()
+    state = create_initial_state("wf-1", "Do work", "trace-1")
+    state["blocking_issues"] = ["missing acceptance criteria"]
+
+    visited = [
+        event["payload"]["name"]
+        async for event in graph.astream(
+            state, {"recursion_limit": 50}, stream_mode="debug"
+        )
+        if event["type"] == "task"
+    ]
+    final_state = await graph.ainvoke(state, {"recursion_limit": 50})
+
+    assert visited.count("tier_0_deviation") == 1
+    assert final_state["blocking_issues"] == []
+    assert final_state["current_phase"] == "completed"
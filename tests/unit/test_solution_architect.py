@@ -68,7 +68,8 @@ def mock_budget_guard() -> MagicMock:
     """Create mock budget guard."""
     guard = MagicMock(spec=BudgetGuard)
     guard.reserve_budget = MagicMock()
-    guard.record_usage = MagicMock()
+    guard.refresh_monthly_usage = AsyncMock()
+    guard.record_usage_async = AsyncMock()
     return guard
 
 
@@ -347,7 +348,7 @@ class TestSolutionArchitectAgentExecution:
         # Assert
         mock_budget_guard.reserve_budget.assert_called_once()
         mock_llm_client.generate.assert_called_once()
-        mock_budget_guard.record_usage.assert_called_once()
+        mock_budget_guard.record_usage_async.assert_called_once()
         assert result_state["current_agent"] == "SolutionArchitectAgent"
         assert result_state["state_version"] == 2
 
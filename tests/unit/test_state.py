@@ -1,9 +1,20 @@
 """Unit tests for workflow state management."""
 
+import pytest
+
 from src.orchestration.state import (
+    BudgetAccumulator,
+    ResetList,
+    WorkflowState,
+    as_api_dict,
     create_initial_state,
     increment_rejection_count,
+    keep_last,
+    merge_token_usage,
+    merge_unique,
+    parse_timestamp_ns,
     update_budget,
+    upgrade_timestamps,
 )
 
 
@@ -25,6 +36,13 @@ def test_create_initial_state() -> None:
     assert state["code_files"] == {}
 
 
+def test_create_initial_state_omits_not_required_fields() -> None:
+    """Test initial state holds exactly the required keys."""
+    state = create_initial_state("id", "req", "trace")
+
+    assert set(state) == WorkflowState.__required_keys__
+
+
 def test_increment_rejection_count() -> None:
     """Test rejection count increment."""
     state = create_initial_state("id", "req", "trace")
@@ -34,7 +52,8 @@ def test_increment_rejection_count() -> None:
 
     assert new_state["rejection_count"] == 1
     assert new_state["state_version"] == initial_version + 1
-    assert new_state["workflow_id"] == state["workflow_id"]  # Preserves other fields
+    # Only the changed keys are returned
+    assert set(new_state) == {"rejection_count", "state_version", "updated_at_ns"}
 
 
 def test_update_budget() -> None:
@@ -55,3 +74,92 @@ def test_update_budget() -> None:
     assert new_state["budget_remaining_usd"] == initial_usd - cost
     assert new_state["agent_token_usage"][agent] == tokens_used
     assert new_state["state_version"] == state["state_version"] + 1
+
+
+def test_update_budget_returns_only_agent_delta() -> None:
+    """Test token usage update names only the agent that consumed tokens."""
+    state = create_initial_state("id", "req", "trace")
+    state["agent_token_usage"] = {"Planner": 50, "TestAgent": 100}
+
+    update = update_budget(state, 25, 0.01, "TestAgent")
+
+    assert "workflow_id" not in update
+    assert update["agent_token_usage"] == {"TestAgent": 125}
+    merged = merge_token_usage(state["agent_token_usage"], update["agent_token_usage"])
+    assert merged == {"Planner": 50, "TestAgent": 125}
+    assert state["agent_token_usage"] == {"Planner": 50, "TestAgent": 100}
+
+
+@pytest.mark.asyncio
+async def test_budget_accumulator_emits_single_update() -> None:
+    """Test several LLM calls produce one combined budget update."""
+    state = create_initial_state("id", "req", "trace")
+    state["agent_token_usage"] = {"TestAgent": 100}
+
+    async with BudgetAccumulator(state, "TestAgent") as acc:
+        acc.add(10, 0.01)
+        acc.add(15, 0.02)
+
+    update = acc.finalize()
+
+    assert update == {
+        **update_budget(state, 25, acc.total_cost_usd, "TestAgent"),
+        "updated_at_ns": update["updated_at_ns"],
+    }
+    assert update["agent_token_usage"] == {"TestAgent": 125}
+    assert update["state_version"] == state["state_version"] + 1
+
+
+def test_budget_accumulator_without_calls_is_empty() -> None:
+    """Test a node that made no LLM calls leaves the budget untouched."""
+    state = create_initial_state("id", "req", "trace")
+
+    assert BudgetAccumulator(state, "TestAgent").finalize() == {}
+
+
+def test_parallel_channel_reducers() -> None:
+    """Test reducers that accept writes from parallel nodes."""
+    assert merge_unique(["a"], ["b", "a"]) == ["a", "b"]
+    assert merge_unique(["a", "b"], ["a", "b"]) == ["a", "b"]
+    assert merge_unique(["tier_1_planning"], []) == ["tier_1_planning"]
+    assert merge_unique(["a", "b"], ResetList()) == []
+    assert type(merge_unique(["a"], ResetList(["c"]))) is list
+    assert keep_last("planning", "development") == "development"
+
+
+def test_timestamps_formatted_only_for_output() -> None:
+    """Test state keeps integer timestamps and formats them on egress."""
+    state = create_initial_state("id", "req", "trace")
+    state["created_at_ns"] = 1_767_225_600_000_000_000  # 2026-01-01T00:00:00Z
+
+    api_state = as_api_dict(state)
+
+    assert "created_at" not in state
+    assert isinstance(state["updated_at_ns"], int)
+    assert api_state["created_at"] == "2026-01-01T00:00:00+00:00"
+    assert api_state["workflow_id"] == "id"
+
+
+def test_parse_timestamp_ns_treats_naive_values_as_utc() -> None:
+    """Test ISO parsing matches the integer timestamps written today."""
+    expected = 1_767_225_600_000_000_000
+    assert parse_timestamp_ns("2026-01-01T00:00:00+00:00") == expected
+    assert parse_timestamp_ns("2026-01-01T00:00:00") == expected
+    assert parse_timestamp_ns("2026-01-01T01:00:00+01:00") == expected
+
+
+def test_legacy_state_timestamps() -> None:
+    """Test states with only ISO timestamps are upgraded and still render."""
+    legacy: WorkflowState = {  # type: ignore[typeddict-item]
+        "workflow_id": "id",
+        "created_at": "2026-01-01T00:00:00+00:00",
+    }
+
+    assert as_api_dict(legacy)["created_at"] == "2026-01-01T00:00:00+00:00"
+
+    upgraded = upgrade_timestamps(legacy)
+
+    assert upgraded is legacy
+    assert legacy["created_at_ns"] == 1_767_225_600_000_000_000
+    assert "updated_at_ns" not in legacy
+    assert as_api_dict(legacy)["created_at"] == "2026-01-01T00:00:00+00:00"
@@ -44,7 +44,8 @@ def mock_budget_guard():
     """Mock budget guard for testing."""
     guard = MagicMock()
     guard.reserve_budget = MagicMock()
-    guard.record_usage = MagicMock()
+    guard.refresh_monthly_usage = AsyncMock()
+    guard.record_usage_async = AsyncMock()
     return guard
 
 
@@ -100,7 +100,8 @@ def mock_budget_guard() -> MagicMock:
     """Create mock budget guard."""
     guard = MagicMock(spec=BudgetGuard)
     guard.reserve_budget = MagicMock()
-    guard.record_usage = MagicMock()
+    guard.refresh_monthly_usage = AsyncMock()
+    guard.record_usage_async = AsyncMock()
     return guard
 
 